@@ -2,12 +2,26 @@
 
 from __future__ import with_statement
 
+import atexit
 import collections
+import gc
+import json
+import math
+import optparse
 import os
+import platform
+import shutil
 import sys
+import tempfile
 import timeit
+import traceback
 import warnings
 
+try:
+    import tracemalloc
+except ImportError:
+    tracemalloc = None
+
 
 BlogEntry = collections.namedtuple('BlogEntry', 'title url html_body')
 
@@ -19,16 +33,40 @@ ENTRIES = [
 ]
 ENTRIES *= 10  # to give the render test a bit more to chew on
 
+# defaults for the --suite sweeps
+SIZES = [10, 100, 1000, 10000, 100000]
+DEPTHS = [1, 2, 4, 8, 16]
+COUNTS = [1, 10, 100, 1000]
+
 
 def rel_dir(dirname):
     """Return full directory name of dirname from this file's directory."""
     return os.path.abspath(os.path.join(os.path.dirname(__file__), dirname))
 
 
+def make_entries(num_entries):
+    """Return list of num_entries blog entries, repeating the ENTRIES."""
+    return (ENTRIES * (num_entries // len(ENTRIES) + 1))[:num_entries]
+
+
+_temp_dir = None
+
+def temp_dir(name):
+    """Return full name of a new directory starting with name in a temporary
+    directory that's deleted when the script exits.
+    """
+    global _temp_dir
+    if _temp_dir is None:
+        _temp_dir = tempfile.mkdtemp(prefix='symplate_bench_')
+        atexit.register(shutil.rmtree, _temp_dir, True)
+    return tempfile.mkdtemp(prefix=name + '_', dir=_temp_dir)
+
+
 class TemplateLanguage(object):
     num_compiles = 10
     num_renders = 100
     version = ''
+    entries = ENTRIES
 
     def setup_compile(self):
         pass
@@ -49,6 +87,13 @@ class TemplateLanguage(object):
         render_time = min(timeit.repeat(self.render, number=self.num_renders)) / float(self.num_renders)
         return (compile_time, render_time, self.version)
 
+    def cold_render(self):
+        """Render for the first time in a new instance, including compiling
+        and loading the templates.
+        """
+        self.setup_render()
+        return self.render()
+
 
 try:
     sys.path.insert(0, os.path.join(os.path.dirname(__file__), '..'))
@@ -68,7 +113,14 @@ if symplate:
                 self.renderer.compile(name)
 
         def render(self):
-            return self.renderer.render('main', title=TITLE, entries=ENTRIES)
+            return self.renderer.render('main', title=TITLE, entries=self.entries)
+
+        def cold_render(self):
+            # compile to a new output directory, so nothing's been compiled
+            # or imported yet
+            self.renderer = symplate.Renderer(
+                    rel_dir('symplate'), output_dir=temp_dir('symplouts'))
+            return self.render()
 
 
 try:
@@ -101,7 +153,7 @@ if cheetah:
             self.template = cheetah.Template.compile(file=file_name, cacheCompilationResults=True, useCache=True)
 
         def render(self):
-            params = {'title': TITLE, 'entries': ENTRIES, 'template_dir': self.template_dir}
+            params = {'title': TITLE, 'entries': self.entries, 'template_dir': self.template_dir}
             return self.template(searchList=[params], filter=cheetah_websafe).respond()
 
 
@@ -129,7 +181,7 @@ if jinja2:
             self.template = self.render_env.get_template('main.tmpl')
 
         def render(self):
-            return self.template.render(title=TITLE, entries=ENTRIES)
+            return self.template.render(title=TITLE, entries=self.entries)
 
 
 try:
@@ -160,7 +212,7 @@ if mako:
             self.template = self.render_lookup.get_template('main.tmpl')
 
         def render(self):
-            return self.template.render(title=TITLE, entries=ENTRIES)
+            return self.template.render(title=TITLE, entries=self.entries)
 
 
 try:
@@ -195,7 +247,7 @@ if wheezy:
             self.template = self.engine.get_template('main.tmpl')
 
         def render(self):
-            return self.template.render({'title': TITLE, 'entries': ENTRIES})
+            return self.template.render({'title': TITLE, 'entries': self.entries})
 
 
 try:
@@ -218,7 +270,7 @@ if django:
             self.template = django.template.loader.get_template('main.tmpl')
 
         def render(self):
-            params = {'title': TITLE, 'entries': ENTRIES}
+            params = {'title': TITLE, 'entries': self.entries}
             return self.template.render(django.template.Context(params))
 
 
@@ -243,7 +295,7 @@ if bottle:
             self.template = bottle.SimpleTemplate(name='main.tmpl', lookup=self.lookup)
 
         def render(self):
-            return self.template.render(title=TITLE, entries=ENTRIES)
+            return self.template.render(title=TITLE, entries=self.entries)
 
 
 def hand_coded_filter(s):
@@ -271,7 +323,9 @@ class HandCoded(TemplateLanguage):
     def footer(self):
         return u'\n</body>\n</html>'
 
-    def render(self, title=TITLE, entries=ENTRIES):
+    def render(self, title=TITLE, entries=None):
+        if entries is None:
+            entries = self.entries
         filt = hand_coded_filter
         _output = []
         _write = _output.append
@@ -302,12 +356,337 @@ class HandCoded(TemplateLanguage):
 
         return u''.join(_output)
 
-def main():
-    language_classes = [(name, cls) for name, cls in globals().items()
-                        if isinstance(cls, type) and
-                           issubclass(cls, TemplateLanguage) and
-                           cls is not TemplateLanguage]
-
+def percentile(times, percent):
+    """Return given percentile of sorted list of times, interpolating
+    between the two closest ranks.
+    """
+    rank = (len(times) - 1) * percent / 100.0
+    lower = int(math.floor(rank))
+    upper = min(lower + 1, len(times) - 1)
+    return times[lower] + (times[upper] - times[lower]) * (rank - lower)
+
+
+def summarize(times):
+    """Return dict of statistics for list of times in seconds."""
+    times = sorted(times)
+    return {
+        'n': len(times),
+        'min': times[0],
+        'mean': sum(times) / len(times),
+        'p50': percentile(times, 50),
+        'p90': percentile(times, 90),
+        'p99': percentile(times, 99),
+        'max': times[-1],
+    }
+
+
+def time_calls(func, min_calls=5, max_calls=1000, max_seconds=1.0):
+    """Call func repeatedly and return list of the time each call took.
+    Make at least min_calls and at most max_calls calls, stopping after
+    max_seconds if min_calls have been made. Like timeit, disable garbage
+    collection while timing.
+    """
+    timer = timeit.default_timer
+    times = []
+    gc_enabled = gc.isenabled()
+    gc.disable()
+    try:
+        start = timer()
+        while len(times) < max_calls:
+            call_start = timer()
+            func()
+            call_end = timer()
+            times.append(call_end - call_start)
+            if len(times) >= min_calls and call_end - start >= max_seconds:
+                break
+    finally:
+        if gc_enabled:
+            gc.enable()
+    return times
+
+
+def memory_method():
+    """Return name of the method measure_memory() uses, or None if it can't
+    measure memory on this platform.
+    """
+    if tracemalloc is not None:
+        return 'tracemalloc'
+    if hasattr(os, 'fork') and hasattr(os, 'wait4'):
+        return 'maxrss'
+    return None
+
+
+def measure_memory(func):
+    """Call func once and return the peak memory used during the call in
+    bytes, or None if it can't be measured. With tracemalloc (Python 3.4+)
+    this is the peak memory allocated. Otherwise func is called in a forked
+    child process and this is the child's peak RSS, which covers just this
+    benchmark (unlike this process's peak RSS), though it includes the
+    memory the child starts with.
+    """
+    method = memory_method()
+    if method == 'tracemalloc':
+        tracemalloc.start()
+        try:
+            func()
+            return tracemalloc.get_traced_memory()[1]
+        finally:
+            tracemalloc.stop()
+    if method is None:
+        return None
+
+    sys.stdout.flush()
+    sys.stderr.flush()
+    pid = os.fork()
+    if pid == 0:
+        status = 0
+        try:
+            func()
+        except BaseException:
+            traceback.print_exc()
+            status = 1
+        sys.stderr.flush()
+        # skip atexit handlers, which would remove the parent's temp dirs
+        os._exit(status)
+    _, status, rusage = os.wait4(pid, 0)
+    if status != 0:
+        return None
+    # ru_maxrss is in bytes on macOS, but kilobytes elsewhere
+    return rusage.ru_maxrss * (1 if sys.platform == 'darwin' else 1024)
+
+
+def measure(benchmark, engine, param, setup, warm, cold, options):
+    """Run one suite benchmark and return its result dict. setup() is called
+    once before timing warm(), which is called repeatedly; cold() is called
+    options.cold_trials times, and should do the work of a first render in
+    a new process.
+    """
+    setup()
+    warm()
+    warm_times = time_calls(warm, max_calls=options.num_renders,
+                            max_seconds=options.max_seconds)
+    peak_memory = measure_memory(warm)
+    cold_times = time_calls(cold, min_calls=options.cold_trials,
+                            max_calls=options.cold_trials)
+    result = {
+        'key': '%s/%s/%s' % (benchmark, engine, param),
+        'benchmark': benchmark,
+        'engine': engine,
+        'param': param,
+        'warm': summarize(warm_times),
+        'cold': summarize(cold_times),
+        'peak_memory': peak_memory,
+    }
+    # progress goes to stderr so "--json -" output on stdout stays parseable
+    sys.stderr.write(
+        '%-30s warm p50 %9.3fms p99 %9.3fms  cold p50 %9.3fms  mem %s\n' % (
+            result['key'], result['warm']['p50'] * 1000,
+            result['warm']['p99'] * 1000, result['cold']['p50'] * 1000,
+            '-' if peak_memory is None else
+            '%.1fKB' % (peak_memory / 1024.0)))
+    return result
+
+
+def run_size_benchmarks(language_classes, sizes, options):
+    """Benchmark each engine rendering the blog page with each number of
+    entries in sizes, and return list of result dicts.
+    """
+    results = []
+    for size in sizes:
+        entries = make_entries(size)
+        for name, cls in language_classes:
+            language = cls()
+            language.entries = entries
+
+            def cold():
+                cold_language = cls()
+                cold_language.entries = entries
+                cold_language.cold_render()
+
+            results.append(measure('size', name, size, language.setup_render,
+                                   language.render, cold, options))
+    return results
+
+
+def write_templates(template_dir, templates):
+    """Write dict of template name to source to files in template_dir."""
+    for name, source in templates.items():
+        with open(os.path.join(template_dir, name + '.symp'), 'w') as f:
+            f.write(source)
+
+
+def run_depth_benchmarks(depths, options):
+    """Benchmark Symplate rendering sub-templates nested each number of
+    levels deep in depths, and return list of result dicts.
+    """
+    results = []
+    entries = make_entries(100)
+    for depth in depths:
+        template_dir = temp_dir('symplates')
+        templates = {}
+        for level in range(depth - 1):
+            templates['nest%d' % level] = (
+                    "{%% template entries %%}<div class=\"level%d\">\n"
+                    "{{ !render('nest%d', entries) }}</div>\n" % (level, level + 1))
+        templates['nest%d' % (depth - 1)] = (
+                "{% template entries %}{% for entry in entries: %}"
+                "<h2>{{ entry.title }}</h2>\n{% end for %}")
+        write_templates(template_dir, templates)
+        renderer = symplate.Renderer(template_dir, output_dir=temp_dir('symplouts'))
+
+        def warm():
+            renderer.render('nest0', entries)
+
+        def cold():
+            cold_renderer = symplate.Renderer(template_dir, output_dir=temp_dir('symplouts'))
+            cold_renderer.render('nest0', entries)
+
+        results.append(measure('depth', 'Symplate', depth, lambda: None,
+                               warm, cold, options))
+    return results
+
+
+def run_count_benchmarks(counts, options):
+    """Benchmark Symplate with each number of distinct templates in counts,
+    rendering each template once per call, and return list of result dicts.
+    Cold times include compiling and importing all the templates.
+    """
+    results = []
+    entries = make_entries(10)
+    for count in counts:
+        template_dir = temp_dir('symplates')
+        names = ['page%d' % i for i in range(count)]
+        write_templates(template_dir, dict(
+                (name, '{%% template title, entries %%}<h1>{{ title }}</h1>\n'
+                       '{%% for entry in entries: %%}'
+                       '<p>%d: {{ entry.title }}</p>\n{%% end for %%}' % i)
+                for i, name in enumerate(names)))
+        renderer = symplate.Renderer(template_dir, output_dir=temp_dir('symplouts'))
+
+        def render_all(renderer):
+            for name in names:
+                renderer.render(name, TITLE, entries)
+
+        def cold():
+            render_all(symplate.Renderer(template_dir, output_dir=temp_dir('symplouts')))
+
+        results.append(measure('count', 'Symplate', count, lambda: None,
+                               lambda: render_all(renderer), cold, options))
+    return results
+
+
+def run_suite(language_classes, options):
+    """Run the scaling benchmark suite and return dict of its results."""
+    def parse_ints(value):
+        return [int(x) for x in value.split(',')]
+    sizes = parse_ints(options.sizes)
+    depths = parse_ints(options.depths)
+    counts = parse_ints(options.counts)
+
+    results = run_size_benchmarks(language_classes, sizes, options)
+    if symplate and any(name == 'Symplate' for name, cls in language_classes):
+        results.extend(run_depth_benchmarks(depths, options))
+        results.extend(run_count_benchmarks(counts, options))
+
+    return {
+        'python': platform.python_version(),
+        'implementation': platform.python_implementation(),
+        'platform': platform.platform(),
+        'versions': dict((name, cls.version) for name, cls in language_classes),
+        'memory_method': memory_method(),
+        'results': results,
+    }
+
+
+def run_trials(language_classes, trials):
+    """Time compiling and rendering with each engine in trials batches, and
+    return dict of metric name ("Engine/compile" or "Engine/render") to list
+    of the mean time per call in each batch.
+    """
+    samples = {}
+    for name, cls in language_classes:
+        language = cls()
+        language.setup_compile()
+        samples[name + '/compile'] = [
+                t / language.num_compiles for t in timeit.repeat(
+                    language.compile, number=language.num_compiles, repeat=trials)]
+        language.setup_render()
+        samples[name + '/render'] = [
+                t / language.num_renders for t in timeit.repeat(
+                    language.render, number=language.num_renders, repeat=trials)]
+    return samples
+
+
+def mann_whitney_p(baseline, current):
+    """Return the one-sided p-value for current's times being larger than
+    baseline's, using the Mann-Whitney U test with the normal approximation
+    (corrected for ties and continuity). Unlike a t-test, this doesn't assume
+    the times are normally distributed, and it isn't thrown by outliers.
+    """
+    n1 = len(baseline)
+    n2 = len(current)
+    n = n1 + n2
+    combined = sorted([(t, 0) for t in baseline] + [(t, 1) for t in current])
+
+    # sum the ranks of current's times, giving tied times their mean rank
+    current_rank_sum = 0.0
+    tie_sum = 0
+    i = 0
+    while i < n:
+        j = i
+        while j + 1 < n and combined[j + 1][0] == combined[i][0]:
+            j += 1
+        rank = (i + j) / 2.0 + 1
+        current_rank_sum += rank * sum(group for t, group in combined[i:j + 1])
+        ties = j - i + 1
+        tie_sum += ties ** 3 - ties
+        i = j + 1
+
+    u = current_rank_sum - n2 * (n2 + 1) / 2.0
+    variance = n1 * n2 / 12.0 * ((n + 1) - tie_sum / float(n * (n - 1)))
+    if variance <= 0:
+        # all times are equal
+        return 0.5
+    z = (u - n1 * n2 / 2.0 - 0.5) / math.sqrt(variance)
+    return 0.5 * math.erfc(z / math.sqrt(2))
+
+
+def median(times):
+    """Return median of list of times."""
+    return percentile(sorted(times), 50)
+
+
+def compare_baseline(baseline, samples, threshold, alpha):
+    """Compare samples dict from run_trials() against baseline's, print a
+    table of the results, and return list of the metrics that regressed:
+    those whose median is more than threshold percent slower than the
+    baseline's, where the slowdown is significant at the alpha level.
+    """
+    regressions = []
+    print 'metric                  baseline    current   change        p'
+    print '-------------------------------------------------------------'
+    for metric in sorted(samples):
+        if metric not in baseline['samples']:
+            print '%-22s  not in baseline' % metric
+            continue
+        base_times = baseline['samples'][metric]
+        times = samples[metric]
+        base_median = median(base_times)
+        change = (median(times) / base_median - 1) * 100
+        p = mann_whitney_p(base_times, times)
+        regressed = change > threshold and p < alpha
+        if regressed:
+            regressions.append(metric)
+        print '%-22s %8.3fms %8.3fms %+7.1f%% %8.4f%s' % (
+            metric, base_median * 1000, median(times) * 1000, change, p,
+            '  REGRESSION' if regressed else '')
+    return regressions
+
+
+def run_table(language_classes):
+    """Run the compile and render benchmarks for each engine and print a
+    table of their times, normalized to the HandCoded render time.
+    """
     results = {}
     output = None
     for name, cls in language_classes:
@@ -337,5 +716,96 @@ def main():
             name_version, compile_time / norm_time, render_time / norm_time)
 
 
+def main():
+    parser = optparse.OptionParser(usage='%prog [options]')
+    parser.add_option('-s', '--suite', action='store_true',
+                      help='run the scaling suite (data sizes, sub-template '
+                           'depth, and template count) instead of printing '
+                           'the compile/render table')
+    parser.add_option('-e', '--engines',
+                      help='comma-separated engines to benchmark, default all '
+                           'that are installed')
+    parser.add_option('--sizes', default=','.join(str(x) for x in SIZES),
+                      help='suite: numbers of blog entries, default %default')
+    parser.add_option('--depths', default=','.join(str(x) for x in DEPTHS),
+                      help='suite: sub-template nesting depths, default '
+                           '%default')
+    parser.add_option('--counts', default=','.join(str(x) for x in COUNTS),
+                      help='suite: numbers of templates, default %default')
+    parser.add_option('-n', '--num-renders', type='int', default=1000,
+                      help='suite: maximum renders to time per benchmark, '
+                           'default %default')
+    parser.add_option('-t', '--max-seconds', type='float', default=1.0,
+                      help='suite: stop timing renders after this many '
+                           'seconds (once 5 are done), default %default')
+    parser.add_option('-c', '--cold-trials', type='int', default=5,
+                      help='suite: number of cold renders to time, default '
+                           '%default')
+    parser.add_option('-j', '--json', metavar='FILE',
+                      help='suite: write results as JSON to FILE ("-" for '
+                           'stdout)')
+    parser.add_option('-b', '--save-baseline', metavar='FILE',
+                      help='time repeated compile and render trials and save '
+                           'them to baseline FILE')
+    parser.add_option('-r', '--compare', metavar='FILE',
+                      help='time repeated compile and render trials and '
+                           'compare them to baseline FILE, exiting with '
+                           'status 1 on a significant slowdown')
+    parser.add_option('--trials', type='int', default=20,
+                      help='baseline: number of trials, default %default')
+    parser.add_option('--threshold', type='float', default=5.0,
+                      help='baseline: percent slowdown in median time to '
+                           'treat as a regression, default %default')
+    parser.add_option('--alpha', type='float', default=0.01,
+                      help='baseline: significance level of the Mann-Whitney '
+                           'U test for a slowdown, default %default')
+    options, args = parser.parse_args()
+
+    language_classes = [(name, cls) for name, cls in globals().items()
+                        if isinstance(cls, type) and
+                           issubclass(cls, TemplateLanguage) and
+                           cls is not TemplateLanguage]
+    if options.engines:
+        engines = set(e.lower() for e in options.engines.split(','))
+        language_classes = [(name, cls) for name, cls in language_classes
+                            if name.lower() in engines]
+    language_classes.sort()
+
+    if options.save_baseline or options.compare:
+        samples = run_trials(language_classes, options.trials)
+        regressions = []
+        if options.compare:
+            with open(options.compare) as f:
+                baseline = json.load(f)
+            regressions = compare_baseline(baseline, samples,
+                                           options.threshold, options.alpha)
+        if options.save_baseline:
+            baseline = {
+                'python': platform.python_version(),
+                'platform': platform.platform(),
+                'versions': dict((name, cls.version)
+                                 for name, cls in language_classes),
+                'samples': samples,
+            }
+            with open(options.save_baseline, 'w') as f:
+                json.dump(baseline, f, indent=1, sort_keys=True)
+        if regressions:
+            print 'Regressions: %s' % ', '.join(regressions)
+            sys.exit(1)
+        return
+
+    if not options.suite:
+        run_table(language_classes)
+        return
+
+    suite = run_suite(language_classes, options)
+    if options.json == '-':
+        json.dump(suite, sys.stdout, indent=1, sort_keys=True)
+        print
+    elif options.json:
+        with open(options.json, 'w') as f:
+            json.dump(suite, f, indent=1, sort_keys=True)
+
+
 if __name__ == '__main__':
     main()
\ No newline at end of file
@@ -9,53 +9,385 @@ the full license text.
 
 from __future__ import with_statement
 
+import ast
+import bisect
+import collections
+import errno
+import gc
+import hashlib
+import imp
+import json
+import linecache
+import marshal
+import multiprocessing
 import os
+import re
 import sys
+import threading
+import time
+import tokenize
+import types
+
+try:
+    import fcntl
+except ImportError:
+    # not available on Windows, where compiles aren't locked across processes
+    fcntl = None
+
+try:
+    import pyinotify
+except ImportError:
+    pyinotify = None
 
 __version__ = '1.0'
 
+# matches render('name' or render("name" to find sub-template dependencies
+_RENDER_NAME_RE = re.compile(r'''\brender\(\s*(?:'([^'\\]*)'|"([^"\\]*)")''')
+
+# matches {% extends 'name' %} or {% extends "name" %} directive
+_EXTENDS_RE = re.compile(
+    r'''\{%\s*extends\s+(?:'([^'\\]*)'|"([^"\\]*)")\s*%\}''')
+
+# matches {% ... %} directive, with its code in group 1
+_DIRECTIVE_RE = re.compile(r'\{%(.*?)%\}', re.DOTALL)
+
+# match the code of {% block name %} and {% end block %} directives
+_BLOCK_RE = re.compile(r'block\s+(\w+)$')
+_END_BLOCK_RE = re.compile(r'end\s+block\b')
+
+# matches the start of a tag, with the name of an element whose contents
+# minify leaves alone (if it's one of those) in group 1
+_TAG_START_RE = re.compile(r'<(?:(pre|textarea|script)\b|[a-zA-Z/!?])',
+                           re.IGNORECASE)
+
+# matches the end of a tag or the start of a quoted attribute value in it
+_TAG_END_RE = re.compile(r'[>"\']')
+
+# matches a run of ASCII whitespace for minify to collapse
+_WHITESPACE_RE = re.compile(r'[ \t\n\r\f\v]+')
+
+# name of the manifest file compile_all() writes to output_dir
+MANIFEST_NAME = 'symplate_manifest.json'
+
+# negative lookahead for "=" or an augmented assignment operator after a
+# directive's keyword, so a variable of the same name can be assigned to
+_NOT_ASSIGNMENT = r'(?!(?:[-+*/%&|^]|<<|>>|\*\*|//)?=)'
+
+# matches {% cache ... %} directive, but not a "cache = ..." assignment
+_CACHE_DIRECTIVE_RE = re.compile(r'cache\s+' + _NOT_ASSIGNMENT)
+
+# matches code of {% extends ... %} directive, but not "extends = ..."
+_EXTENDS_DIRECTIVE_RE = re.compile(r'extends\s+' + _NOT_ASSIGNMENT)
+
+# matches "filt = expr" filter assignment, but not "filt == expr"
+_FILT_ASSIGN_RE = re.compile(r'filt\s*=(?!=)\s*(.*)$')
+
+# matches "# line: N" or "# line: filename:N" comment added to compiled code
+# when line_markers is on
+_LINE_MARKER_RE = re.compile(r'# line: (?:(.+):)?(\d+)$')
+
+
+# types whose unicode() never contains special HTML/XML chars
+_NUMBER_TYPES = frozenset([int, long, float, bool])
+
+
+def _escape_html(obj):
+    """Escape special HTML/XML chars in unicode string obj. Only do the
+    replaces for chars that are present, and if none are, return obj itself
+    (the common case). This is faster in CPython than a single pass with a
+    regex or unicode.translate().
+    """
+    if u'&' in obj:
+        obj = obj.replace(u'&', u'&amp;')
+    if u'<' in obj:
+        obj = obj.replace(u'<', u'&lt;')
+    if u'>' in obj:
+        obj = obj.replace(u'>', u'&gt;')
+    if u"'" in obj:
+        obj = obj.replace(u"'", u'&#39;')
+    if u'"' in obj:
+        obj = obj.replace(u'"', u'&#34;')
+    return obj
+
+
+def _wrap_escape(escape):
+    """Return version of C escaping function escape that behaves like
+    _escape_html: it returns obj itself if there's nothing to escape, and
+    otherwise a plain unicode string rather than whatever escape returns
+    (MarkupSafe's returns a markupsafe.Markup, whose methods escape their
+    arguments).
+    """
+    def escape_html(obj):
+        escaped = escape(obj)
+        if len(escaped) == len(obj):
+            return obj
+        # joining a single non-exact unicode string makes a plain copy
+        return u''.join((escaped,))
+    return escape_html
+
+# use MarkupSafe's C escaping function if it's installed -- it escapes the
+# same chars to the same entities in a single pass
+try:
+    from markupsafe._speedups import escape as _speedups_escape
+except ImportError:
+    pass
+else:
+    _escape_html = _wrap_escape(_speedups_escape)
+
+
+class Markup(unicode):
+    """Unicode string that's already safe HTML, which html_filter and
+    text_filter output as is. Renderer.render() returns a Markup string for
+    templates whose default filter is html_filter, so rendered sub-templates
+    aren't escaped twice.
+
+    Like MarkupSafe and other template languages, the filters support the
+    __html__ protocol: if an object has an __html__ method, they output the
+    result of calling it instead of the object itself.
+    """
+    __slots__ = ()
+
+    def __html__(self):
+        return self
+
+    def __repr__(self):
+        return 'symplate.Markup(%s)' % unicode.__repr__(self)
+
 
 def html_filter(obj):
     """Convert object to unicode and then escape special HTML/XML chars. If
     obj is None, return empty string. If obj is a byte string, convert from
-    UTF-8 first.
+    UTF-8 first. Numbers are converted but not escaped, and Markup strings
+    and objects with an __html__ method are output as per obj.__html__().
     """
-    if not isinstance(obj, unicode):
+    if type(obj) is not unicode:
         if obj is None:
             return u''
         if isinstance(obj, str):
             obj = unicode(obj, 'utf-8')
+        elif type(obj) in _NUMBER_TYPES:
+            return unicode(obj)
+        elif hasattr(obj, '__html__'):
+            return obj.__html__()
         else:
             obj = unicode(obj)
-    return (obj.replace(u'&', u'&amp;')
-               .replace(u'<', u'&lt;')
-               .replace(u'>', u'&gt;')
-               .replace(u"'", u'&#39;')
-               .replace(u'"', u'&#34;'))
+    return _escape_html(obj)
 
 
 def text_filter(obj):
     """Convert object to unicode but don't escape special chars. None/str
-    handling is the same as for html_filter.
+    and __html__ handling is the same as for html_filter.
     """
-    if not isinstance(obj, unicode):
+    if type(obj) is not unicode:
         if obj is None:
             return u''
         if isinstance(obj, str):
             obj = unicode(obj, 'utf-8')
+        elif hasattr(obj, '__html__'):
+            return obj.__html__()
         else:
             obj = unicode(obj)
     return obj
 
 
+def _escape_html_bytes(obj):
+    """Escape special HTML/XML chars in UTF-8 byte string obj, like
+    _escape_html(). The special chars are all ASCII, so they can be replaced
+    without decoding.
+    """
+    if '&' in obj:
+        obj = obj.replace('&', '&amp;')
+    if '<' in obj:
+        obj = obj.replace('<', '&lt;')
+    if '>' in obj:
+        obj = obj.replace('>', '&gt;')
+    if "'" in obj:
+        obj = obj.replace("'", '&#39;')
+    if '"' in obj:
+        obj = obj.replace('"', '&#34;')
+    return obj
+
+
+def _to_bytes(obj):
+    """Return raw output value obj encoded as UTF-8 if it's a unicode string,
+    otherwise return it as is (byte strings are assumed to be UTF-8).
+    """
+    if isinstance(obj, unicode):
+        return obj.encode('utf-8')
+    return obj
+
+
+def html_bytes_filter(obj):
+    """Like html_filter, but return the result as a UTF-8 byte string. This is
+    the default filter for templates compiled with bytes_output=True. Byte
+    strings are assumed to be UTF-8, and are escaped without decoding them.
+    """
+    if type(obj) is unicode:
+        return _escape_html(obj).encode('utf-8')
+    if obj is None:
+        return ''
+    if isinstance(obj, str):
+        return _escape_html_bytes(obj)
+    if type(obj) in _NUMBER_TYPES:
+        return str(obj)
+    if hasattr(obj, '__html__'):
+        return _to_bytes(obj.__html__())
+    return _escape_html(unicode(obj)).encode('utf-8')
+
+
+def text_bytes_filter(obj):
+    """Like text_filter, but return the result as a UTF-8 byte string."""
+    if type(obj) is unicode:
+        return obj.encode('utf-8')
+    if obj is None:
+        return ''
+    if isinstance(obj, str):
+        return obj
+    if hasattr(obj, '__html__'):
+        return _to_bytes(obj.__html__())
+    return unicode(obj).encode('utf-8')
+
+
+def _bytes_filter(filt):
+    """Return version of filter function filt that returns UTF-8 bytes, for
+    "filt = ..." assignments in templates compiled with bytes_output=True.
+    """
+    if filt is html_filter:
+        return html_bytes_filter
+    if filt is text_filter:
+        return text_bytes_filter
+
+    def filter_bytes(*args, **kwargs):
+        return _to_bytes(filt(*args, **kwargs))
+    return filter_bytes
+
+
+def _write_file_atomic(filename, data):
+    """Write data to filename via a temporary file in the same directory and
+    a rename, so that readers never see a partially-written file. The file
+    is created with the usual permissions (mkstemp would make it 0600).
+    """
+    temp_name = '%s.%d.%d.tmp' % (filename, os.getpid(),
+                                  threading.current_thread().ident)
+    flags = os.O_WRONLY | os.O_CREAT | os.O_TRUNC | getattr(os, 'O_BINARY', 0)
+    fd = os.open(temp_name, flags, 0666)
+    try:
+        with os.fdopen(fd, 'wb') as f:
+            f.write(data)
+        try:
+            os.rename(temp_name, filename)
+        except OSError:
+            # Windows won't rename over an existing file
+            os.remove(filename)
+            os.rename(temp_name, filename)
+    except:
+        if os.path.exists(temp_name):
+            os.remove(temp_name)
+        raise
+
+
+def _cache_args(prefix, key, ttl=None):
+    """Return (cache_key, ttl) tuple for a {% cache key[, ttl] %} directive.
+    prefix identifies the directive in its template.
+    """
+    return (prefix, key), ttl
+
+
+class LRUCache(object):
+    """Thread-safe in-process cache with least-recently-used eviction. This
+    is the default backend for {% cache %} fragments. It holds at most
+    max_entries values, and if max_size is not None, the total len() of the
+    values it holds is at most max_size.
+
+    It's also the default backend for Renderer.render_cached() results.
+
+    Other cache backends need only provide get(key), which returns the value
+    or None, and set(key, value, ttl). ttl is the time to live in seconds, or
+    None for no expiry.
+    """
+
+    def __init__(self, max_entries=1000, max_size=None):
+        self.max_entries = max_entries
+        self.max_size = max_size
+        self.hits = 0
+        self.misses = 0
+        self._entries = collections.OrderedDict()  # key -> (expires, value)
+        self._size = 0
+        self._lock = threading.Lock()
+
+    def __getstate__(self):
+        """Pickle just the cache's limits, not its lock or contents."""
+        return (self.max_entries, self.max_size)
+
+    def __setstate__(self, state):
+        self.__init__(*state)
+
+    def __len__(self):
+        return len(self._entries)
+
+    def get(self, key):
+        """Return value for key, or None if it isn't cached or has expired."""
+        with self._lock:
+            entry = self._entries.pop(key, None)
+            if entry is None:
+                self.misses += 1
+                return None
+            expires, value = entry
+            if expires is not None and time.time() >= expires:
+                self._size -= len(value)
+                self.misses += 1
+                return None
+            # re-insert to make it the most recently used
+            self._entries[key] = entry
+            self.hits += 1
+            return value
+
+    def set(self, key, value, ttl=None):
+        """Cache value for key, expiring after ttl seconds if not None."""
+        size = len(value)
+        if self.max_size is not None and size > self.max_size:
+            return
+        expires = time.time() + ttl if ttl is not None else None
+        with self._lock:
+            old_entry = self._entries.pop(key, None)
+            if old_entry is not None:
+                self._size -= len(old_entry[1])
+            self._entries[key] = (expires, value)
+            self._size += size
+            while (len(self._entries) > self.max_entries or
+                   self.max_size is not None and self._size > self.max_size):
+                old_key, (old_expires, old_value) = \
+                    self._entries.popitem(last=False)
+                self._size -= len(old_value)
+
+    def clear(self):
+        """Remove all entries and reset the hit and miss counters."""
+        with self._lock:
+            self._entries.clear()
+            self._size = 0
+            self.hits = 0
+            self.misses = 0
+
+
+def _remove_if_exists(filename):
+    """Remove given file, ignoring the error if it doesn't exist."""
+    try:
+        os.remove(filename)
+    except OSError:
+        pass
+
+
 class Error(Exception):
     """A Symplate template or syntax error."""
 
-    def __init__(self, msg, template, line_num):
+    def __init__(self, msg, template, line_num, filename=None):
         super(Error, self).__init__(msg, template, line_num)
         self.msg = msg
         self.template = template
         self.line_num = line_num
+        # template file the error is in, if it's not the one being compiled
+        # (for example, a template it extends)
+        self.filename = filename
         lines = template.splitlines()
         if 0 <= line_num - 1 < len(lines):
             self.line = lines[line_num - 1]
@@ -63,20 +395,274 @@ class Error(Exception):
             self.line = ''
 
     def __str__(self):
+        if self.filename:
+            return '%s, %s line %d: %s' % (self.msg, self.filename,
+                                           self.line_num, self.line.strip())
         return '%s, line %d: %s' % (self.msg, self.line_num, self.line.strip())
 
     def __repr__(self):
         return 'symplate.Error<%r>' % str(self)
 
 
+class CompileError(Exception):
+    """Raised by Renderer.compile_all() if any templates failed to compile.
+    errors is a list of (name, exception) tuples, one for each failure.
+    """
+
+    def __init__(self, errors):
+        lines = ['%d template(s) failed to compile' % len(errors)]
+        lines.extend('%s: %s' % (name, error) for name, error in errors)
+        super(CompileError, self).__init__('\n'.join(lines))
+        self.errors = errors
+
+
+# Renderer instance used by compile_all() worker processes
+_worker_renderer = None
+
+
+def _init_worker(renderer):
+    """Initialize a compile_all() or render_many() worker process."""
+    global _worker_renderer
+    _worker_renderer = renderer
+
+
+def _compile_in_worker(args):
+    """Compile a template in a compile_all() worker process and return tuple
+    of (name, exception), where exception is None if it compiled.
+    """
+    name, verbose = args
+    try:
+        _worker_renderer.compile(name, verbose=verbose)
+    except Exception, error:
+        return (name, error)
+    return (name, None)
+
+
+def _render_in_worker(args):
+    """Render a chunk of a render_many() batch in a worker process and return
+    list of the outputs.
+    """
+    name, arg_list = args
+    return _worker_renderer.render_many(name, arg_list)
+
+
+def _get_line_map(py_source, filename):
+    """Return dict mapping line numbers of compiled template source to
+    (filename, line_num) tuples of the template line they came from, using
+    the "# line: N" markers ("# line: filename:N" for lines from another
+    template file, such as one the template extends). Lines without a marker
+    map to the closest marked line above them from the same template.
+    """
+    line_map = {}
+    current = None
+    for py_line, line in enumerate(py_source.splitlines(), 1):
+        stripped = line.strip()
+        if stripped.startswith('# Inlined from: '):
+            filename = stripped[len('# Inlined from: '):]
+            current = None
+            continue
+        match = _LINE_MARKER_RE.search(line)
+        if match:
+            current = (match.group(1) or filename, int(match.group(2)))
+        if current is not None:
+            line_map[py_line] = current
+    return line_map
+
+
+def _lines_in_string(code):
+    """Return set of the indexes of the lines of code string (once they're
+    stripped, as they're compiled) that end inside a triple-quoted string,
+    where a "# line: N" comment would become part of the string.
+    """
+    if '"""' not in code and "'''" not in code:
+        return set()
+    lines = [line.strip() + '\n' for line in code.splitlines()]
+    in_string = set()
+    try:
+        for token in tokenize.generate_tokens(iter(lines).next):
+            if token[0] == tokenize.STRING:
+                in_string.update(range(token[2][0] - 1, token[3][0] - 1))
+    except (tokenize.TokenError, IndentationError):
+        # the Python compiler will report the error
+        pass
+    return in_string
+
+
+def _parse_blocks(template, filename=None):
+    """Parse the {% block name %} ... {% end block %} sections of template
+    source string into a tree. Return list of items, each either a source
+    string or a block tuple of (name, open_text, items, close_text, line_num,
+    start, end), where open_text and close_text are the block's directives,
+    and start and end are the positions in template of the block's contents.
+    Raise Error if the blocks aren't properly nested.
+    """
+    stack = [(None, '', [], '', 0, 0)]
+    pos = 0
+    for match in _DIRECTIVE_RE.finditer(template):
+        code = match.group(1).strip()
+        block_match = _BLOCK_RE.match(code)
+        if not block_match and not _END_BLOCK_RE.match(code):
+            continue
+        line_num = template.count('\n', 0, match.start()) + 1
+        stack[-1][2].append(template[pos:match.start()])
+        pos = match.end()
+        if block_match:
+            stack.append((block_match.group(1), match.group(0), [], '',
+                          line_num, match.end()))
+        else:
+            if len(stack) == 1:
+                raise Error('extra {% end block %}', template, line_num,
+                            filename)
+            name, open_text, items, _, block_line_num, start = stack.pop()
+            stack[-1][2].append((name, open_text, items, match.group(0),
+                                 block_line_num, start, match.start()))
+    if len(stack) > 1:
+        raise Error('no {% end block %} for block', template, stack[-1][4],
+                    filename)
+    stack[0][2].append(template[pos:])
+    return stack[0][2]
+
+
+def _join_segments(parts):
+    """Join list of (text, pos, segments) parts, where text is a copy of the
+    template source described by segments from position pos (see
+    Renderer._extend_template). Return tuple of (text, segments) for the
+    joined text.
+    """
+    texts = []
+    joined_segments = []
+    offset = 0
+    for text, pos, segments in parts:
+        if not text:
+            continue
+        end = pos + len(text)
+        for i, (start, filename, source, source_pos) in enumerate(segments):
+            next_start = segments[i + 1][0] if i + 1 < len(segments) else end
+            if next_start <= pos or start >= end:
+                continue
+            start_in_text = max(start, pos) - pos
+            source_pos += max(start, pos) - start
+            if joined_segments:
+                last = joined_segments[-1]
+                if (last[2] is source and
+                        last[3] + offset + start_in_text - last[0] ==
+                        source_pos):
+                    # continues the last segment, no need for a new one
+                    continue
+            joined_segments.append((offset + start_in_text, filename, source,
+                                    source_pos))
+        texts.append(text)
+        offset += len(text)
+    return (''.join(texts), joined_segments)
+
+
+def _next_segment(segments, segment_num, pos):
+    """If position pos of a template source is past the segment at index
+    segment_num of its segments (see Renderer._extend_template), return tuple
+    of (segment_num, filename, source, line_num) for the segment pos is in,
+    where line_num is its line number in source. Otherwise return None.
+    """
+    num = segment_num
+    while num + 1 < len(segments) and segments[num + 1][0] <= pos:
+        num += 1
+    if num == segment_num:
+        return None
+    start, filename, source, source_pos = segments[num]
+    line_num = source.count('\n', 0, source_pos + pos - start) + 1
+    return (num, filename, source, line_num)
+
+
+def _minify_html(text, state):
+    """Collapse each run of whitespace in literal template text between tags
+    to a single newline if it contains one, otherwise to a single space.
+    Tags (including their attribute values) and the contents of <pre>,
+    <textarea> and <script> elements are left alone.
+
+    state says where text starts: None if between tags, '<' if inside a
+    tag, '<"' or "<'" if inside a quoted attribute value, or the lowercase
+    name of the <pre>, <textarea> or <script> element it's inside. Return
+    tuple of (minified_text, state), where state says where text ends.
+    """
+    output = []
+    pos = 0
+    while pos < len(text):
+        if state is None:
+            match = _TAG_START_RE.search(text, pos)
+            end = match.start() if match else len(text)
+            output.append(_WHITESPACE_RE.sub(
+                lambda m: '\n' if '\n' in m.group(0) else ' ',
+                text[pos:end]))
+            if match:
+                state = (match.group(1) or '<').lower()
+            pos = end
+            continue
+        if state == '<':
+            match = _TAG_END_RE.search(text, pos)
+        elif state in ('<"', "<'"):
+            match = re.compile(state[1]).search(text, pos)
+        else:
+            match = re.compile(r'</%s\s*>' % state,
+                               re.IGNORECASE).search(text, pos)
+        end = match.end() if match else len(text)
+        output.append(text[pos:end])
+        if match:
+            if state == '<' and match.group(0) != '>':
+                state = '<' + match.group(0)
+            elif state in ('<"', "<'"):
+                state = '<'
+            else:
+                state = None
+        pos = end
+    return (''.join(output), state)
+
+
+def _escape_label(value):
+    """Escape string for use as a Prometheus label value."""
+    return (value.replace('\\', '\\\\').replace('"', '\\"')
+                 .replace('\n', '\\n'))
+
+
+class _PollingWatcher(threading.Thread):
+    """Thread that removes changed templates from a Renderer's module cache
+    by checking their modify times every interval seconds until stopped.
+    """
+
+    def __init__(self, renderer, interval):
+        threading.Thread.__init__(self, name='symplate-watcher')
+        self.daemon = True
+        self.renderer = renderer
+        self.interval = interval
+        self._stopped = threading.Event()
+
+    def run(self):
+        while not self._stopped.wait(self.interval):
+            self.renderer._remove_stale_modules()
+
+    def stop(self):
+        self._stopped.set()
+        self.join()
+
+
 class Renderer(object):
     """Symplate renderer class. Holds settings for rendering and caches
     compiled template modules.
     """
 
+    # number of output pieces render_iter() collects before yielding a chunk
+    stream_chunk_items = 256
+
+    # upper bounds in seconds of the render time histogram buckets recorded
+    # when instrument is True
+    stats_buckets = (0.0005, 0.001, 0.0025, 0.005, 0.01, 0.025, 0.05, 0.1,
+                     0.25, 0.5, 1.0, 2.5)
+
     def __init__(self, template_dir, output_dir=None, extension='.symp',
                  check_mtimes=False, auto_compile=True, modify_path=True,
-                 preamble='', default_filter='symplate.html_filter'):
+                 preamble='', default_filter='symplate.html_filter',
+                 in_memory=False, cache_dir=None, streaming=False,
+                 inline=False, fragment_cache=None, result_cache=None,
+                 check_interval=0, bundle=None, instrument=False,
+                 line_markers=False, bytes_output=False, minify=False):
         """Initialize a Renderer instance. See README.md for more info."""
         self.template_dir = os.path.abspath(template_dir)
         if output_dir is None:
@@ -88,12 +674,70 @@ class Renderer(object):
         self.auto_compile = auto_compile
         self.preamble = preamble
         self.default_filter = default_filter
-
+        self.in_memory = in_memory
+        self.cache_dir = cache_dir
+        self.streaming = streaming
+        self.inline = inline
+        if fragment_cache is None:
+            fragment_cache = LRUCache()
+        self.fragment_cache = fragment_cache
+        if result_cache is None:
+            result_cache = LRUCache()
+        self.result_cache = result_cache
+        self.check_interval = check_interval
+        self.bundle = bundle
+        self.instrument = instrument
+        self.line_markers = line_markers
+        self.bytes_output = bytes_output
+        self.minify = minify
+        self._path_dir = None  # directory added to sys.path, if any
+        if modify_path and not in_memory and cache_dir is None:
+            self._path_dir = os.path.abspath(os.path.join(output_dir, '..'))
+        self._init_state()
+
+    # attributes that aren't pickled, see __getstate__()
+    _unpickled = ('_module_cache', '_memory_modules', '_checked_modules',
+                  '_watcher', '_load_locks', '_load_locks_lock', '_bundle',
+                  '_stats', '_stats_lock', '_render_stack', 'render',
+                  'render_bytes')
+
+    def _init_state(self):
+        """Initialize the loaded templates, locks and stats of a new (or
+        newly unpickled) Renderer.
+        """
         self._module_cache = {}
-        if modify_path:
-            path_dir = os.path.abspath(os.path.join(output_dir, '..'))
-            if path_dir not in sys.path:
-                sys.path.insert(0, path_dir)
+        self._memory_modules = {}
+        self._checked_modules = {}  # name -> (time checked, module)
+        self._watcher = None
+        self._load_locks = {}  # name -> lock held while loading template
+        self._load_locks_lock = threading.Lock()
+        self._bundle = (self._read_bundle(self.bundle)
+                        if self.bundle is not None else {})
+        self._stats = {}  # name -> dict of stats, see _get_stats()
+        self._stats_lock = threading.Lock()
+        self._render_stack = threading.local()
+        if self.instrument:
+            # replace render() and render_bytes() for this instance only, so
+            # they cost nothing when instrument is off
+            self.render = self._render_instrumented
+            self.render_bytes = self._render_bytes_instrumented
+        if self._path_dir is not None and self._path_dir not in sys.path:
+            sys.path.insert(0, self._path_dir)
+
+    def __getstate__(self):
+        """Pickle just the Renderer's settings, for example to pass it to
+        compile_all() or render_many() worker processes on Windows, where
+        they aren't forked. The unpickled Renderer starts with no templates
+        loaded and no stats.
+        """
+        state = self.__dict__.copy()
+        for name in self._unpickled:
+            state.pop(name, None)
+        return state
+
+    def __setstate__(self, state):
+        self.__dict__.update(state)
+        self._init_state()
 
     def _get_default_filter(self, filename):
         """Return Python expression string to use as default filter."""
@@ -102,21 +746,203 @@ class Renderer(object):
         else:
             return self.default_filter(filename)
 
-    def _compile_text(self, text, indent, template, line_num):
+    def _get_variants(self):
+        """Return list of the variants of the template function to generate
+        in each compiled module, for example 'render' for _render().
+        """
+        variants = ['render']
+        if self.streaming:
+            variants.append('iter')
+        if self.bytes_output:
+            variants.append('bytes')
+        return variants
+
+    def _get_function_header(self, variant, args, filter_expr):
+        """Return Python source for the start of the template function of
+        given variant (up to the first line of the template body).
+        """
+        if variant in ('bytes', 'bytes_into'):
+            if filter_expr == 'symplate.html_filter':
+                filter_expr = 'symplate.html_bytes_filter'
+            elif filter_expr == 'symplate.text_filter':
+                filter_expr = 'symplate.text_bytes_filter'
+            else:
+                filter_expr = 'symplate._bytes_filter(%s)' % filter_expr
+        if variant == 'bytes_into':
+            return """
+def _render_bytes_into(_renderer, _output, _name, %s):
+    filt = %s
+    render = _renderer.render
+    _render_sub = _renderer.render_bytes
+    _writes = _output.extend
+
+""" % (args, filter_expr)
+        if variant == 'bytes':
+            return """
+def _render_bytes(_renderer, %s):
+    filt = %s
+    render = _renderer.render
+    _render_sub = _renderer.render_bytes
+    _output = []
+    _writes = _output.extend
+
+""" % (args, filter_expr)
+        if variant == 'into':
+            return """
+def _render_into(_renderer, _output, _name, %s):
+    filt = %s
+    render = _renderer.render
+    _writes = _output.extend
+
+""" % (args, filter_expr)
+        if variant == 'iter':
+            return """
+def _render_iter(_renderer, %s):
+    filt = %s
+    render = _renderer.render
+    _stream = _renderer.render_iter
+    _output = []
+    _writes = _output.extend
+    _flush_items = _renderer.stream_chunk_items
+
+""" % (args, filter_expr)
+        return """
+def _render(_renderer, %s):
+    filt = %s
+    render = _renderer.render
+    _output = []
+    _writes = _output.extend
+
+""" % (args, filter_expr)
+
+    def _line_marker(self, line_num, filename=None):
+        """Return comment to add to the end of a line of compiled code to mark
+        it as coming from given template line (of template file filename, if
+        it's not the one being compiled), or '' if line_markers is off.
+        """
+        if not self.line_markers:
+            return ''
+        if filename:
+            return '  # line: %s:%d' % (filename, line_num)
+        return '  # line: %d' % line_num
+
+    def _get_function_footer(self, variant, filter_expr):
+        """Return Python source for the end of the template function of given
+        variant. The output is only returned as Markup if the template's
+        default filter is html_filter, as only then is it known to be safe.
+        """
+        if variant in ('into', 'bytes_into'):
+            return ''
+        if variant == 'bytes':
+            return "\n    return ''.join(_output)\n"
+        if variant == 'iter':
+            return "\n    if _output:\n        yield u''.join(_output)\n"
+        if filter_expr == 'symplate.html_filter':
+            return "\n    return symplate.Markup(u''.join(_output))\n"
+        return "\n    return u''.join(_output)\n"
+
+    def _parse_render_call(self, expr):
+        """If output expression is a single call to render(), return tuple of
+        (args, name), where args is its argument list as a source string
+        including the parentheses, and name is the template name if it's a
+        string literal (otherwise None). If it's not a render() call, return
+        None.
+        """
+        if not expr.startswith('render'):
+            return None
+        try:
+            node = ast.parse(expr, mode='eval').body
+        except SyntaxError:
+            return None
+        if (not isinstance(node, ast.Call) or
+                not isinstance(node.func, ast.Name) or
+                node.func.id != 'render'):
+            return None
+        name = None
+        if node.args and isinstance(node.args[0], ast.Str):
+            name = node.args[0].s
+        return (expr[len('render'):].lstrip(), name)
+
+    def _inline_function(self, name, inlines):
+        """Compile named sub-template for inlining into the template being
+        compiled, add its source to inlines, and return the name of the
+        function to call to render it. Return None if it can't be inlined
+        because it's (directly or indirectly) recursive or doesn't exist.
+        """
+        if name in inlines['funcs']:
+            return inlines['funcs'][name]
+        filename = os.path.abspath(self._get_filenames(name)['symplate'])
+        if filename in inlines['stack']:
+            return None
+        try:
+            with open(filename) as f:
+                template = unicode(f.read(), 'utf-8')
+        except IOError:
+            # leave it to render() to raise the error at runtime
+            return None
+
+        inlines['stack'].append(filename)
+        try:
+            py_source = self._compile_string(template, filename=filename,
+                                             _inlines=inlines)
+        finally:
+            inlines['stack'].pop()
+
+        # wrap the sub-template's module-level code and _render_into()
+        # function in a factory function so its names don't clash with ours
+        func_name = '_inline_%d' % len(inlines['funcs'])
+        inlines['funcs'][name] = func_name
+        output = inlines['output']
+        output.append('\n# Inlined from: %s\ndef %s():\n' %
+                      (filename, func_name))
+        output.extend(('    ' + line if line.strip() else line)
+                      for line in py_source.splitlines(True))
+        if self.bytes_output:
+            output.append('\n    return _render_into, _render_bytes_into\n'
+                          '%s, %s_bytes = %s()\n' %
+                          (func_name, func_name, func_name))
+        else:
+            output.append('\n    return _render_into\n%s = %s()\n' %
+                          (func_name, func_name))
+        return func_name
+
+    def _compile_text(self, text, indent, template, line_num,
+                      variant='render', can_yield=False, inline=None,
+                      minify_state=None, filename=None):
         """Compile the text parts of a template (the parts not inside {%...%}
         blocks) at given indent level and return list of Python source output
-        lines.
+        lines. can_yield is True if the iter variant can yield output at this
+        point (that is, we're not inside a nested def). inline, if given, is
+        a function that takes a sub-template name and returns the name of a
+        function to call to render it inline, or None. minify_state, if
+        given, is a dict whose 'html_state' is passed to _minify_html() for
+        each literal string and updated with the result. filename is the
+        template file text came from if it's not the one being compiled.
         """
-        writes = []
-        add_write = writes.append
+        writes = []  # list of (code, line_num) tuples
+        output = []
+        marker = lambda line_num: self._line_marker(line_num, filename)
+        is_bytes = variant in ('bytes', 'bytes_into')
+
+        def add_write(code):
+            """Add code to the writes for the current line."""
+            writes.append((code, line_num))
 
         def add_string(string):
             """Add a write(string) to the output."""
+            if minify_state is not None:
+                string, minify_state['html_state'] = _minify_html(
+                    string, minify_state['html_state'])
             if not string:
                 return
-            if len(string) > 50 and '\n' in string:
+            if is_bytes:
+                # store literal text pre-encoded
+                add_write(repr(string.encode('utf-8')))
+            elif (len(string) > 50 and '\n' in string and
+                    variant != 'into'):
                 # put long, multi-line text blocks inside raw """ strings
-                # (but be sure to allow literal triple quotes to work
+                # (but be sure to allow literal triple quotes to work), except
+                # when inlining, as the lines of code are re-indented
                 chunks = string.split('"""')
                 output = []
                 for i, chunk in enumerate(chunks):
@@ -133,6 +959,25 @@ class Renderer(object):
             else:
                 add_write(repr(string))
 
+        def flush_writes():
+            """Output a _writes() call for the writes added so far."""
+            if writes:
+                output.append('%s_writes((%s\n' %
+                              (indent, marker(writes[0][1])))
+                output.extend('%s    %s,%s\n' % (indent, w, marker(n))
+                              for w, n in writes)
+                output.append(indent + '))\n')
+                del writes[:]
+
+        def add_yield(condition):
+            """Output code to yield the output so far if condition is true."""
+            output.append('%sif %s:%s\n' % (indent, condition,
+                                             marker(line_num)))
+            output.append("%s    yield u''.join(_output)\n" % indent)
+            output.append('%s    del _output[:]\n' % indent)
+
+        stream = variant == 'iter' and can_yield
+        pending = False  # True if there's output to yield
         pieces = text.split('{{')
         for i, piece in enumerate(pieces):
             if i == 0:
@@ -146,13 +991,42 @@ class Renderer(object):
                     msg = 'no }} at end of expression'
                 else:
                     msg = 'more than one }} after expression'
-                raise Error(msg, template, line_num)
+                raise Error(msg, template, line_num, filename)
             expr, string = expr_string
             expr = expr.strip()
 
             if expr.startswith('!'):
                 expr = expr[1:].lstrip()
-                if expr:
+                render_call = None
+                if stream or inline is not None or is_bytes:
+                    render_call = self._parse_render_call(expr)
+                func_name = None
+                if inline is not None and render_call and render_call[1]:
+                    func_name = inline(render_call[1])
+                    if func_name is not None and is_bytes:
+                        func_name += '_bytes'
+
+                if func_name is not None:
+                    # render sub-template straight into our output list
+                    flush_writes()
+                    output.append('%s%s(_renderer, _output, %s%s\n' %
+                                  (indent, func_name, render_call[0][1:],
+                                   marker(line_num)))
+                    if stream:
+                        add_yield('len(_output) >= _flush_items')
+                elif stream and render_call:
+                    # stream the sub-template's output straight through
+                    flush_writes()
+                    add_yield('_output')
+                    output.append('%sfor _chunk in _stream%s:%s\n' %
+                                  (indent, render_call[0], marker(line_num)))
+                    output.append('%s    yield _chunk\n' % indent)
+                    pending = False
+                elif is_bytes and render_call:
+                    add_write('_render_sub' + render_call[0])
+                elif is_bytes and expr:
+                    add_write('symplate._to_bytes(%s)' % expr)
+                elif expr:
                     add_write(expr)
             elif expr:
                 add_write('filt(%s)' % expr)
@@ -160,40 +1034,274 @@ class Renderer(object):
 
             line_num += piece.count('\n')
 
-        output = []
         if writes:
-            output.append(indent + '_writes((\n')
-            output.extend('%s    %s,\n' % (indent, w) for w in writes)
-            output.append(indent + '))\n')
+            flush_writes()
+            pending = True
+        if stream and pending:
+            add_yield('len(_output) >= _flush_items')
 
         return output
 
-    def _compile_string(self, template, filename=None):
-        """Compile template string into Python source string."""
+    def _extend_template(self, template, filename, _seen=()):
+        """If template source string has an {% extends 'name' %} directive,
+        return tuple of (template, parents, segments), where template is the
+        source of the named parent template with its blocks replaced by the
+        blocks of the same name in this template, and parents is a list of
+        the names of the templates extended, directly or indirectly.
+        Otherwise return (template, [], segments).
+
+        segments gives the template file each part of the returned source
+        came from, so that errors and line markers can refer to it. It's a
+        list of (start, filename, source, source_pos) tuples, each meaning
+        the returned source from position start up to the next segment's
+        start is a copy of template file source from position source_pos.
+        filename is None for the template being compiled.
+        """
+        own_filename = filename if _seen else None
+        segments = [(0, own_filename, template, 0)]
+        if 'block' not in template and 'extends' not in template:
+            return (template, [], segments)
+
+        def error(msg, pos):
+            raise Error(msg, template, template.count('\n', 0, pos) + 1,
+                        own_filename)
+
+        items = _parse_blocks(template, own_filename)
+        overrides = {}
+
+        def add_overrides(items):
+            for item in items:
+                if isinstance(item, tuple):
+                    if item[0] in overrides:
+                        raise Error("can't have multiple blocks named %r" %
+                                    item[0], template, item[4], own_filename)
+                    overrides[item[0]] = item
+                    add_overrides(item[2])
+        add_overrides(items)
+
+        # outside its blocks, an extending template can only have module-level
+        # code, its {% extends %}, and a {% template %} that overrides the
+        # parent's arguments
+        parent_name = None
+        template_directive = None
+        module_code = []
+        output_pos = None
+        depth = 0
+        pos = 0
+        for match in _DIRECTIVE_RE.finditer(template):
+            code = match.group(1).strip()
+            text = template[pos:match.start()]
+            if depth == 0 and text.strip() and output_pos is None:
+                output_pos = pos + len(text) - len(text.lstrip())
+            pos = match.end()
+            if _BLOCK_RE.match(code):
+                depth += 1
+            elif _END_BLOCK_RE.match(code):
+                depth -= 1
+            elif depth:
+                continue
+            elif _EXTENDS_DIRECTIVE_RE.match(code):
+                extends_match = _EXTENDS_RE.match(match.group(0))
+                if not extends_match:
+                    error('extends name must be a string literal',
+                          match.start())
+                if parent_name is not None:
+                    error("can't have multiple extends directives",
+                          match.start())
+                parent_name = extends_match.group(1) or extends_match.group(2)
+                parent_pos = match.start()
+            elif code.startswith(('template ', 'template\t')) or \
+                    code == 'template':
+                template_directive = (match.group(0), match.start())
+            else:
+                module_code.append((match.group(0), match.start()))
+        text = template[pos:]
+        if text.strip() and output_pos is None:
+            output_pos = pos + len(text) - len(text.lstrip())
+        if parent_name is None:
+            return (template, [], segments)
+        if output_pos is not None:
+            error('output must be inside {% block ... %} in a template '
+                  'that extends another', output_pos)
+
+        parent_filename = os.path.abspath(
+            self._get_filenames(parent_name)['symplate'])
+        seen = _seen + (filename and os.path.abspath(filename),)
+        if parent_filename in seen:
+            error("template can't extend itself", parent_pos)
+        try:
+            with open(parent_filename) as f:
+                parent = unicode(f.read(), 'utf-8')
+        except IOError:
+            error('extended template %r not found' % parent_name, parent_pos)
+        parent, parents, parent_segments = self._extend_template(
+            parent, parent_filename, _seen=seen)
+
+        used = set()
+        replaced = {}  # name of block -> name of overridden block it's in
+
+        def add_replaced(items, outer_name):
+            for item in items:
+                if isinstance(item, tuple):
+                    replaced.setdefault(item[0], outer_name)
+                    add_replaced(item[2], outer_name)
+
+        def fill(items, pos, item_segments):
+            """Return list of parts for _join_segments() for items parsed
+            from position pos of the source item_segments describes.
+            """
+            parts = []
+            for item in items:
+                if isinstance(item, tuple):
+                    name, open_text, children, close_text, _, start, end = item
+                    parts.append((open_text, start - len(open_text),
+                                  item_segments))
+                    if name in overrides:
+                        used.add(name)
+                        add_replaced(children, name)
+                        override = overrides[name]
+                        parts.extend(fill(override[2], override[5], segments))
+                    else:
+                        parts.extend(fill(children, start, item_segments))
+                    parts.append((close_text, end, item_segments))
+                    pos = end + len(close_text)
+                else:
+                    parts.append((item, pos, item_segments))
+                    pos += len(item)
+            return parts
+        flattened, flattened_segments = _join_segments(
+            fill(_parse_blocks(parent), 0, parent_segments))
+
+        for name, item in sorted(overrides.iteritems()):
+            if name in used:
+                continue
+            if name in replaced:
+                msg = 'block %r is inside overridden block %r' % (
+                    name, replaced[name])
+            else:
+                msg = 'block %r not in extended template %r' % (name,
+                                                                parent_name)
+            raise Error(msg, template, item[4], own_filename)
+
+        if template_directive is not None:
+            for match in _DIRECTIVE_RE.finditer(flattened):
+                code = match.group(1).strip()
+                if code.startswith(('template ', 'template\t')) or \
+                        code == 'template':
+                    flattened, flattened_segments = _join_segments([
+                        (flattened[:match.start()], 0, flattened_segments),
+                        (template_directive[0], template_directive[1],
+                         segments),
+                        (flattened[match.end():], match.end(),
+                         flattened_segments)])
+                    break
+
+        parts = []
+        for code, pos in module_code:
+            parts.append((code, pos, segments))
+            parts.append(('\n', pos + len(code), segments))
+        parts.append((flattened, 0, flattened_segments))
+        flattened, flattened_segments = _join_segments(parts)
+        return (flattened, [parent_name] + parents, flattened_segments)
+
+    def _compile_string(self, template, filename=None, _inlines=None):
+        """Compile template string into Python source string. _inlines is
+        used internally when compiling a sub-template for inlining.
+        """
         def error(msg):
-            raise Error(msg, template, line_num)
+            raise Error(msg, source, line_num, line_file)
+
+        def line_marker(line_num):
+            """Return _line_marker() for line_num of current template file."""
+            return self._line_marker(line_num, line_file)
+
+        # {% extends %} is resolved to a single template source up front, and
+        # segments gives the template file each part of it came from
+        unextended = template
+        template, parents, segments = self._extend_template(template, filename)
 
         output = []
         write = output.append
-        if filename:
-            write('# Compiled by Symplate from: %s\n' % filename)
-        write('# coding: utf-8\n\nimport symplate\n')
-        write(self.preamble)
+        if _inlines is None:
+            if filename:
+                write('# Compiled by Symplate from: %s\n' % filename)
+            write('# coding: utf-8\n\nimport symplate\n')
+            write(self.preamble)
+            variants = self._get_variants()
+        else:
+            # the preamble and imports are already in the including module
+            variants = ['into']
+            if self.bytes_output:
+                variants.append('bytes_into')
+
+        inline = None
+        if self.inline:
+            if _inlines is None:
+                stack = [os.path.abspath(filename)] if filename else []
+                inlines = {'funcs': {}, 'output': [], 'stack': stack,
+                           'parents': set()}
+            else:
+                inlines = _inlines
+                inlines['parents'].update(parents)
+            inline = lambda name: self._inline_function(name, inlines)
+
+        # while inside the template function, its body is written separately
+        # for each variant, and output after the {% end %} of the template
+        bodies = None
+
+        def write_code(line, bytes_line=None):
+            """Write line of code, or bytes_line instead if given and we're
+            writing the body of a bytes variant.
+            """
+            if bodies is None:
+                write(line)
+            else:
+                for variant, body in zip(variants, bodies):
+                    if (bytes_line is not None and
+                            variant in ('bytes', 'bytes_into')):
+                        body.append(bytes_line)
+                    else:
+                        body.append(line)
+
+        def end_template():
+            for variant, body in zip(variants, bodies):
+                output.extend(body)
+                footer = self._get_function_footer(variant, filter_expr)
+                if self.line_markers:
+                    footer = re.sub(r'(?m)^(.+)$', r'\g<1>' +
+                                    line_marker(line_num), footer)
+                write(footer)
 
         indent = ''
+        blocks = []  # stack of the code lines that opened each indent level
+        cache_num = 0
+        cache_hash = None  # identifies this compile in {% cache %} keys
         in_template = False
         got_template = False
         line_num = 1
+        # source and filename of the template file the current piece is from
+        # (line_file is None if it's the one being compiled)
+        segment_num = 0
+        _, line_file, source, _ = segments[0]
         prev_text = '\n'
+        html_state = None  # where template text is, see _minify_html()
         pieces = template.split('{%')
+        pos = 0  # position of current piece in template
         for i, piece in enumerate(pieces):
             if i == 0:
                 if piece.strip():
                     # output found before any {% ... %} blocks
                     error('output must be inside {% template ... %}')
                 line_num += piece.count('\n')
+                pos += len(piece) + 2
                 continue
 
+            # an extended template's parts switch files only at the start of
+            # a {% ... %} block or the text after it
+            segment = _next_segment(segments, segment_num, pos)
+            if segment is not None:
+                segment_num, line_file, source, line_num = segment
+
             code_text = piece.split('%}')
             if len(code_text) != 2:
                 if len(code_text) < 2:
@@ -207,32 +1315,81 @@ class Renderer(object):
                 brackets = '{{' if left_brackets_in_code else '}}'
                 error('%s not valid in code block' % brackets)
 
-            for line_with_end in code.splitlines(True):
+            in_string = _lines_in_string(code)
+            for code_num, line_with_end in enumerate(code.splitlines(True)):
                 line = line_with_end.strip()
                 if line.startswith(('template ', 'template\t')) or \
                         line == 'template':
                     if got_template:
                         error("can't have multiple template directives")
-                    write("""
-def _render(_renderer, %s):
-    filt = %s
-    render = _renderer.render
-    _output = []
-    _writes = _output.extend
-
-""" % (line[9:], self._get_default_filter(filename)))
                     if indent:
                         error('{% template ... %} must be at top level')
+                    filter_expr = self._get_default_filter(filename)
+                    bodies = []
+                    for variant in variants:
+                        header = self._get_function_header(variant, line[9:],
+                                                           filter_expr)
+                        # the header's first line is blank, second is "def"
+                        blank, def_line, rest = header.split('\n', 2)
+                        bodies.append(['%s\n%s%s\n%s' % (
+                            blank, def_line, line_marker(line_num),
+                            rest)])
                     indent += '    '
+                    blocks.append(line)
                     in_template = True
                     got_template = True
 
+                elif _CACHE_DIRECTIVE_RE.match(line):
+                    if not in_template:
+                        error('{% cache ... %} must be inside '
+                              '{% template ... %}')
+                    cache_num += 1
+                    # bytes variants cache bytes, so they need separate keys
+                    key_code = ('%s_key%d, _ttl%d = symplate._cache_args('
+                                '%%r, %s)%s\n' % (indent, cache_num, cache_num,
+                                                  line[6:].strip(),
+                                                  line_marker(line_num)))
+                    # cached output from before the template (or a template
+                    # it depends on) was changed and recompiled isn't reused
+                    if cache_hash is None:
+                        cache_hash = self._get_cache_key(unextended, filename)
+                    prefix = '%s:%s:%d' % (filename, cache_hash, cache_num)
+                    write_code(key_code % prefix,
+                               key_code % (prefix + ':bytes'))
+                    write_code('%s_fragment%d = _renderer.fragment_cache.get('
+                               '_key%d)\n' % (indent, cache_num, cache_num))
+                    write_code('%sif _fragment%d is not None:\n'
+                               % (indent, cache_num))
+                    write_code('%s    _writes((_fragment%d,))\n'
+                               % (indent, cache_num))
+                    write_code('%selse:\n' % indent)
+                    indent += '    '
+                    write_code('%s_mark%d = len(_output)\n'
+                               % (indent, cache_num))
+                    blocks.append('cache %d' % cache_num)
+
+                elif _BLOCK_RE.match(line) or _END_BLOCK_RE.match(line):
+                    # blocks only mark the sections an extending template
+                    # can replace, so they don't output any code
+                    if not in_template:
+                        error('{% block ... %} must be inside '
+                              '{% template ... %}')
+
                 elif line.startswith(('end ', 'end\t')) or line == 'end':
                     if not indent:
                         error('extra {% end %}')
+                    if blocks[-1].startswith('cache '):
+                        # cache the output written inside {% cache %} block
+                        num = int(blocks[-1][6:])
+                        set_code = ("%s_renderer.fragment_cache.set(_key%d, "
+                                    "%%s''.join(_output[_mark%d:]), _ttl%d)\n"
+                                    % (indent, num, num, num))
+                        write_code(set_code % 'u', set_code % '')
                     indent = indent[:-4]
+                    blocks.pop()
                     if in_template and not indent:
-                        write("\n    return u''.join(_output)\n")
+                        end_template()
+                        bodies = None
                         in_template = False
 
                 else:
@@ -242,12 +1399,33 @@ def _render(_renderer, %s):
                         if not indent:
                             error('dedent keyword not allowed at top level')
                         indent = indent[:-4]
-                    write(indent + line + '\n')
+                        blocks.pop()
+                    if line.endswith('\\') or code_num in in_string:
+                        # can't add a comment after a line continuation or
+                        # inside a multi-line string
+                        code_line = indent + line + '\n'
+                    else:
+                        code_line = (indent + line +
+                                     line_marker(line_num) + '\n')
+                    # make filters return bytes in the bytes variants
+                    bytes_line = None
+                    if (_FILT_ASSIGN_RE.match(line) and
+                            not line.endswith('\\')):
+                        bytes_line = (code_line + indent +
+                                      'filt = symplate._bytes_filter(filt)' +
+                                      line_marker(line_num) + '\n')
+                    write_code(code_line, bytes_line)
                     if end_colon:
                         indent += '    '
+                        blocks.append(line)
 
                 line_num += line_with_end.count('\n')
 
+            segment = _next_segment(segments, segment_num,
+                                    pos + len(code) + 2)
+            if segment is not None:
+                segment_num, line_file, source, line_num = segment
+
             # eat spaces and tabs at beginning of {% line
             eol_pos = text.rfind('\n')
             if eol_pos >= 0 and text[eol_pos + 1:].isspace():
@@ -262,19 +1440,51 @@ def _render(_renderer, %s):
             # ignore whitespace before {% template ... %}, if inside template
             # then write output
             if in_template or text.strip():
-                text_output = self._compile_text(text, indent, template,
-                                                 line_num)
-                if text_output and not in_template:
+                # can't yield inside nested functions, or inside a {% cache %}
+                # block as its output is needed at the end of the block
+                can_yield = not [b for b in blocks
+                                 if b.startswith(('def ', 'def\t',
+                                                  'class ', 'class\t',
+                                                  'cache '))]
+                text_outputs = []
+                for variant in variants:
+                    # each variant minifies the text starting from the same
+                    # state, so they all end in the same state too
+                    minify_state = ({'html_state': html_state}
+                                    if self.minify else None)
+                    text_outputs.append(self._compile_text(
+                        text, indent, source, line_num, variant=variant,
+                        can_yield=can_yield, inline=inline,
+                        minify_state=minify_state, filename=line_file))
+                if minify_state is not None:
+                    html_state = minify_state['html_state']
+                if text_outputs[0] and not in_template:
                     error('output must be inside {% template ... %}')
-                output.extend(text_output)
+                if in_template:
+                    for body, text_output in zip(bodies, text_outputs):
+                        body.extend(text_output)
             line_num += text.count('\n')
+            pos += len(piece) + 2
 
         if not got_template:
             error('no {% template ... %} directive')
         if in_template and len(indent) != 4 or not in_template and indent:
             error('template must end at top level')
         if in_template:
-            write("\n    return u''.join(_output)\n")
+            end_template()
+
+        if _inlines is None:
+            depends = set(parents)
+            if inline is not None:
+                output.extend(inlines['output'])
+                depends.update(inlines['funcs'])
+                depends.update(inlines['parents'])
+            if depends:
+                write('\n_depends = %r\n' % (tuple(sorted(depends)),))
+
+        if self.line_markers and _inlines is None:
+            line_map = _get_line_map(''.join(output), filename)
+            write('\n_line_map = %r\n' % (line_map,))
 
         return ''.join(output)
 
@@ -297,14 +1507,30 @@ def _render(_renderer, %s):
         return names
 
     def _make_output_dir(self, output_dir):
-        """Create an output directories along with its __init__.py."""
-        if not os.path.exists(output_dir):
+        """Create an output directories along with its __init__.py. It's not
+        an error if another process creates them at the same time.
+        """
+        try:
             os.mkdir(output_dir)
+        except OSError, error:
+            if error.errno != errno.EEXIST:
+                raise
         init_py_name = os.path.join(output_dir, '__init__.py')
         if not os.path.exists(init_py_name):
             with open(init_py_name, 'w') as f:
                 f.write('')
 
+    def _make_output_dirs(self, name):
+        """Create intermediate and final output directories for named template,
+        each with an __init__.py.
+        """
+        self._make_output_dir(self.output_dir)
+        rel_output_dir = os.path.normpath(os.path.dirname(name))
+        dir_names = rel_output_dir.split(os.sep)
+        for i in range(len(dir_names)):
+            cur_output_dir = os.path.join(self.output_dir, *dir_names[:i + 1])
+            self._make_output_dir(cur_output_dir)
+
     def compile(self, name, verbose=False):
         """Compile named template to .py in output directory. Print what we're
         compiling iff verbose is True.
@@ -316,34 +1542,24 @@ def _render(_renderer, %s):
         with open(names['symplate']) as f:
             template = unicode(f.read(), 'utf-8')
         symplate_name = os.path.abspath(names['symplate'])
+        start = time.time()
         py_source = self._compile_string(template, filename=symplate_name)
+        if self.instrument:
+            self._record_compile(name, time.time() - start)
 
-        # create intermediate and final output directories with __init__.py
-        self._make_output_dir(self.output_dir)
-        rel_output_dir = os.path.normpath(os.path.dirname(name))
-        dir_names = rel_output_dir.split(os.sep)
-        for i in range(len(dir_names)):
-            cur_output_dir = os.path.join(self.output_dir, *dir_names[:i + 1])
-            self._make_output_dir(cur_output_dir)
-
-        with open(names['py'], 'w') as f:
-            f.write(py_source.encode('utf-8'))
+        self._make_output_dirs(name)
+        _write_file_atomic(names['py'], py_source.encode('utf-8'))
 
         # ensure .pyc and .pyo are gone so it doesn't get reloaded from them
-        def remove_if_exists(filename):
-            try:
-                os.remove(filename)
-            except OSError:
-                pass
         py_basename = os.path.splitext(names['py'])[0]
-        remove_if_exists(py_basename + '.pyc')
-        remove_if_exists(py_basename + '.pyo')
+        _remove_if_exists(py_basename + '.pyc')
+        _remove_if_exists(py_basename + '.pyo')
 
-    def compile_all(self, recursive=True, verbose=False):
-        """Compile all templates in template_dir to .py files. Recurse into
-        subdirectories iff recursive is True. Print what we're compiling iff
-        verbose is True.
+    def _get_template_names(self, recursive=True):
+        """Return sorted list of the names of all templates in template_dir.
+        Recurse into subdirectories iff recursive is True.
         """
+        names = []
         for root, dirs, files in os.walk(self.template_dir):
             for base_name in files:
                 if not base_name.endswith(self.extension):
@@ -355,26 +1571,387 @@ def _render(_renderer, %s):
                 name = full_name[prefix_len:]
                 if self.extension:
                     name = name[:-len(self.extension)]
-                self.compile(name, verbose=verbose)
+                names.append(name)
 
             if not recursive:
                 dirs[:] = []
+        return sorted(names)
+
+    def _read_manifest(self):
+        """Read manifest written by compile_all() and return its dict of
+        template entries, or an empty dict if there isn't a valid one.
+        """
+        try:
+            with open(os.path.join(self.output_dir, MANIFEST_NAME)) as f:
+                manifest = json.load(f)
+        except (IOError, ValueError):
+            return {}
+        if not isinstance(manifest, dict) or \
+                not isinstance(manifest.get('templates'), dict):
+            return {}
+        return manifest['templates']
+
+    def _write_manifest(self, entries):
+        """Write manifest with given dict of template entries."""
+        manifest = {'version': __version__, 'templates': entries}
+        self._make_output_dir(self.output_dir)
+        _write_file_atomic(os.path.join(self.output_dir, MANIFEST_NAME),
+                           json.dumps(manifest, indent=1, sort_keys=True))
+
+    def _read_bundle(self, filename):
+        """Read bundle file written by compile_all() and return its dict of
+        template name to code object, or an empty dict if it was written by a
+        different version of Python. Raise IOError if it can't be read, and
+        ValueError or EOFError if it isn't a bundle or is truncated.
+        """
+        with open(filename, 'rb') as f:
+            data = f.read()
+        magic = imp.get_magic()
+        if not data.startswith(magic):
+            # Python's magic numbers are two bytes followed by '\r\n'
+            if data[2:4] == '\r\n':
+                return {}
+            raise ValueError('%r is not a Symplate bundle' % filename)
+        return marshal.loads(data[len(magic):])
+
+    def _write_bundle(self, filename, names):
+        """Write bundle file with the code of the given templates, compiled
+        from their .py files in output_dir.
+        """
+        codes = {}
+        for name in names:
+            py_name = self._get_filenames(name)['py']
+            with open(py_name, 'rU') as f:
+                codes[name] = compile(f.read(), py_name, 'exec')
+        _write_file_atomic(filename, imp.get_magic() + marshal.dumps(codes))
+
+    def _get_manifest_entry(self, name):
+        """Return manifest entry dict for named template, with the hash of its
+        source and compile settings, and the names of the templates it extends
+        and the sub-templates it renders by literal name.
+        """
+        filename = os.path.abspath(self._get_filenames(name)['symplate'])
+        with open(filename) as f:
+            template = unicode(f.read(), 'utf-8')
+        depends = set(m.group(1) or m.group(2)
+                      for regex in (_RENDER_NAME_RE, _EXTENDS_RE)
+                      for m in regex.finditer(template))
+        return {
+            'hash': self._get_cache_key(template, filename),
+            'depends': sorted(depends),
+        }
+
+    def _remove_compiled(self, name):
+        """Remove the compiled .py (and .pyc, .pyo, and .lock) for named
+        template.
+        """
+        py_basename = os.path.splitext(self._get_filenames(name)['py'])[0]
+        for ext in ('.py', '.pyc', '.pyo', '.lock'):
+            _remove_if_exists(py_basename + ext)
+
+    def get_dependents(self, name):
+        """Return sorted list of the names of templates that extend named
+        template or render it by literal name, directly or indirectly,
+        according to the manifest written by compile_all().
+        """
+        entries = self._read_manifest()
+        dependents = set()
+        to_check = [name]
+        while to_check:
+            dependency = to_check.pop()
+            for other_name, entry in entries.iteritems():
+                if (dependency in entry.get('depends', ()) and
+                        other_name not in dependents):
+                    dependents.add(other_name)
+                    to_check.append(other_name)
+        return sorted(dependents)
+
+    def compile_all(self, recursive=True, verbose=False, jobs=1,
+                    incremental=False, bundle=None):
+        """Compile all templates in template_dir to .py files and return list
+        of the names compiled. Recurse into subdirectories iff recursive is
+        True. Print what we're compiling iff verbose is True.
+
+        If jobs is greater than 1, compile in a pool of that many worker
+        processes, or if it's 0 (or None), one per CPU. Templates that fail to
+        compile don't stop the others from being compiled; CompileError is
+        raised at the end if any failed.
+
+        compile_all() writes a manifest to output_dir with a hash of each
+        template (and the settings that affect its compiled output) and its
+        sub-template dependencies. If incremental is True, only templates
+        whose hash has changed since the last compile_all() are compiled.
+        Compiled .py files in the manifest whose template has been removed
+        are always deleted.
+
+        If bundle is given, also write the compiled code of all the templates
+        that compiled to that bundle filename, for loading with the Renderer
+        bundle option.
+        """
+        all_names = self._get_template_names(recursive=recursive)
+        if not jobs:
+            jobs = multiprocessing.cpu_count()
+
+        old_entries = self._read_manifest()
+        entries = {}
+        errors = []
+        names = []
+        for name in all_names:
+            try:
+                entries[name] = self._get_manifest_entry(name)
+            except Exception, error:
+                errors.append((name, error))
+                continue
+            old_entry = old_entries.get(name)
+            if (incremental and old_entry is not None and
+                    old_entry.get('hash') == entries[name]['hash'] and
+                    os.path.exists(self._get_filenames(name)['py'])):
+                continue
+            names.append(name)
+
+        if jobs > 1 and len(names) > 1:
+            # create output directories up front so workers don't race
+            for name in names:
+                self._make_output_dirs(name)
+            pool = multiprocessing.Pool(jobs, _init_worker, (self,))
+            try:
+                results = pool.map(_compile_in_worker,
+                                   [(name, verbose) for name in names])
+            finally:
+                pool.close()
+                pool.join()
+            errors.extend((name, error) for name, error in results if error)
+        else:
+            for name in names:
+                try:
+                    self.compile(name, verbose=verbose)
+                except Exception, error:
+                    errors.append((name, error))
+
+        # failed templates aren't added to the manifest, so they're compiled
+        # next time, and templates outside of this run's scope are kept
+        for name, error in errors:
+            entries.pop(name, None)
+        for name, entry in old_entries.iteritems():
+            if name in all_names:
+                continue
+            if not recursive and os.sep in name:
+                entries[name] = entry
+            else:
+                self._remove_compiled(name)
+        self._write_manifest(entries)
+
+        if bundle is not None:
+            self._write_bundle(bundle, [name for name in all_names
+                                        if name in entries])
+
+        if errors:
+            raise CompileError(sorted(errors))
+        return names
+
+    def _get_compile_options(self):
+        """Return string describing the Renderer options (other than preamble
+        and default_filter) that affect the compiled output.
+        """
+        options = self._get_variants()
+        if self.inline:
+            options.append('inline')
+        if self.line_markers:
+            options.append('line_markers')
+        if self.minify:
+            options.append('minify')
+        return ','.join(options)
+
+    def _read_dependencies(self, template, seen=None):
+        """Return list of (name, template) tuples for the templates that
+        template source string extends, and if inline is on, the sub-templates
+        it calls render() on with a literal name, and for the templates they
+        depend on, recursively. Templates that don't exist are skipped.
+        """
+        if seen is None:
+            seen = set()
+        matches = list(_EXTENDS_RE.finditer(template))
+        if self.inline:
+            matches.extend(_RENDER_NAME_RE.finditer(template))
+        dependencies = []
+        for match in matches:
+            name = match.group(1) or match.group(2)
+            if name in seen:
+                continue
+            seen.add(name)
+            try:
+                with open(self._get_filenames(name)['symplate']) as f:
+                    dependency = unicode(f.read(), 'utf-8')
+            except IOError:
+                continue
+            dependencies.append((name, dependency))
+            dependencies.extend(self._read_dependencies(dependency, seen))
+        return dependencies
+
+    def _get_cache_key(self, template, filename):
+        """Return hex digest identifying the compiled code for template
+        source string, which changes whenever the compiled output would.
+        """
+        parts = [__version__, imp.get_magic(), self.preamble,
+                 self._get_default_filter(filename),
+                 self._get_compile_options(), template]
+        # extended templates and inlined sub-templates are part of the
+        # compiled code too
+        for name, dependency in self._read_dependencies(template):
+            parts.extend([name, dependency])
+        sha1 = hashlib.sha1()
+        for part in parts:
+            if isinstance(part, unicode):
+                part = part.encode('utf-8')
+            sha1.update(part)
+            sha1.update('\0')
+        return sha1.hexdigest()
+
+    def _compile_code(self, name, template, filename, py_name):
+        """Compile named template's source string to a Python code object,
+        loading it from (or saving it to) cache_dir if that's set. Only
+        actual compiles are recorded in the stats, not loads from cache_dir.
+        """
+        if self.cache_dir is not None:
+            key = self._get_cache_key(template, filename)
+            cache_name = os.path.join(self.cache_dir, key + '.symc')
+            try:
+                with open(cache_name, 'rb') as f:
+                    return marshal.load(f)
+            except (IOError, EOFError, ValueError, TypeError):
+                pass
+
+        start = time.time()
+        py_source = self._compile_string(template, filename=filename)
+        code = compile(py_source.encode('utf-8'), py_name, 'exec')
+        if self.instrument:
+            self._record_compile(name, time.time() - start)
+
+        if self.cache_dir is not None:
+            # cache is only an optimization, so ignore write errors (for
+            # example a read-only cache_dir shared between hosts)
+            try:
+                if not os.path.exists(self.cache_dir):
+                    os.makedirs(self.cache_dir)
+                _write_file_atomic(cache_name, marshal.dumps(code))
+            except (IOError, OSError):
+                pass
+
+        return code
+
+    def _get_depends_mtime(self, module):
+        """Return latest modify time of the templates extended by or inlined
+        into given compiled template module, or 0 if there aren't any.
+        """
+        mtime = 0
+        for name in getattr(module, '_depends', ()):
+            filename = self._get_filenames(name)['symplate']
+            try:
+                name_mtime = os.path.getmtime(filename)
+            except OSError:
+                # sub-template was deleted, so it needs recompiling
+                name_mtime = float('inf')
+            mtime = max(mtime, name_mtime)
+        return mtime
+
+    def _make_module(self, name, code):
+        """Execute given code object into a new module object for named
+        template and return the module.
+        """
+        module = types.ModuleType(self._get_filenames(name)['module'])
+        # no parent package, so "import symplate" is an absolute import
+        module.__package__ = ''
+        exec code in module.__dict__
+        return module
+
+    def _load_module(self, name):
+        """Compile named template and execute it into a fresh module object
+        held only by this Renderer (no .py files written and nothing added to
+        sys.modules). Recompile only if the template has changed since it was
+        last loaded.
+        """
+        names = self._get_filenames(name)
+        mtime = os.path.getmtime(names['symplate'])
+        if name in self._memory_modules:
+            loaded_mtime, module = self._memory_modules[name]
+            if loaded_mtime >= max(mtime, self._get_depends_mtime(module)):
+                return module
+
+        with open(names['symplate']) as f:
+            template = unicode(f.read(), 'utf-8')
+        symplate_name = os.path.abspath(names['symplate'])
+        code = self._compile_code(name, template, symplate_name, names['py'])
+
+        module = self._make_module(name, code)
+        mtime = max(mtime, self._get_depends_mtime(module))
+        self._memory_modules[name] = (mtime, module)
+        return module
 
     def _get_module(self, name):
-        """Import (or compile and import) named template and return module."""
+        """Import (or compile and import) named template and return module.
+        If check_interval is set, only check the template's modify times if
+        it's been at least that many seconds since they were last checked.
+        """
+        if self.check_interval:
+            now = time.time()
+            checked = self._checked_modules.get(name)
+            if checked is not None and now - checked[0] < self.check_interval:
+                return checked[1]
+            module = self._find_module(name)
+            self._checked_modules[name] = (now, module)
+            return module
+        return self._find_module(name)
+
+    def _compile_if_stale(self, name, is_stale):
+        """Compile named template if is_stale() returns True. Hold an advisory
+        lock on a .lock file next to the .py file while doing so, so that
+        processes sharing output_dir don't compile the same template at once.
+        is_stale() is called once the lock is held, so if another process
+        compiled the template while we were waiting, it isn't compiled again.
+        """
         names = self._get_filenames(name)
+        self._make_output_dirs(name)
+        lock_name = os.path.splitext(names['py'])[0] + '.lock'
+        # closing the lock file releases the lock
+        with open(lock_name, 'a') as lock_file:
+            if fcntl is not None:
+                fcntl.flock(lock_file.fileno(), fcntl.LOCK_EX)
+            if is_stale():
+                self.compile(name)
 
-        if self.auto_compile:
-            # compile the template source to .py if it has changed
+    def _load_bundled_module(self, name):
+        """Execute named template's code from the bundle into a module object
+        the first time it's needed. Bundled templates are never recompiled.
+        """
+        loaded = self._memory_modules.get(name)
+        if loaded is not None:
+            return loaded[1]
+        module = self._make_module(name, self._bundle[name])
+        self._memory_modules[name] = (float('inf'), module)
+        return module
+
+    def _find_module(self, name):
+        """Load named template's module, recompiling it if it's changed."""
+        if name in self._bundle:
+            return self._load_bundled_module(name)
+        if self.in_memory or self.cache_dir is not None:
+            return self._load_module(name)
+        names = self._get_filenames(name)
+
+        def get_py_mtime():
             try:
-                py_mtime = os.path.getmtime(names['py'])
+                return os.path.getmtime(names['py'])
             except OSError:
-                py_mtime = 0
-            if os.path.getmtime(names['symplate']) > py_mtime:
-                self.compile(name)
-                # .py changed, ensure module is reloaded when imported below
-                if names['module'] in sys.modules:
-                    sys.modules.pop(names['module'])
+                return 0
+
+        def template_changed():
+            return os.path.getmtime(names['symplate']) > get_py_mtime()
+
+        if self.auto_compile and template_changed():
+            # compile the template source to .py if it has changed
+            self._compile_if_stale(name, template_changed)
+            # .py changed, ensure module is reloaded when imported below
+            sys.modules.pop(names['module'], None)
 
         # try to import the compiled template; if it doesn't exist (it's never
         # been compiled), compile it and then re-import
@@ -384,23 +1961,545 @@ def _render(_renderer, %s):
         except ImportError:
             if not self.auto_compile:
                 raise
-            self.compile(name)
+            self._compile_if_stale(name, template_changed)
             module = __import__(names['module'], globals(), locals(),
                                 [names['import']])
 
+        # recompile if any of the templates it extends or inlines have changed
+        if self.auto_compile and getattr(module, '_depends', None):
+            def depends_changed():
+                return self._get_depends_mtime(module) > get_py_mtime()
+            if depends_changed():
+                self._compile_if_stale(name, depends_changed)
+                sys.modules.pop(names['module'], None)
+                module = __import__(names['module'], globals(), locals(),
+                                    [names['import']])
+
         return module
 
+    def _lookup_module(self, name):
+        """Return module for named template, from the module cache if
+        possible. render() does the same thing inline, as it's the hot path.
+        """
+        try:
+            return self._module_cache[name]
+        except KeyError:
+            return self._load_cached_module(name)
+
+    def _load_cached_module(self, name):
+        """Get module for named template with _get_module() and store it in
+        the module cache if we're not checking mtimes (or if the watcher will
+        remove it when the template changes). Only one thread loads a given
+        template at a time: others wait for it and then use its result.
+        """
+        if self.check_interval:
+            # no need to lock if it's not time to check mtimes again yet
+            checked = self._checked_modules.get(name)
+            if (checked is not None and
+                    time.time() - checked[0] < self.check_interval):
+                return checked[1]
+        with self._load_locks_lock:
+            lock = self._load_locks.get(name)
+            if lock is None:
+                lock = self._load_locks[name] = threading.Lock()
+        with lock:
+            try:
+                return self._module_cache[name]
+            except KeyError:
+                pass
+            module = self._get_module(name)
+            if not self.check_mtimes or self._watcher is not None:
+                self._module_cache[name] = module
+            return module
+
     def render(self, _name, *args, **kwargs):
         """Render named template with given positional and keyword args."""
-        if _name in self._module_cache:
+        # try/except rather than "in" as the watcher thread may remove the
+        # entry between checking and getting it; no lock is taken on a hit
+        try:
             module = self._module_cache[_name]
-        else:
-            module = self._get_module(_name)
-            # only store in module cache if we're not checking mtimes
-            if not self.check_mtimes:
-                self._module_cache[_name] = module
+        except KeyError:
+            module = self._load_cached_module(_name)
         return module._render(self, *args, **kwargs)
 
+    def _render_instrumented(self, _name, *args, **kwargs):
+        """Render named template like render(), recording stats about it."""
+        return self._call_instrumented(
+            _name, lambda module: module._render(self, *args, **kwargs))
+
+    def _render_bytes_instrumented(self, _name, *args, **kwargs):
+        """Render named template like render_bytes(), recording stats about
+        it (output_size is in bytes).
+        """
+        return self._call_instrumented(
+            _name, lambda module: self._render_module_bytes(module, args,
+                                                            kwargs))
+
+    def _call_instrumented(self, _name, render_module):
+        """Call render_module(module) with named template's module and return
+        the output, recording stats about the render. Time spent in nested
+        render() calls is included in the template's total time but not its
+        self time.
+        """
+        stack = getattr(self._render_stack, 'stack', None)
+        if stack is None:
+            stack = self._render_stack.stack = []
+        hit = _name in self._module_cache
+        module = self._lookup_module(_name)
+
+        # each stack entry is the time spent in nested renders so far
+        stack.append(0.0)
+        start = time.time()
+        try:
+            output = render_module(module)
+        finally:
+            elapsed = time.time() - start
+            nested = stack.pop()
+            if stack:
+                stack[-1] += elapsed
+        self._record_render(_name, elapsed, elapsed - nested, len(output), hit)
+        return output
+
+    def render_cached(self, _name, *args, **kwargs):
+        """Render named template with given positional and keyword args like
+        render(), but cache the output in result_cache, keyed on the template
+        and args. If any of the args aren't hashable, just render it.
+        """
+        module = self._lookup_module(_name)
+        # include the types, as 1, 1.0 and True are equal but render
+        # differently
+        key = (module, tuple((type(a), a) for a in args),
+               frozenset((k, type(v), v) for k, v in kwargs.iteritems()))
+        try:
+            hash(key)
+        except TypeError:
+            return module._render(self, *args, **kwargs)
+        output = self.result_cache.get(key)
+        if output is None:
+            output = module._render(self, *args, **kwargs)
+            self.result_cache.set(key, output)
+        return output
+
+    def render_many(self, name, arg_list, workers=None):
+        """Render named template once for each item in arg_list and return
+        list of the outputs. Each item is a dict of keyword args, a tuple of
+        positional args, or otherwise a single positional arg. The template
+        is only looked up once for the whole batch.
+
+        If workers is greater than 1, split the batch into chunks and render
+        them in a pool of that many worker processes, or if it's 0, one per
+        CPU (like compile_all's jobs). The template is loaded before the pool
+        is started, so the workers don't each compile it.
+        """
+        module = self._lookup_module(name)
+        if workers == 0:
+            workers = multiprocessing.cpu_count()
+        if workers is not None and workers > 1:
+            arg_list = list(arg_list)
+        if workers is not None and workers > 1 and len(arg_list) > 1:
+            # a few chunks per worker evens out the load if some items take
+            # longer to render than others
+            chunk_size = -(-len(arg_list) // (workers * 4))
+            chunks = [(name, arg_list[i:i + chunk_size])
+                      for i in range(0, len(arg_list), chunk_size)]
+            pool = multiprocessing.Pool(workers, _init_worker, (self,))
+            try:
+                results = pool.map(_render_in_worker, chunks)
+            finally:
+                pool.close()
+                pool.join()
+            return [output for result in results for output in result]
+
+        render = module._render
+        outputs = []
+        append = outputs.append
+        for args in arg_list:
+            if isinstance(args, dict):
+                append(render(self, **args))
+            elif isinstance(args, tuple):
+                append(render(self, *args))
+            else:
+                append(render(self, args))
+        return outputs
+
+    def render_bytes(self, _name, *args, **kwargs):
+        """Render named template with given positional and keyword args and
+        return the output as a UTF-8 byte string. If the template was
+        compiled with bytes_output=True, its text is already encoded and the
+        output is built as bytes, otherwise the output is rendered as unicode
+        and then encoded.
+        """
+        return self._render_module_bytes(self._lookup_module(_name), args,
+                                         kwargs)
+
+    def _render_module_bytes(self, module, args, kwargs):
+        """Render given template module to a UTF-8 byte string, using its
+        bytes_output version if it has one.
+        """
+        render_bytes = getattr(module, '_render_bytes', None)
+        if render_bytes is None:
+            return module._render(self, *args, **kwargs).encode('utf-8')
+        return render_bytes(self, *args, **kwargs)
+
+    def render_iter(self, _name, *args, **kwargs):
+        """Render named template with given positional and keyword args, and
+        return an iterator that yields the output in chunks as it's rendered.
+        Templates must have been compiled with streaming=True to stream,
+        otherwise the output is rendered up front and yielded as one chunk.
+        """
+        module = self._lookup_module(_name)
+        render_iter = getattr(module, '_render_iter', None)
+        if render_iter is None:
+            return iter([module._render(self, *args, **kwargs)])
+        return render_iter(self, *args, **kwargs)
+
+    def render_into(self, _name, _fileobj, *args, **kwargs):
+        """Render named template with given positional and keyword args,
+        writing the output to _fileobj in buffered, encoded chunks and
+        returning the number of bytes written. Keyword args _encoding
+        (default 'utf-8') and _buffer_size (default 65536 bytes) control the
+        encoding and how much output to collect between writes. Raise
+        ValueError if the Renderer wasn't created with streaming=True, as the
+        whole output would be built in memory first.
+        """
+        if not self.streaming:
+            raise ValueError('render_into() requires streaming=True')
+        encoding = kwargs.pop('_encoding', 'utf-8')
+        buffer_size = kwargs.pop('_buffer_size', 65536)
+        buffer = []
+        buffered = 0
+        written = 0
+        for chunk in self.render_iter(_name, *args, **kwargs):
+            chunk = chunk.encode(encoding)
+            buffer.append(chunk)
+            buffered += len(chunk)
+            if buffered >= buffer_size:
+                _fileobj.write(''.join(buffer))
+                written += buffered
+                buffer = []
+                buffered = 0
+        if buffer:
+            _fileobj.write(''.join(buffer))
+            written += buffered
+        return written
+
+    def _get_stats(self, name):
+        """Return stats dict for named template, adding it if needed. Must be
+        called with _stats_lock held.
+        """
+        stats = self._stats.get(name)
+        if stats is None:
+            stats = self._stats[name] = {
+                'renders': 0,
+                'total_time': 0.0,
+                'self_time': 0.0,
+                'output_size': 0,
+                'cache_hits': 0,
+                'cache_misses': 0,
+                'compiles': 0,
+                'compile_time': 0.0,
+                'buckets': [0] * (len(self.stats_buckets) + 1),
+            }
+        return stats
+
+    def _record_render(self, name, total_time, self_time, output_size, hit):
+        """Add a render of named template to its stats."""
+        bucket = bisect.bisect_left(self.stats_buckets, total_time)
+        with self._stats_lock:
+            stats = self._get_stats(name)
+            stats['renders'] += 1
+            stats['total_time'] += total_time
+            stats['self_time'] += self_time
+            stats['output_size'] += output_size
+            stats['cache_hits' if hit else 'cache_misses'] += 1
+            stats['buckets'][bucket] += 1
+
+    def _record_compile(self, name, compile_time):
+        """Add a compile of named template to its stats."""
+        with self._stats_lock:
+            stats = self._get_stats(name)
+            stats['compiles'] += 1
+            stats['compile_time'] += compile_time
+
+    def stats(self):
+        """Return snapshot of the stats recorded when instrument is True, as
+        a dict of template name to dict of stats (see README.md).
+        """
+        with self._stats_lock:
+            snapshot = {}
+            for name, stats in self._stats.iteritems():
+                snapshot[name] = dict(stats, buckets=list(stats['buckets']))
+        return snapshot
+
+    def reset_stats(self):
+        """Clear the stats recorded when instrument is True."""
+        with self._stats_lock:
+            self._stats.clear()
+
+    def prometheus_stats(self, prefix='symplate'):
+        """Return the recorded stats as text in the Prometheus exposition
+        format, with metric names starting with prefix.
+        """
+        snapshot = sorted(self.stats().iteritems())
+        lines = []
+
+        def add_metric(name, metric_type, help, key):
+            lines.append('# HELP %s_%s %s' % (prefix, name, help))
+            lines.append('# TYPE %s_%s %s' % (prefix, name, metric_type))
+            for template, stats in snapshot:
+                lines.append('%s_%s{template="%s"} %r' % (
+                    prefix, name, _escape_label(template), stats[key]))
+
+        add_metric('renders_total', 'counter',
+                   'Number of times the template was rendered.', 'renders')
+        add_metric('render_self_seconds_total', 'counter',
+                   'Time spent rendering the template, not counting nested '
+                   'render() calls.', 'self_time')
+        add_metric('output_size_total', 'counter',
+                   'Number of characters the template has output.',
+                   'output_size')
+        add_metric('module_cache_hits_total', 'counter',
+                   "Renders that found the template's module in the cache.",
+                   'cache_hits')
+        add_metric('module_cache_misses_total', 'counter',
+                   "Renders that had to load the template's module.",
+                   'cache_misses')
+        add_metric('compiles_total', 'counter',
+                   'Number of times the template was compiled.', 'compiles')
+        add_metric('compile_seconds_total', 'counter',
+                   'Time spent compiling the template.', 'compile_time')
+
+        name = prefix + '_render_seconds'
+        lines.append('# HELP %s Time spent rendering the template, including '
+                     'nested render() calls.' % name)
+        lines.append('# TYPE %s histogram' % name)
+        for template, stats in snapshot:
+            label = _escape_label(template)
+            count = 0
+            bounds = [repr(b) for b in self.stats_buckets] + ['+Inf']
+            for bound, bucket_count in zip(bounds, stats['buckets']):
+                count += bucket_count
+                lines.append('%s_bucket{template="%s",le="%s"} %d' % (
+                    name, label, bound, count))
+            lines.append('%s_sum{template="%s"} %r' % (
+                name, label, stats['total_time']))
+            lines.append('%s_count{template="%s"} %d' % (
+                name, label, stats['renders']))
+
+        return '\n'.join(lines) + '\n'
+
+    def preload(self, names=None, recursive=True, freeze=False):
+        """Load named templates (or all templates in the bundle or
+        template_dir if names is None) into the module cache ahead of time,
+        and return the list of names loaded. Recurse into subdirectories iff
+        recursive is True. If freeze is True, also collect garbage and call
+        gc.freeze() where available (Python 3.7+), so that processes forked
+        afterwards share the loaded modules' memory copy-on-write.
+        """
+        if names is None and self._bundle:
+            names = sorted(self._bundle)
+        elif names is None:
+            names = self._get_template_names(recursive=recursive)
+        for name in names:
+            self._lookup_module(name)
+        if freeze and hasattr(gc, 'freeze'):
+            gc.collect()
+            gc.freeze()
+        return list(names)
+
+    def _is_stale(self, name, module):
+        """Return True if named template or any of the templates inlined into
+        it have changed since given module was compiled.
+        """
+        names = self._get_filenames(name)
+        try:
+            mtime = max(os.path.getmtime(names['symplate']),
+                        self._get_depends_mtime(module))
+            loaded = self._memory_modules.get(name)
+            if loaded is not None and loaded[1] is module:
+                compiled_mtime = loaded[0]
+            else:
+                compiled_mtime = os.path.getmtime(names['py'])
+        except OSError:
+            return True
+        return mtime > compiled_mtime
+
+    def _remove_stale_modules(self):
+        """Remove templates that have changed from the module cache."""
+        for name, module in self._module_cache.items():
+            if self._is_stale(name, module):
+                self._module_cache.pop(name, None)
+                self._checked_modules.pop(name, None)
+
+    def _remove_changed_file(self, filename):
+        """Remove the template with given filename, and any templates that
+        extend it or that it's inlined into, from the module cache.
+        """
+        if not filename.endswith(self.extension):
+            return
+        name = os.path.relpath(filename, self.template_dir)
+        if self.extension:
+            name = name[:-len(self.extension)]
+        name = name.replace(os.sep, '/')
+        for cached_name, module in self._module_cache.items():
+            if cached_name == name or name in getattr(module, '_depends', ()):
+                self._module_cache.pop(cached_name, None)
+                self._checked_modules.pop(cached_name, None)
+
+    def start_watcher(self, interval=1.0, use_inotify=True):
+        """Start a background thread that removes templates from the module
+        cache when their files change, so render() can use the cache even
+        when check_mtimes is on. Uses inotify if pyinotify is installed and
+        use_inotify is True, otherwise checks modify times every interval
+        seconds.
+        """
+        if self._watcher is not None:
+            return
+        if use_inotify and pyinotify is not None:
+            renderer = self
+
+            class EventHandler(pyinotify.ProcessEvent):
+                def process_default(self, event):
+                    renderer._remove_changed_file(event.pathname)
+
+            manager = pyinotify.WatchManager()
+            watcher = pyinotify.ThreadedNotifier(manager, EventHandler())
+            watcher.daemon = True
+            watcher.start()
+            mask = (pyinotify.IN_CLOSE_WRITE | pyinotify.IN_MOVED_TO |
+                    pyinotify.IN_MOVED_FROM | pyinotify.IN_DELETE)
+            manager.add_watch(self.template_dir, mask, rec=True, auto_add=True)
+        else:
+            watcher = _PollingWatcher(self, interval)
+            watcher.start()
+        self._watcher = watcher
+
+    def stop_watcher(self):
+        """Stop the watcher thread started by start_watcher(), if any."""
+        watcher = self._watcher
+        if watcher is None:
+            return
+        self._watcher = None
+        watcher.stop()
+        # modules cached while watching may go stale from now on
+        if self.check_mtimes:
+            self._module_cache.clear()
+
+
+class Profiler(object):
+    """Line-level profiler for templates compiled with line_markers=True.
+    While it's running (between start() and stop(), or in a "with" block),
+    it uses sys.settrace() to record the time spent on each template line and
+    in each template function and {% def %} function. A line's time includes
+    the time spent in anything it calls, such as filters and sub-templates.
+    Tracing slows rendering down a lot, so only profile when investigating.
+    """
+
+    # names to show in the report for the template function variants
+    function_labels = {
+        '_render': 'template',
+        '_render_iter': 'template (render_iter)',
+        '_render_into': 'template (inlined)',
+        '_render_bytes': 'template (render_bytes)',
+        '_render_bytes_into': 'template (inlined, render_bytes)',
+    }
+
+    def __init__(self):
+        self.lines = {}  # (filename, line_num) -> [hits, seconds]
+        self.functions = {}  # (filename, line_num, name) -> [calls, seconds]
+
+    def __enter__(self):
+        self.start()
+        return self
+
+    def __exit__(self, *exc_info):
+        self.stop()
+
+    def start(self):
+        """Start profiling in this thread and in threads started after."""
+        threading.settrace(self._trace)
+        sys.settrace(self._trace)
+
+    def stop(self):
+        """Stop profiling."""
+        sys.settrace(None)
+        threading.settrace(None)
+
+    def reset(self):
+        """Clear the times recorded so far."""
+        self.lines.clear()
+        self.functions.clear()
+
+    def _trace(self, frame, event, arg):
+        """Global trace function: return a trace function for the frame if
+        it's running compiled template code with a line map.
+        """
+        if event != 'call':
+            return None
+        line_map = frame.f_globals.get('_line_map')
+        if line_map is None:
+            return None
+
+        code = frame.f_code
+        filename, line_num = line_map.get(code.co_firstlineno,
+                                          (code.co_filename,
+                                           code.co_firstlineno))
+        name = self.function_labels.get(code.co_name, 'def ' + code.co_name)
+        function_key = (filename, line_num, name)
+        lines = self.lines
+        functions = self.functions
+        start = time.time()
+        state = [None, start]  # current line's (filename, line_num), start
+
+        def trace_frame(frame, event, arg):
+            now = time.time()
+            line_key = state[0]
+            if line_key is not None:
+                lines[line_key][1] += now - state[1]
+            if event == 'line':
+                new_line_key = line_map.get(frame.f_lineno)
+                # a template line can compile to several lines of code, so
+                # only count a hit when we move to a different template line
+                if new_line_key is not None and new_line_key != line_key:
+                    stats = lines.get(new_line_key)
+                    if stats is None:
+                        stats = lines[new_line_key] = [0, 0.0]
+                    stats[0] += 1
+                state[0] = new_line_key
+            elif event == 'return':
+                stats = functions.get(function_key)
+                if stats is None:
+                    stats = functions[function_key] = [0, 0.0]
+                stats[0] += 1
+                stats[1] += now - start
+            # don't count the time spent in here against the line
+            state[1] = time.time()
+            return trace_frame
+
+        return trace_frame
+
+    def report(self, limit=20):
+        """Return a report of the template functions and lines that took the
+        most time (at most limit of each) as a string.
+        """
+        output = ['Template functions by time:',
+                  '   seconds      calls  location']
+        functions = sorted(self.functions.iteritems(),
+                           key=lambda item: item[1][1], reverse=True)
+        for (filename, line_num, name), (calls, seconds) in functions[:limit]:
+            output.append('%10.6f %10d  %s:%d %s' % (
+                seconds, calls, filename, line_num, name))
+
+        output.extend(['', 'Template lines by time:',
+                       '   seconds       hits  location'])
+        lines = sorted(self.lines.iteritems(),
+                       key=lambda item: item[1][1], reverse=True)
+        for (filename, line_num), (hits, seconds) in lines[:limit]:
+            source = linecache.getline(filename, line_num).strip()
+            output.append('%10.6f %10d  %s:%d  %s' % (
+                seconds, hits, filename, line_num, source[:60]))
+        return '\n'.join(output) + '\n'
+
 
 def main():
     """Usage: symplate.py [-h] [options] template_dir [template_names]
@@ -424,26 +2523,46 @@ template_names not given
                       help="don't print what we're doing")
     parser.add_option('-n', '--non-recursive', action='store_true',
                       help="don't recurse into subdirectories")
+    parser.add_option('-i', '--incremental', action='store_true',
+                      help='only compile templates that have changed since '
+                           'the last run')
+    parser.add_option('-m', '--minify', action='store_true',
+                      help='collapse whitespace in template text (see docs)')
+    parser.add_option('-b', '--bundle', metavar='FILE',
+                      help='also write all compiled templates to a single '
+                           'bundle file')
+    parser.add_option('-j', '--jobs', type='int', default=1,
+                      help='number of processes to compile with, 0 for one '
+                           'per CPU, default %default')
     options, args = parser.parse_args()
 
     if len(args) <= 0:
         parser.error('no template_dir given')
     template_dir = args[0]
     template_names = args[1:]
+    if template_names and options.bundle:
+        parser.error('--bundle only works when compiling all templates')
 
     extension = options.extension
     if not extension.startswith('.'):
         extension = '.' + extension
     renderer = Renderer(template_dir, output_dir=options.output_dir,
-                        extension=extension, preamble=options.preamble)
+                        extension=extension, preamble=options.preamble,
+                        minify=options.minify)
 
     if template_names:
         for name in template_names:
             renderer.compile(name, verbose=not options.quiet)
     else:
-        template_names = renderer.compile_all(
-            recursive=not options.non_recursive,
-            verbose=not options.quiet)
+        try:
+            renderer.compile_all(recursive=not options.non_recursive,
+                                 verbose=not options.quiet,
+                                 jobs=options.jobs,
+                                 incremental=options.incremental,
+                                 bundle=options.bundle)
+        except CompileError, error:
+            sys.stderr.write('%s\n' % error)
+            sys.exit(1)
 
 
 if __name__ == '__main__':
@@ -0,0 +1,33 @@
+# Compiled by Symplate from: /root/package/tests/symplates/TestBytesOutput/sub.symp
+# coding: utf-8
+
+import symplate
+
+def _render(_renderer, x):
+    filt = symplate.html_filter
+    render = _renderer.render
+    _output = []
+    _writes = _output.extend
+
+    _writes((
+        u'<\xe9',
+        filt(x),
+        u'>',
+    ))
+
+    return symplate.Markup(u''.join(_output))
+
+def _render_bytes(_renderer, x):
+    filt = symplate.html_bytes_filter
+    render = _renderer.render
+    _render_sub = _renderer.render_bytes
+    _output = []
+    _writes = _output.extend
+
+    _writes((
+        '<\xc3\xa9',
+        filt(x),
+        '>',
+    ))
+
+    return ''.join(_output)
@@ -0,0 +1,45 @@
+# Compiled by Symplate from: /root/package/tests/symplates/TestBytesOutput/test_cache_1.symp
+# coding: utf-8
+
+import symplate
+
+def _render(_renderer, x):
+    filt = symplate.html_filter
+    render = _renderer.render
+    _output = []
+    _writes = _output.extend
+
+    _key1, _ttl1 = symplate._cache_args('/root/package/tests/symplates/TestBytesOutput/test_cache_1.symp:ed3b9ec5eedff2fa665aa187086aaa070d4b8622:1', 1)
+    _fragment1 = _renderer.fragment_cache.get(_key1)
+    if _fragment1 is not None:
+        _writes((_fragment1,))
+    else:
+        _mark1 = len(_output)
+        _writes((
+            u'\xe9',
+            filt(x),
+        ))
+        _renderer.fragment_cache.set(_key1, u''.join(_output[_mark1:]), _ttl1)
+
+    return symplate.Markup(u''.join(_output))
+
+def _render_bytes(_renderer, x):
+    filt = symplate.html_bytes_filter
+    render = _renderer.render
+    _render_sub = _renderer.render_bytes
+    _output = []
+    _writes = _output.extend
+
+    _key1, _ttl1 = symplate._cache_args('/root/package/tests/symplates/TestBytesOutput/test_cache_1.symp:ed3b9ec5eedff2fa665aa187086aaa070d4b8622:1:bytes', 1)
+    _fragment1 = _renderer.fragment_cache.get(_key1)
+    if _fragment1 is not None:
+        _writes((_fragment1,))
+    else:
+        _mark1 = len(_output)
+        _writes((
+            '\xc3\xa9',
+            filt(x),
+        ))
+        _renderer.fragment_cache.set(_key1, ''.join(_output[_mark1:]), _ttl1)
+
+    return ''.join(_output)
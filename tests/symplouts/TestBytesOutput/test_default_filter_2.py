@@ -0,0 +1,29 @@
+# Compiled by Symplate from: /root/package/tests/symplates/TestBytesOutput/test_default_filter_2.symp
+# coding: utf-8
+
+import symplate
+
+def _render(_renderer, x):
+    filt = symplate.text_filter
+    render = _renderer.render
+    _output = []
+    _writes = _output.extend
+
+    _writes((
+        filt(x),
+    ))
+
+    return u''.join(_output)
+
+def _render_bytes(_renderer, x):
+    filt = symplate.text_bytes_filter
+    render = _renderer.render
+    _render_sub = _renderer.render_bytes
+    _output = []
+    _writes = _output.extend
+
+    _writes((
+        filt(x),
+    ))
+
+    return ''.join(_output)
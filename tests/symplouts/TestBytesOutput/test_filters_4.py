@@ -0,0 +1,45 @@
+# Compiled by Symplate from: /root/package/tests/symplates/TestBytesOutput/test_filters_4.symp
+# coding: utf-8
+
+import symplate
+
+def _render(_renderer, a, b, c, d, e):
+    filt = symplate.html_filter
+    render = _renderer.render
+    _output = []
+    _writes = _output.extend
+
+    _writes((
+        filt(a),
+        u'|',
+        filt(b),
+        u'|',
+        filt(c),
+        u'|',
+        filt(d),
+        u'|',
+        filt(e),
+    ))
+
+    return symplate.Markup(u''.join(_output))
+
+def _render_bytes(_renderer, a, b, c, d, e):
+    filt = symplate.html_bytes_filter
+    render = _renderer.render
+    _render_sub = _renderer.render_bytes
+    _output = []
+    _writes = _output.extend
+
+    _writes((
+        filt(a),
+        '|',
+        filt(b),
+        '|',
+        filt(c),
+        '|',
+        filt(d),
+        '|',
+        filt(e),
+    ))
+
+    return ''.join(_output)
@@ -0,0 +1,17 @@
+# Compiled by Symplate from: /root/package/tests/symplates/TestBytesOutput/test_not_compiled_with_bytes_5.symp
+# coding: utf-8
+
+import symplate
+
+def _render(_renderer, x):
+    filt = symplate.html_filter
+    render = _renderer.render
+    _output = []
+    _writes = _output.extend
+
+    _writes((
+        u'\xe9',
+        filt(x),
+    ))
+
+    return symplate.Markup(u''.join(_output))
@@ -0,0 +1,31 @@
+# Compiled by Symplate from: /root/package/tests/symplates/TestBytesOutput/test_raw_6.symp
+# coding: utf-8
+
+import symplate
+
+def _render(_renderer, x, y):
+    filt = symplate.html_filter
+    render = _renderer.render
+    _output = []
+    _writes = _output.extend
+
+    _writes((
+        x,
+        y,
+    ))
+
+    return symplate.Markup(u''.join(_output))
+
+def _render_bytes(_renderer, x, y):
+    filt = symplate.html_bytes_filter
+    render = _renderer.render
+    _render_sub = _renderer.render_bytes
+    _output = []
+    _writes = _output.extend
+
+    _writes((
+        symplate._to_bytes(x),
+        symplate._to_bytes(y),
+    ))
+
+    return ''.join(_output)
@@ -0,0 +1,56 @@
+# Compiled by Symplate from: /root/package/tests/symplates/TestBytesOutput/test_set_filter_7.symp
+# coding: utf-8
+
+import symplate
+
+def _render(_renderer, x):
+    filt = symplate.html_filter
+    render = _renderer.render
+    _output = []
+    _writes = _output.extend
+
+    filt = symplate.text_filter
+    _writes((
+        filt(x),
+        u'\n',
+    ))
+    filt = lambda s: s.upper()  # comment
+    _writes((
+        filt(x),
+        u'\n',
+    ))
+    filt = symplate.html_filter
+    _writes((
+        filt(x),
+        u'\n',
+    ))
+
+    return symplate.Markup(u''.join(_output))
+
+def _render_bytes(_renderer, x):
+    filt = symplate.html_bytes_filter
+    render = _renderer.render
+    _render_sub = _renderer.render_bytes
+    _output = []
+    _writes = _output.extend
+
+    filt = symplate.text_filter
+    filt = symplate._bytes_filter(filt)
+    _writes((
+        filt(x),
+        '\n',
+    ))
+    filt = lambda s: s.upper()  # comment
+    filt = symplate._bytes_filter(filt)
+    _writes((
+        filt(x),
+        '\n',
+    ))
+    filt = symplate.html_filter
+    filt = symplate._bytes_filter(filt)
+    _writes((
+        filt(x),
+        '\n',
+    ))
+
+    return ''.join(_output)
@@ -0,0 +1,62 @@
+# Compiled by Symplate from: /root/package/tests/symplates/TestBytesOutput/test_sub_template_8.symp
+# coding: utf-8
+
+import symplate
+
+def _render(_renderer, ):
+    filt = symplate.html_filter
+    render = _renderer.render
+    _output = []
+    _writes = _output.extend
+
+    _inline_0(_renderer, _output, 'TestBytesOutput/sub', '&')
+    _writes((
+        filt(render('TestBytesOutput/sub', 1)),
+    ))
+
+    return symplate.Markup(u''.join(_output))
+
+def _render_bytes(_renderer, ):
+    filt = symplate.html_bytes_filter
+    render = _renderer.render
+    _render_sub = _renderer.render_bytes
+    _output = []
+    _writes = _output.extend
+
+    _inline_0_bytes(_renderer, _output, 'TestBytesOutput/sub', '&')
+    _writes((
+        filt(render('TestBytesOutput/sub', 1)),
+    ))
+
+    return ''.join(_output)
+
+# Inlined from: /root/package/tests/symplates/TestBytesOutput/sub.symp
+def _inline_0():
+
+    def _render_into(_renderer, _output, _name, x):
+        filt = symplate.html_filter
+        render = _renderer.render
+        _writes = _output.extend
+
+        _writes((
+            u'<\xe9',
+            filt(x),
+            u'>',
+        ))
+
+    def _render_bytes_into(_renderer, _output, _name, x):
+        filt = symplate.html_bytes_filter
+        render = _renderer.render
+        _render_sub = _renderer.render_bytes
+        _writes = _output.extend
+
+        _writes((
+            '<\xc3\xa9',
+            filt(x),
+            '>',
+        ))
+
+    return _render_into, _render_bytes_into
+_inline_0, _inline_0_bytes = _inline_0()
+
+_depends = ('TestBytesOutput/sub',)
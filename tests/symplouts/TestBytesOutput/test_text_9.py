@@ -0,0 +1,31 @@
+# Compiled by Symplate from: /root/package/tests/symplates/TestBytesOutput/test_text_9.symp
+# coding: utf-8
+
+import symplate
+
+def _render(_renderer, ):
+    filt = symplate.html_filter
+    render = _renderer.render
+    _output = []
+    _writes = _output.extend
+
+    _writes((
+        ur"""line one "“quoted”"
+line two """ u'"""' ur""" \u0041 and more text here
+""" ,
+    ))
+
+    return symplate.Markup(u''.join(_output))
+
+def _render_bytes(_renderer, ):
+    filt = symplate.html_bytes_filter
+    render = _renderer.render
+    _render_sub = _renderer.render_bytes
+    _output = []
+    _writes = _output.extend
+
+    _writes((
+        'line one "\xe2\x80\x9cquoted\xe2\x80\x9d"\nline two """ \\u0041 and more text here\n',
+    ))
+
+    return ''.join(_output)
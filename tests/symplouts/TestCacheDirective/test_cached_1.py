@@ -0,0 +1,31 @@
+# Compiled by Symplate from: /root/package/tests/symplates/TestCacheDirective/test_cached_1.symp
+# coding: utf-8
+
+import symplate
+
+def _render(_renderer, calls, key):
+    filt = symplate.html_filter
+    render = _renderer.render
+    _output = []
+    _writes = _output.extend
+
+    _writes((
+        u'a\n',
+    ))
+    _key1, _ttl1 = symplate._cache_args('/root/package/tests/symplates/TestCacheDirective/test_cached_1.symp:610ccadf7edd506bef4e635fa311f410669a03f7:1', key)
+    _fragment1 = _renderer.fragment_cache.get(_key1)
+    if _fragment1 is not None:
+        _writes((_fragment1,))
+    else:
+        _mark1 = len(_output)
+        calls.append(key)
+        _writes((
+            filt(key),
+            u'\n',
+        ))
+        _renderer.fragment_cache.set(_key1, u''.join(_output[_mark1:]), _ttl1)
+    _writes((
+        u'b\n',
+    ))
+
+    return symplate.Markup(u''.join(_output))
@@ -0,0 +1,23 @@
+# Compiled by Symplate from: /root/package/tests/symplates/TestCacheDirective/test_custom_backend_2.symp
+# coding: utf-8
+
+import symplate
+
+def _render(_renderer, ):
+    filt = symplate.html_filter
+    render = _renderer.render
+    _output = []
+    _writes = _output.extend
+
+    _key1, _ttl1 = symplate._cache_args('/root/package/tests/symplates/TestCacheDirective/test_custom_backend_2.symp:d761eec66851aed2b0f736510e2e97b9304c594b:1', 'k')
+    _fragment1 = _renderer.fragment_cache.get(_key1)
+    if _fragment1 is not None:
+        _writes((_fragment1,))
+    else:
+        _mark1 = len(_output)
+        _writes((
+            u'v',
+        ))
+        _renderer.fragment_cache.set(_key1, u''.join(_output[_mark1:]), _ttl1)
+
+    return symplate.Markup(u''.join(_output))
@@ -0,0 +1,44 @@
+# Compiled by Symplate from: /root/package/tests/symplates/TestCacheDirective/test_nested_3.symp
+# coding: utf-8
+
+import symplate
+
+def _render(_renderer, x, y):
+    filt = symplate.html_filter
+    render = _renderer.render
+    _output = []
+    _writes = _output.extend
+
+    def inner():
+        _key1, _ttl1 = symplate._cache_args('/root/package/tests/symplates/TestCacheDirective/test_nested_3.symp:4bcda073630aa17ca22b80cc1bc539ec26d9cf31:1', 'inner', ttl=60)
+        _fragment1 = _renderer.fragment_cache.get(_key1)
+        if _fragment1 is not None:
+            _writes((_fragment1,))
+        else:
+            _mark1 = len(_output)
+            _writes((
+                u'[',
+                filt(y),
+                u']',
+            ))
+            _renderer.fragment_cache.set(_key1, u''.join(_output[_mark1:]), _ttl1)
+        _writes((
+            u'\n',
+        ))
+    _key2, _ttl2 = symplate._cache_args('/root/package/tests/symplates/TestCacheDirective/test_nested_3.symp:4bcda073630aa17ca22b80cc1bc539ec26d9cf31:2', 'outer')
+    _fragment2 = _renderer.fragment_cache.get(_key2)
+    if _fragment2 is not None:
+        _writes((_fragment2,))
+    else:
+        _mark2 = len(_output)
+        for c in x:
+            _writes((
+                filt(c),
+            ))
+            inner()
+        _renderer.fragment_cache.set(_key2, u''.join(_output[_mark2:]), _ttl2)
+    _writes((
+        u'\n',
+    ))
+
+    return symplate.Markup(u''.join(_output))
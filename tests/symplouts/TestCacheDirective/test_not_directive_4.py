@@ -0,0 +1,20 @@
+# Compiled by Symplate from: /root/package/tests/symplates/TestCacheDirective/test_not_directive_4.symp
+# coding: utf-8
+
+import symplate
+
+def _render(_renderer, ):
+    filt = symplate.html_filter
+    render = _renderer.render
+    _output = []
+    _writes = _output.extend
+
+    cache = {}
+    cache[1] = 2
+    cache = cache[1]
+    cache += 1
+    _writes((
+        filt(cache),
+    ))
+
+    return symplate.Markup(u''.join(_output))
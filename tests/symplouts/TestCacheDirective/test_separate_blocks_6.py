@@ -0,0 +1,36 @@
+# Compiled by Symplate from: /root/package/tests/symplates/TestCacheDirective/test_separate_blocks_6.symp
+# coding: utf-8
+
+import symplate
+
+def _render(_renderer, x):
+    filt = symplate.html_filter
+    render = _renderer.render
+    _output = []
+    _writes = _output.extend
+
+    _key1, _ttl1 = symplate._cache_args('/root/package/tests/symplates/TestCacheDirective/test_separate_blocks_6.symp:f85c27803cabaf6ca34f9602e7a8edddce9fe1c1:1', 'k')
+    _fragment1 = _renderer.fragment_cache.get(_key1)
+    if _fragment1 is not None:
+        _writes((_fragment1,))
+    else:
+        _mark1 = len(_output)
+        _writes((
+            filt(x),
+        ))
+        _renderer.fragment_cache.set(_key1, u''.join(_output[_mark1:]), _ttl1)
+    _writes((
+        u'-',
+    ))
+    _key2, _ttl2 = symplate._cache_args('/root/package/tests/symplates/TestCacheDirective/test_separate_blocks_6.symp:f85c27803cabaf6ca34f9602e7a8edddce9fe1c1:2', 'k')
+    _fragment2 = _renderer.fragment_cache.get(_key2)
+    if _fragment2 is not None:
+        _writes((_fragment2,))
+    else:
+        _mark2 = len(_output)
+        _writes((
+            filt(x * 2),
+        ))
+        _renderer.fragment_cache.set(_key2, u''.join(_output[_mark2:]), _ttl2)
+
+    return symplate.Markup(u''.join(_output))
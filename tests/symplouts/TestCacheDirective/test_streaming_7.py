@@ -0,0 +1,56 @@
+# Compiled by Symplate from: /root/package/tests/symplates/TestCacheDirective/test_streaming_7.symp
+# coding: utf-8
+
+import symplate
+
+def _render(_renderer, n):
+    filt = symplate.html_filter
+    render = _renderer.render
+    _output = []
+    _writes = _output.extend
+
+    _key1, _ttl1 = symplate._cache_args('/root/package/tests/symplates/TestCacheDirective/test_streaming_7.symp:2d60f41322155e5e3b8b19cf01b9c5dfdd640a1d:1', 'k')
+    _fragment1 = _renderer.fragment_cache.get(_key1)
+    if _fragment1 is not None:
+        _writes((_fragment1,))
+    else:
+        _mark1 = len(_output)
+        for i in range(n):
+            _writes((
+                u'.',
+            ))
+        _renderer.fragment_cache.set(_key1, u''.join(_output[_mark1:]), _ttl1)
+    _writes((
+        u'!',
+    ))
+
+    return symplate.Markup(u''.join(_output))
+
+def _render_iter(_renderer, n):
+    filt = symplate.html_filter
+    render = _renderer.render
+    _stream = _renderer.render_iter
+    _output = []
+    _writes = _output.extend
+    _flush_items = _renderer.stream_chunk_items
+
+    _key1, _ttl1 = symplate._cache_args('/root/package/tests/symplates/TestCacheDirective/test_streaming_7.symp:2d60f41322155e5e3b8b19cf01b9c5dfdd640a1d:1', 'k')
+    _fragment1 = _renderer.fragment_cache.get(_key1)
+    if _fragment1 is not None:
+        _writes((_fragment1,))
+    else:
+        _mark1 = len(_output)
+        for i in range(n):
+            _writes((
+                u'.',
+            ))
+        _renderer.fragment_cache.set(_key1, u''.join(_output[_mark1:]), _ttl1)
+    _writes((
+        u'!',
+    ))
+    if len(_output) >= _flush_items:
+        yield u''.join(_output)
+        del _output[:]
+
+    if _output:
+        yield u''.join(_output)
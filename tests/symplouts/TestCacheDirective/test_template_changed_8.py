@@ -0,0 +1,23 @@
+# Compiled by Symplate from: /root/package/tests/symplates/TestCacheDirective/test_template_changed_8.symp
+# coding: utf-8
+
+import symplate
+
+def _render(_renderer, ):
+    filt = symplate.html_filter
+    render = _renderer.render
+    _output = []
+    _writes = _output.extend
+
+    _key1, _ttl1 = symplate._cache_args('/root/package/tests/symplates/TestCacheDirective/test_template_changed_8.symp:d79f288a739f596ceebe691d92ce9d462487b80e:1', 'k')
+    _fragment1 = _renderer.fragment_cache.get(_key1)
+    if _fragment1 is not None:
+        _writes((_fragment1,))
+    else:
+        _mark1 = len(_output)
+        _writes((
+            u'new',
+        ))
+        _renderer.fragment_cache.set(_key1, u''.join(_output[_mark1:]), _ttl1)
+
+    return symplate.Markup(u''.join(_output))
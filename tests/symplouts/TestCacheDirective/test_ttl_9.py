@@ -0,0 +1,24 @@
+# Compiled by Symplate from: /root/package/tests/symplates/TestCacheDirective/test_ttl_9.symp
+# coding: utf-8
+
+import symplate
+
+def _render(_renderer, calls, ttl):
+    filt = symplate.html_filter
+    render = _renderer.render
+    _output = []
+    _writes = _output.extend
+
+    _key1, _ttl1 = symplate._cache_args('/root/package/tests/symplates/TestCacheDirective/test_ttl_9.symp:b4bd0ef7ffded37efb000a4c3b60f4d9a0f79d5a:1', 0, ttl)
+    _fragment1 = _renderer.fragment_cache.get(_key1)
+    if _fragment1 is not None:
+        _writes((_fragment1,))
+    else:
+        _mark1 = len(_output)
+        calls.append(1)
+        _writes((
+            filt(len(calls)),
+        ))
+        _renderer.fragment_cache.set(_key1, u''.join(_output[_mark1:]), _ttl1)
+
+    return symplate.Markup(u''.join(_output))
@@ -0,0 +1,17 @@
+# Compiled by Symplate from: /root/package/tests/symplates/TestCodeBlocks/test_after_template_1.symp
+# coding: utf-8
+
+import symplate
+
+def _render(_renderer, ):
+    filt = symplate.html_filter
+    render = _renderer.render
+    _output = []
+    _writes = _output.extend
+
+    _writes((
+        filt(g()),
+    ))
+
+    return symplate.Markup(u''.join(_output))
+def g(): return 'wxy'
@@ -0,0 +1,17 @@
+# Compiled by Symplate from: /root/package/tests/symplates/TestCodeBlocks/test_before_template_2.symp
+# coding: utf-8
+
+import symplate
+def f(): return 'xyz'
+
+def _render(_renderer, ):
+    filt = symplate.html_filter
+    render = _renderer.render
+    _output = []
+    _writes = _output.extend
+
+    _writes((
+        filt(f()),
+    ))
+
+    return symplate.Markup(u''.join(_output))
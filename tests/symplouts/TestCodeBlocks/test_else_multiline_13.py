@@ -0,0 +1,23 @@
+# Compiled by Symplate from: /root/package/tests/symplates/TestCodeBlocks/test_else_multiline_13.symp
+# coding: utf-8
+
+import symplate
+
+def _render(_renderer, x):
+    filt = symplate.html_filter
+    render = _renderer.render
+    _output = []
+    _writes = _output.extend
+
+    
+    if x == 0:
+        y = 'a'
+    elif x == 1:
+        y = 'b'
+    else:
+        y = 'c'
+    _writes((
+        filt(y),
+    ))
+
+    return symplate.Markup(u''.join(_output))
@@ -0,0 +1,21 @@
+# Compiled by Symplate from: /root/package/tests/symplates/TestCodeBlocks/test_else_oneline_15.symp
+# coding: utf-8
+
+import symplate
+
+def _render(_renderer, x):
+    filt = symplate.html_filter
+    render = _renderer.render
+    _output = []
+    _writes = _output.extend
+
+    if x:
+        _writes((
+            u't',
+        ))
+    else:
+        _writes((
+            u'f',
+        ))
+
+    return symplate.Markup(u''.join(_output))
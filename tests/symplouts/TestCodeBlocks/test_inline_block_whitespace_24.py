@@ -0,0 +1,34 @@
+# Compiled by Symplate from: /root/package/tests/symplates/TestCodeBlocks/test_inline_block_whitespace_24.symp
+# coding: utf-8
+
+import symplate
+
+def _render(_renderer, ):
+    filt = symplate.html_filter
+    render = _renderer.render
+    _output = []
+    _writes = _output.extend
+
+    if 1:
+        _writes((
+            u'true',
+        ))
+    _writes((
+        u'\n    A',
+    ))
+    if 1:
+        _writes((
+            u'true',
+        ))
+    _writes((
+        u'B\n',
+    ))
+    if 1:
+        _writes((
+            u'true',
+        ))
+    _writes((
+        u'\n\nfoo',
+    ))
+
+    return symplate.Markup(u''.join(_output))
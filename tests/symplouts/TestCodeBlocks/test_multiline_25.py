@@ -0,0 +1,22 @@
+# Compiled by Symplate from: /root/package/tests/symplates/TestCodeBlocks/test_multiline_25.symp
+# coding: utf-8
+
+import symplate
+
+def _render(_renderer, ):
+    filt = symplate.html_filter
+    render = _renderer.render
+    _output = []
+    _writes = _output.extend
+
+    
+    # these are some
+    # comments
+    def func():
+        return 'bar'
+    _writes((
+        filt(func()),
+        u'\n',
+    ))
+
+    return symplate.Markup(u''.join(_output))
@@ -0,0 +1,20 @@
+# Compiled by Symplate from: /root/package/tests/symplates/TestCodeBlocks/test_normal_block_whitespace_28.symp
+# coding: utf-8
+
+import symplate
+
+def _render(_renderer, ):
+    filt = symplate.html_filter
+    render = _renderer.render
+    _output = []
+    _writes = _output.extend
+
+    if 1:
+        _writes((
+            u'true\n',
+        ))
+    _writes((
+        u'\nfoo',
+    ))
+
+    return symplate.Markup(u''.join(_output))
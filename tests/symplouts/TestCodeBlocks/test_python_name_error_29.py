@@ -0,0 +1,14 @@
+# Compiled by Symplate from: /root/package/tests/symplates/TestCodeBlocks/test_python_name_error_29.symp
+# coding: utf-8
+
+import symplate
+
+def _render(_renderer, ):
+    filt = symplate.html_filter
+    render = _renderer.render
+    _output = []
+    _writes = _output.extend
+
+    asdf
+
+    return symplate.Markup(u''.join(_output))
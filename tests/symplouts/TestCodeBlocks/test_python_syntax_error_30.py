@@ -0,0 +1,14 @@
+# Compiled by Symplate from: /root/package/tests/symplates/TestCodeBlocks/test_python_syntax_error_30.symp
+# coding: utf-8
+
+import symplate
+
+def _render(_renderer, ):
+    filt = symplate.html_filter
+    render = _renderer.render
+    _output = []
+    _writes = _output.extend
+
+    $$$
+
+    return symplate.Markup(u''.join(_output))
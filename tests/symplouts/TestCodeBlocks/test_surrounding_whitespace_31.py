@@ -0,0 +1,20 @@
+# Compiled by Symplate from: /root/package/tests/symplates/TestCodeBlocks/test_surrounding_whitespace_31.symp
+# coding: utf-8
+
+import symplate
+
+def _render(_renderer, ):
+    filt = symplate.html_filter
+    render = _renderer.render
+    _output = []
+    _writes = _output.extend
+
+    _writes((
+        u'a',
+    ))
+    #comment
+    _writes((
+        u'b',
+    ))
+
+    return symplate.Markup(u''.join(_output))
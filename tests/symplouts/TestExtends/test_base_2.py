@@ -0,0 +1,47 @@
+# Compiled by Symplate from: /root/package/tests/symplates/TestExtends/test_base_2.symp
+# coding: utf-8
+
+import symplate
+
+def _render(_renderer, title='Untitled', items=()):
+    filt = symplate.html_filter
+    render = _renderer.render
+    _output = []
+    _writes = _output.extend
+
+    _writes((
+        u'<title>',
+    ))
+    _writes((
+        filt(title),
+    ))
+    _writes((
+        u'</title>\n',
+    ))
+    _writes((
+        u'<ul>\n',
+    ))
+    for item in items:
+        _writes((
+            u'<li>',
+        ))
+        _writes((
+            filt(item),
+        ))
+        _writes((
+            u'</li>\n',
+        ))
+    _writes((
+        u'</ul>\n',
+    ))
+    _writes((
+        u'<p>',
+    ))
+    _writes((
+        u'footer',
+    ))
+    _writes((
+        u'</p>\n',
+    ))
+
+    return symplate.Markup(u''.join(_output))
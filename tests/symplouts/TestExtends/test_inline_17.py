@@ -0,0 +1,55 @@
+# Compiled by Symplate from: /root/package/tests/symplates/TestExtends/test_inline_17.symp
+# coding: utf-8
+
+import symplate
+
+def _render(_renderer, ):
+    filt = symplate.html_filter
+    render = _renderer.render
+    _output = []
+    _writes = _output.extend
+
+    _writes((
+        u'(',
+    ))
+    _inline_0(_renderer, _output, 'TestExtends/sub', 'Sub')
+    _writes((
+        u')',
+    ))
+
+    return symplate.Markup(u''.join(_output))
+
+# Inlined from: /root/package/tests/symplates/TestExtends/sub.symp
+def _inline_0():
+
+    def _render_into(_renderer, _output, _name, title='Untitled', items=()):
+        filt = symplate.html_filter
+        render = _renderer.render
+        _writes = _output.extend
+
+        _writes((
+            u'<title>',
+        ))
+        _writes((
+            filt(title),
+        ))
+        _writes((
+            u'</title>\n',
+        ))
+        _writes((
+            u'sub',
+        ))
+        _writes((
+            u'\n<p>',
+        ))
+        _writes((
+            u'footer',
+        ))
+        _writes((
+            u'</p>\n',
+        ))
+
+    return _render_into
+_inline_0 = _inline_0()
+
+_depends = (u'TestExtends/base', 'TestExtends/sub')
@@ -0,0 +1,53 @@
+# Compiled by Symplate from: /root/package/tests/symplates/TestExtends/test_line_numbers_18.symp
+# coding: utf-8
+
+import symplate
+
+def _render(_renderer, title='Untitled', items=()):  # line: /root/package/tests/symplates/TestExtends/base.symp:1
+    filt = symplate.html_filter
+    render = _renderer.render
+    _output = []
+    _writes = _output.extend
+
+    _writes((  # line: /root/package/tests/symplates/TestExtends/base.symp:2
+        u'<title>',  # line: /root/package/tests/symplates/TestExtends/base.symp:2
+    ))
+    _writes((  # line: /root/package/tests/symplates/TestExtends/base.symp:2
+        filt(title),  # line: /root/package/tests/symplates/TestExtends/base.symp:2
+    ))
+    _writes((  # line: /root/package/tests/symplates/TestExtends/base.symp:2
+        u'</title>\n',  # line: /root/package/tests/symplates/TestExtends/base.symp:2
+    ))
+    _writes((  # line: /root/package/tests/symplates/TestExtends/base.symp:4
+        u'<ul>\n',  # line: /root/package/tests/symplates/TestExtends/base.symp:4
+    ))
+    for item in items:  # line: /root/package/tests/symplates/TestExtends/base.symp:5
+        _writes((  # line: /root/package/tests/symplates/TestExtends/base.symp:6
+            u'<li>',  # line: /root/package/tests/symplates/TestExtends/base.symp:6
+        ))
+        _writes((  # line: 3
+            u'\n[',  # line: 3
+            filt(item * 2),  # line: 4
+            u']\n',  # line: 4
+        ))
+        _writes((  # line: /root/package/tests/symplates/TestExtends/base.symp:6
+            u'</li>\n',  # line: /root/package/tests/symplates/TestExtends/base.symp:6
+        ))
+    _writes((  # line: /root/package/tests/symplates/TestExtends/base.symp:8
+        u'</ul>\n',  # line: /root/package/tests/symplates/TestExtends/base.symp:8
+    ))
+    _writes((  # line: /root/package/tests/symplates/TestExtends/base.symp:10
+        u'<p>',  # line: /root/package/tests/symplates/TestExtends/base.symp:10
+    ))
+    _writes((  # line: /root/package/tests/symplates/TestExtends/base.symp:10
+        u'footer',  # line: /root/package/tests/symplates/TestExtends/base.symp:10
+    ))
+    _writes((  # line: /root/package/tests/symplates/TestExtends/base.symp:10
+        u'</p>\n',  # line: /root/package/tests/symplates/TestExtends/base.symp:10
+    ))
+
+    return symplate.Markup(u''.join(_output))  # line: /root/package/tests/symplates/TestExtends/base.symp:11
+
+_depends = (u'TestExtends/base',)
+
+_line_map = {6: (u'/root/package/tests/symplates/TestExtends/base.symp', 1), 7: (u'/root/package/tests/symplates/TestExtends/base.symp', 1), 8: (u'/root/package/tests/symplates/TestExtends/base.symp', 1), 9: (u'/root/package/tests/symplates/TestExtends/base.symp', 1), 10: (u'/root/package/tests/symplates/TestExtends/base.symp', 1), 11: (u'/root/package/tests/symplates/TestExtends/base.symp', 1), 12: (u'/root/package/tests/symplates/TestExtends/base.symp', 2), 13: (u'/root/package/tests/symplates/TestExtends/base.symp', 2), 14: (u'/root/package/tests/symplates/TestExtends/base.symp', 2), 15: (u'/root/package/tests/symplates/TestExtends/base.symp', 2), 16: (u'/root/package/tests/symplates/TestExtends/base.symp', 2), 17: (u'/root/package/tests/symplates/TestExtends/base.symp', 2), 18: (u'/root/package/tests/symplates/TestExtends/base.symp', 2), 19: (u'/root/package/tests/symplates/TestExtends/base.symp', 2), 20: (u'/root/package/tests/symplates/TestExtends/base.symp', 2), 21: (u'/root/package/tests/symplates/TestExtends/base.symp', 4), 22: (u'/root/package/tests/symplates/TestExtends/base.symp', 4), 23: (u'/root/package/tests/symplates/TestExtends/base.symp', 4), 24: (u'/root/package/tests/symplates/TestExtends/base.symp', 5), 25: (u'/root/package/tests/symplates/TestExtends/base.symp', 6), 26: (u'/root/package/tests/symplates/TestExtends/base.symp', 6), 27: (u'/root/package/tests/symplates/TestExtends/base.symp', 6), 28: ('/root/package/tests/symplates/TestExtends/test_line_numbers_18.symp', 3), 29: ('/root/package/tests/symplates/TestExtends/test_line_numbers_18.symp', 3), 30: ('/root/package/tests/symplates/TestExtends/test_line_numbers_18.symp', 4), 31: ('/root/package/tests/symplates/TestExtends/test_line_numbers_18.symp', 4), 32: ('/root/package/tests/symplates/TestExtends/test_line_numbers_18.symp', 4), 33: (u'/root/package/tests/symplates/TestExtends/base.symp', 6), 34: (u'/root/package/tests/symplates/TestExtends/base.symp', 6), 35: (u'/root/package/tests/symplates/TestExtends/base.symp', 6), 36: (u'/root/package/tests/symplates/TestExtends/base.symp', 8), 37: (u'/root/package/tests/symplates/TestExtends/base.symp', 8), 38: (u'/root/package/tests/symplates/TestExtends/base.symp', 8), 39: (u'/root/package/tests/symplates/TestExtends/base.symp', 10), 40: (u'/root/package/tests/symplates/TestExtends/base.symp', 10), 41: (u'/root/package/tests/symplates/TestExtends/base.symp', 10), 42: (u'/root/package/tests/symplates/TestExtends/base.symp', 10), 43: (u'/root/package/tests/symplates/TestExtends/base.symp', 10), 44: (u'/root/package/tests/symplates/TestExtends/base.symp', 10), 45: (u'/root/package/tests/symplates/TestExtends/base.symp', 10), 46: (u'/root/package/tests/symplates/TestExtends/base.symp', 10), 47: (u'/root/package/tests/symplates/TestExtends/base.symp', 10), 48: (u'/root/package/tests/symplates/TestExtends/base.symp', 10), 49: (u'/root/package/tests/symplates/TestExtends/base.symp', 11), 50: (u'/root/package/tests/symplates/TestExtends/base.symp', 11), 51: (u'/root/package/tests/symplates/TestExtends/base.symp', 11)}
@@ -0,0 +1,42 @@
+# Compiled by Symplate from: /root/package/tests/symplates/TestExtends/test_multi_level_19.symp
+# coding: utf-8
+
+import symplate
+
+def _render(_renderer, title='Untitled', items=()):
+    filt = symplate.html_filter
+    render = _renderer.render
+    _output = []
+    _writes = _output.extend
+
+    _writes((
+        u'<title>',
+    ))
+    _writes((
+        filt(title),
+    ))
+    _writes((
+        u'</title>\n',
+    ))
+    _writes((
+        u'<div>',
+    ))
+    _writes((
+        u'child',
+    ))
+    _writes((
+        u'</div>\n',
+    ))
+    _writes((
+        u'<p>',
+    ))
+    _writes((
+        u'middle footer',
+    ))
+    _writes((
+        u'</p>\n',
+    ))
+
+    return symplate.Markup(u''.join(_output))
+
+_depends = (u'TestExtends/base', u'TestExtends/middle')
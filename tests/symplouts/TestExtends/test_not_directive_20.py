@@ -0,0 +1,18 @@
+# Compiled by Symplate from: /root/package/tests/symplates/TestExtends/test_not_directive_20.symp
+# coding: utf-8
+
+import symplate
+
+def _render(_renderer, ):
+    filt = symplate.html_filter
+    render = _renderer.render
+    _output = []
+    _writes = _output.extend
+
+    extends = ['a']
+    extends += ['b']
+    _writes((
+        filt(extends[0] + extends[1]),
+    ))
+
+    return symplate.Markup(u''.join(_output))
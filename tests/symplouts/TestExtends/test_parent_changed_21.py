@@ -0,0 +1,24 @@
+# Compiled by Symplate from: /root/package/tests/symplates/TestExtends/test_parent_changed_21.symp
+# coding: utf-8
+
+import symplate
+
+def _render(_renderer, ):
+    filt = symplate.html_filter
+    render = _renderer.render
+    _output = []
+    _writes = _output.extend
+
+    _writes((
+        u'[',
+    ))
+    _writes((
+        u'x',
+    ))
+    _writes((
+        u']',
+    ))
+
+    return symplate.Markup(u''.join(_output))
+
+_depends = (u'TestExtends/changed',)
@@ -0,0 +1,37 @@
+# Compiled by Symplate from: /root/package/tests/symplates/TestExtends/test_template_args_23.symp
+# coding: utf-8
+
+import symplate
+import os
+
+def _render(_renderer, name):
+    filt = symplate.html_filter
+    render = _renderer.render
+    _output = []
+    _writes = _output.extend
+
+    _writes((
+        u'<title>',
+    ))
+    _writes((
+        filt(name),
+    ))
+    _writes((
+        u'</title>\n',
+    ))
+    _writes((
+        filt(os.path.basename(name)),
+    ))
+    _writes((
+        u'\n<p>',
+    ))
+    _writes((
+        u'footer',
+    ))
+    _writes((
+        u'</p>\n',
+    ))
+
+    return symplate.Markup(u''.join(_output))
+
+_depends = (u'TestExtends/base',)
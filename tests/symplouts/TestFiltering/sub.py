@@ -0,0 +1,18 @@
+# Compiled by Symplate from: /root/package/tests/symplates/TestFiltering/sub.symp
+# coding: utf-8
+
+import symplate
+
+def _render(_renderer, x):
+    filt = symplate.html_filter
+    render = _renderer.render
+    _output = []
+    _writes = _output.extend
+
+    _writes((
+        u'<b>',
+        filt(x),
+        u'</b>',
+    ))
+
+    return symplate.Markup(u''.join(_output))
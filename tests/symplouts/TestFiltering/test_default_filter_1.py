@@ -0,0 +1,16 @@
+# Compiled by Symplate from: /root/package/tests/symplates/TestFiltering/test_default_filter_1.symp
+# coding: utf-8
+
+import symplate
+
+def _render(_renderer, ):
+    filt = symplate.html_filter
+    render = _renderer.render
+    _output = []
+    _writes = _output.extend
+
+    _writes((
+        filt('a&z'),
+    ))
+
+    return symplate.Markup(u''.join(_output))
@@ -0,0 +1,16 @@
+# Compiled by Symplate from: /root/package/tests/symplates/TestFiltering/test_override_default_filter_string_4.symp
+# coding: utf-8
+
+import symplate
+
+def _render(_renderer, ):
+    filt = lambda s: s.upper()
+    render = _renderer.render
+    _output = []
+    _writes = _output.extend
+
+    _writes((
+        filt('a&z'),
+    ))
+
+    return u''.join(_output)
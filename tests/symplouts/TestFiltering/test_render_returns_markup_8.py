@@ -0,0 +1,18 @@
+# Compiled by Symplate from: /root/package/tests/symplates/TestFiltering/test_render_returns_markup_8.symp
+# coding: utf-8
+
+import symplate
+
+def _render(_renderer, ):
+    filt = symplate.html_filter
+    render = _renderer.render
+    _output = []
+    _writes = _output.extend
+
+    _writes((
+        u'<b>',
+        filt('&'),
+        u'</b>',
+    ))
+
+    return symplate.Markup(u''.join(_output))
@@ -0,0 +1,23 @@
+# Compiled by Symplate from: /root/package/tests/symplates/TestFiltering/test_set_filter_9.symp
+# coding: utf-8
+
+import symplate
+
+def _render(_renderer, val):
+    filt = symplate.html_filter
+    render = _renderer.render
+    _output = []
+    _writes = _output.extend
+
+    filt = lambda s: repr(s)
+    _writes((
+        filt(val),
+        u'\n',
+    ))
+    filt = symplate.html_filter
+    _writes((
+        filt(val),
+        u'\n',
+    ))
+
+    return symplate.Markup(u''.join(_output))
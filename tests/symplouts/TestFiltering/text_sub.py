@@ -0,0 +1,18 @@
+# Compiled by Symplate from: /root/package/tests/symplates/TestFiltering/text_sub.symp
+# coding: utf-8
+
+import symplate
+
+def _render(_renderer, x):
+    filt = symplate.text_filter
+    render = _renderer.render
+    _output = []
+    _writes = _output.extend
+
+    _writes((
+        u'<i>',
+        filt(x),
+        u'</i>',
+    ))
+
+    return u''.join(_output)
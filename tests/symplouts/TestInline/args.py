@@ -0,0 +1,18 @@
+# Compiled by Symplate from: /root/package/tests/symplates/TestInline/args.symp
+# coding: utf-8
+
+import symplate
+
+def _render(_renderer, a, b=2, c=3):
+    filt = symplate.html_filter
+    render = _renderer.render
+    _output = []
+    _writes = _output.extend
+
+    _writes((
+        filt(a),
+        filt(b),
+        filt(c),
+    ))
+
+    return symplate.Markup(u''.join(_output))
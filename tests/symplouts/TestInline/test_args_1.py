@@ -0,0 +1,22 @@
+# Compiled by Symplate from: /root/package/tests/symplates/TestInline/test_args_1.symp
+# coding: utf-8
+
+import symplate
+
+def _render(_renderer, x):
+    filt = symplate.html_filter
+    render = _renderer.render
+    _output = []
+    _writes = _output.extend
+
+    _writes((
+        u'<',
+        render('TestInline/args', x),
+        u'>\n<',
+        render('TestInline/args', x, 5),
+        u'>\n<',
+        render('TestInline/args', c=x, b=4, a=6),
+        u'>\n',
+    ))
+
+    return symplate.Markup(u''.join(_output))
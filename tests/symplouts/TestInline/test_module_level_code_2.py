@@ -0,0 +1,36 @@
+# Compiled by Symplate from: /root/package/tests/symplates/TestInline/test_module_level_code_2.symp
+# coding: utf-8
+
+import symplate
+def helper(): return 'top'
+
+def _render(_renderer, ):
+    filt = symplate.html_filter
+    render = _renderer.render
+    _output = []
+    _writes = _output.extend
+
+    _inline_0(_renderer, _output, 'TestInline/helper')
+    _writes((
+        filt(helper()),
+    ))
+
+    return symplate.Markup(u''.join(_output))
+
+# Inlined from: /root/package/tests/symplates/TestInline/helper.symp
+def _inline_0():
+    def helper(): return 'sub'
+
+    def _render_into(_renderer, _output, _name, ):
+        filt = symplate.html_filter
+        render = _renderer.render
+        _writes = _output.extend
+
+        _writes((
+            filt(helper()),
+        ))
+
+    return _render_into
+_inline_0 = _inline_0()
+
+_depends = ('TestInline/helper',)
@@ -0,0 +1,57 @@
+# Compiled by Symplate from: /root/package/tests/symplates/TestInline/test_nested_3.symp
+# coding: utf-8
+
+import symplate
+
+def _render(_renderer, ):
+    filt = symplate.html_filter
+    render = _renderer.render
+    _output = []
+    _writes = _output.extend
+
+    x = 'top'
+    _inline_1(_renderer, _output, 'TestInline/outer', 'outer')
+    _writes((
+        filt(x),
+    ))
+
+    return symplate.Markup(u''.join(_output))
+
+# Inlined from: /root/package/tests/symplates/TestInline/inner.symp
+def _inline_0():
+
+    def _render_into(_renderer, _output, _name, ):
+        filt = symplate.html_filter
+        render = _renderer.render
+        _writes = _output.extend
+
+        x = 'inner'
+        _writes((
+            filt(x),
+        ))
+
+    return _render_into
+_inline_0 = _inline_0()
+
+# Inlined from: /root/package/tests/symplates/TestInline/outer.symp
+def _inline_1():
+
+    def _render_into(_renderer, _output, _name, x):
+        filt = symplate.html_filter
+        render = _renderer.render
+        _writes = _output.extend
+
+        _writes((
+            filt(x),
+            u'[',
+        ))
+        _inline_0(_renderer, _output, 'TestInline/inner')
+        _writes((
+            u']',
+            filt(x),
+        ))
+
+    return _render_into
+_inline_1 = _inline_1()
+
+_depends = ('TestInline/inner', 'TestInline/outer')
@@ -0,0 +1,16 @@
+# Compiled by Symplate from: /root/package/tests/symplates/TestInline/test_not_literal_4.symp
+# coding: utf-8
+
+import symplate
+
+def _render(_renderer, name):
+    filt = symplate.html_filter
+    render = _renderer.render
+    _output = []
+    _writes = _output.extend
+
+    _writes((
+        render(name),
+    ))
+
+    return symplate.Markup(u''.join(_output))
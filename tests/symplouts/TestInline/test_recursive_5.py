@@ -0,0 +1,20 @@
+# Compiled by Symplate from: /root/package/tests/symplates/TestInline/test_recursive_5.symp
+# coding: utf-8
+
+import symplate
+
+def _render(_renderer, n):
+    filt = symplate.html_filter
+    render = _renderer.render
+    _output = []
+    _writes = _output.extend
+
+    _writes((
+        filt(n),
+    ))
+    if n:
+        _writes((
+            render('TestInline/test_recursive_5', n - 1),
+        ))
+
+    return symplate.Markup(u''.join(_output))
@@ -0,0 +1,34 @@
+# Compiled by Symplate from: /root/package/tests/symplates/TestInline/test_space_before_paren_6.symp
+# coding: utf-8
+
+import symplate
+
+def _render(_renderer, ):
+    filt = symplate.html_filter
+    render = _renderer.render
+    _output = []
+    _writes = _output.extend
+
+    _inline_0(_renderer, _output, 'TestInline/space', 1)
+    _inline_0(_renderer, _output, 'TestInline/space', 2)
+
+    return symplate.Markup(u''.join(_output))
+
+# Inlined from: /root/package/tests/symplates/TestInline/space.symp
+def _inline_0():
+
+    def _render_into(_renderer, _output, _name, a):
+        filt = symplate.html_filter
+        render = _renderer.render
+        _writes = _output.extend
+
+        _writes((
+            u'<',
+            filt(a),
+            u'>',
+        ))
+
+    return _render_into
+_inline_0 = _inline_0()
+
+_depends = ('TestInline/space',)
@@ -0,0 +1,63 @@
+# Compiled by Symplate from: /root/package/tests/symplates/TestInline/test_streaming_7.symp
+# coding: utf-8
+
+import symplate
+
+def _render(_renderer, ):
+    filt = symplate.html_filter
+    render = _renderer.render
+    _output = []
+    _writes = _output.extend
+
+    _writes((
+        u'a',
+    ))
+    _inline_0(_renderer, _output, 'TestInline/streaming')
+    _writes((
+        u'b',
+    ))
+
+    return symplate.Markup(u''.join(_output))
+
+def _render_iter(_renderer, ):
+    filt = symplate.html_filter
+    render = _renderer.render
+    _stream = _renderer.render_iter
+    _output = []
+    _writes = _output.extend
+    _flush_items = _renderer.stream_chunk_items
+
+    _writes((
+        u'a',
+    ))
+    _inline_0(_renderer, _output, 'TestInline/streaming')
+    if len(_output) >= _flush_items:
+        yield u''.join(_output)
+        del _output[:]
+    _writes((
+        u'b',
+    ))
+    if len(_output) >= _flush_items:
+        yield u''.join(_output)
+        del _output[:]
+
+    if _output:
+        yield u''.join(_output)
+
+# Inlined from: /root/package/tests/symplates/TestInline/streaming.symp
+def _inline_0():
+
+    def _render_into(_renderer, _output, _name, ):
+        filt = symplate.html_filter
+        render = _renderer.render
+        _writes = _output.extend
+
+        for i in range(1000):
+            _writes((
+                u'.',
+            ))
+
+    return _render_into
+_inline_0 = _inline_0()
+
+_depends = ('TestInline/streaming',)
@@ -0,0 +1,31 @@
+# Compiled by Symplate from: /root/package/tests/symplates/TestInline/test_sub_template_changed_8.symp
+# coding: utf-8
+
+import symplate
+
+def _render(_renderer, ):
+    filt = symplate.html_filter
+    render = _renderer.render
+    _output = []
+    _writes = _output.extend
+
+    _inline_0(_renderer, _output, 'TestInline/changed')
+
+    return symplate.Markup(u''.join(_output))
+
+# Inlined from: /root/package/tests/symplates/TestInline/changed.symp
+def _inline_0():
+
+    def _render_into(_renderer, _output, _name, ):
+        filt = symplate.html_filter
+        render = _renderer.render
+        _writes = _output.extend
+
+        _writes((
+            u'two',
+        ))
+
+    return _render_into
+_inline_0 = _inline_0()
+
+_depends = ('TestInline/changed',)
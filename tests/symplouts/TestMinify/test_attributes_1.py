@@ -0,0 +1,25 @@
+# Compiled by Symplate from: /root/package/tests/symplates/TestMinify/test_attributes_1.symp
+# coding: utf-8
+
+import symplate
+
+def _render(_renderer, x):
+    filt = symplate.html_filter
+    render = _renderer.render
+    _output = []
+    _writes = _output.extend
+
+    _writes((
+        u'<div title="a    b"  data-x=\'',
+        filt(x),
+        u'   >  y\'> 1 < 2 </div>\n<input value="',
+    ))
+    if x:
+        _writes((
+            u'  c  ',
+        ))
+    _writes((
+        u'"  > <!--  z  --> .',
+    ))
+
+    return symplate.Markup(u''.join(_output))
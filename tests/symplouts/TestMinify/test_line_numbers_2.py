@@ -0,0 +1,20 @@
+# Compiled by Symplate from: /root/package/tests/symplates/TestMinify/test_line_numbers_2.symp
+# coding: utf-8
+
+import symplate
+
+def _render(_renderer, ):  # line: 1
+    filt = symplate.html_filter
+    render = _renderer.render
+    _output = []
+    _writes = _output.extend
+
+    _writes((  # line: 2
+        u'\n<p>',  # line: 2
+        filt(1),  # line: 4
+        u'</p>\n',  # line: 4
+    ))
+
+    return symplate.Markup(u''.join(_output))  # line: 5
+
+_line_map = {6: ('/root/package/tests/symplates/TestMinify/test_line_numbers_2.symp', 1), 7: ('/root/package/tests/symplates/TestMinify/test_line_numbers_2.symp', 1), 8: ('/root/package/tests/symplates/TestMinify/test_line_numbers_2.symp', 1), 9: ('/root/package/tests/symplates/TestMinify/test_line_numbers_2.symp', 1), 10: ('/root/package/tests/symplates/TestMinify/test_line_numbers_2.symp', 1), 11: ('/root/package/tests/symplates/TestMinify/test_line_numbers_2.symp', 1), 12: ('/root/package/tests/symplates/TestMinify/test_line_numbers_2.symp', 2), 13: ('/root/package/tests/symplates/TestMinify/test_line_numbers_2.symp', 2), 14: ('/root/package/tests/symplates/TestMinify/test_line_numbers_2.symp', 4), 15: ('/root/package/tests/symplates/TestMinify/test_line_numbers_2.symp', 4), 16: ('/root/package/tests/symplates/TestMinify/test_line_numbers_2.symp', 4), 17: ('/root/package/tests/symplates/TestMinify/test_line_numbers_2.symp', 4), 18: ('/root/package/tests/symplates/TestMinify/test_line_numbers_2.symp', 5)}
@@ -0,0 +1,31 @@
+# Compiled by Symplate from: /root/package/tests/symplates/TestMinify/test_raw_elements_3.symp
+# coding: utf-8
+
+import symplate
+
+def _render(_renderer, x):
+    filt = symplate.html_filter
+    render = _renderer.render
+    _output = []
+    _writes = _output.extend
+
+    _writes((
+        u'<div>\n<PRE class="code">\n  ',
+        filt(x),
+        u'\n    one</pre  >\n<textarea>  ',
+    ))
+    if x:
+        _writes((
+            u'  a  ',
+        ))
+    _writes((
+        ur"""  </textarea>
+<script>
+    var  a = 1;
+  </SCRIPT>
+<p> end </p>
+</div>
+""" ,
+    ))
+
+    return symplate.Markup(u''.join(_output))
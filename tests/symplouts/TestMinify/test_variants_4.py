@@ -0,0 +1,47 @@
+# Compiled by Symplate from: /root/package/tests/symplates/TestMinify/test_variants_4.symp
+# coding: utf-8
+
+import symplate
+
+def _render(_renderer, ):
+    filt = symplate.html_filter
+    render = _renderer.render
+    _output = []
+    _writes = _output.extend
+
+    _writes((
+        u'<pre> \xe9  </pre> <b> \xe9 </b>',
+    ))
+
+    return symplate.Markup(u''.join(_output))
+
+def _render_iter(_renderer, ):
+    filt = symplate.html_filter
+    render = _renderer.render
+    _stream = _renderer.render_iter
+    _output = []
+    _writes = _output.extend
+    _flush_items = _renderer.stream_chunk_items
+
+    _writes((
+        u'<pre> \xe9  </pre> <b> \xe9 </b>',
+    ))
+    if len(_output) >= _flush_items:
+        yield u''.join(_output)
+        del _output[:]
+
+    if _output:
+        yield u''.join(_output)
+
+def _render_bytes(_renderer, ):
+    filt = symplate.html_bytes_filter
+    render = _renderer.render
+    _render_sub = _renderer.render_bytes
+    _output = []
+    _writes = _output.extend
+
+    _writes((
+        '<pre> \xc3\xa9  </pre> <b> \xc3\xa9 </b>',
+    ))
+
+    return ''.join(_output)
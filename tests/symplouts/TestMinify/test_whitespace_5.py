@@ -0,0 +1,25 @@
+# Compiled by Symplate from: /root/package/tests/symplates/TestMinify/test_whitespace_5.symp
+# coding: utf-8
+
+import symplate
+
+def _render(_renderer, items):
+    filt = symplate.html_filter
+    render = _renderer.render
+    _output = []
+    _writes = _output.extend
+
+    _writes((
+        u'<ul>\n',
+    ))
+    for item in items:
+        _writes((
+            u' <li  class="x"> ',
+            filt(item),
+            u' </li>\n',
+        ))
+    _writes((
+        u'</ul>\n',
+    ))
+
+    return symplate.Markup(u''.join(_output))
@@ -0,0 +1,18 @@
+# Compiled by Symplate from: /root/package/tests/symplates/TestOutputExpressions/test_basic_1.symp
+# coding: utf-8
+
+import symplate
+
+def _render(_renderer, v=''):
+    filt = symplate.html_filter
+    render = _renderer.render
+    _output = []
+    _writes = _output.extend
+
+    _writes((
+        u'a',
+        filt('<'),
+        u'c',
+    ))
+
+    return symplate.Markup(u''.join(_output))
@@ -0,0 +1,20 @@
+# Compiled by Symplate from: /root/package/tests/symplates/TestOutputExpressions/test_basic_3.symp
+# coding: utf-8
+
+import symplate
+
+def _render(_renderer, v=''):
+    filt = symplate.html_filter
+    render = _renderer.render
+    _output = []
+    _writes = _output.extend
+
+    _writes((
+        filt('a'),
+        u' ',
+        filt('<'),
+        u' ',
+        filt('c'),
+    ))
+
+    return symplate.Markup(u''.join(_output))
@@ -0,0 +1,35 @@
+# Compiled by Symplate from: /root/package/tests/symplates/TestProfiler/test_inline_1.symp
+# coding: utf-8
+
+import symplate
+
+def _render(_renderer, ):  # line: 1
+    filt = symplate.html_filter
+    render = _renderer.render
+    _output = []
+    _writes = _output.extend
+
+    _inline_0(_renderer, _output, 'TestProfiler/sub')  # line: 1
+
+    return symplate.Markup(u''.join(_output))  # line: 1
+
+# Inlined from: /root/package/tests/symplates/TestProfiler/sub.symp
+def _inline_0():
+
+    def _render_into(_renderer, _output, _name, ):  # line: 1
+        filt = symplate.html_filter
+        render = _renderer.render
+        _writes = _output.extend
+
+        _writes((  # line: 2
+            u'\n<',  # line: 2
+            filt(1),  # line: 3
+            u'>',  # line: 3
+        ))
+
+    return _render_into
+_inline_0 = _inline_0()
+
+_depends = ('TestProfiler/sub',)
+
+_line_map = {6: ('/root/package/tests/symplates/TestProfiler/test_inline_1.symp', 1), 7: ('/root/package/tests/symplates/TestProfiler/test_inline_1.symp', 1), 8: ('/root/package/tests/symplates/TestProfiler/test_inline_1.symp', 1), 9: ('/root/package/tests/symplates/TestProfiler/test_inline_1.symp', 1), 10: ('/root/package/tests/symplates/TestProfiler/test_inline_1.symp', 1), 11: ('/root/package/tests/symplates/TestProfiler/test_inline_1.symp', 1), 12: ('/root/package/tests/symplates/TestProfiler/test_inline_1.symp', 1), 13: ('/root/package/tests/symplates/TestProfiler/test_inline_1.symp', 1), 14: ('/root/package/tests/symplates/TestProfiler/test_inline_1.symp', 1), 15: ('/root/package/tests/symplates/TestProfiler/test_inline_1.symp', 1), 19: (u'/root/package/tests/symplates/TestProfiler/sub.symp', 1), 20: (u'/root/package/tests/symplates/TestProfiler/sub.symp', 1), 21: (u'/root/package/tests/symplates/TestProfiler/sub.symp', 1), 22: (u'/root/package/tests/symplates/TestProfiler/sub.symp', 1), 23: (u'/root/package/tests/symplates/TestProfiler/sub.symp', 1), 24: (u'/root/package/tests/symplates/TestProfiler/sub.symp', 2), 25: (u'/root/package/tests/symplates/TestProfiler/sub.symp', 2), 26: (u'/root/package/tests/symplates/TestProfiler/sub.symp', 3), 27: (u'/root/package/tests/symplates/TestProfiler/sub.symp', 3), 28: (u'/root/package/tests/symplates/TestProfiler/sub.symp', 3), 29: (u'/root/package/tests/symplates/TestProfiler/sub.symp', 3), 30: (u'/root/package/tests/symplates/TestProfiler/sub.symp', 3), 31: (u'/root/package/tests/symplates/TestProfiler/sub.symp', 3), 32: (u'/root/package/tests/symplates/TestProfiler/sub.symp', 3), 33: (u'/root/package/tests/symplates/TestProfiler/sub.symp', 3)}
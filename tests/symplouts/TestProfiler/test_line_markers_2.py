@@ -0,0 +1,29 @@
+# Compiled by Symplate from: /root/package/tests/symplates/TestProfiler/test_line_markers_2.symp
+# coding: utf-8
+
+import symplate
+
+def _render(_renderer, x):  # line: 1
+    filt = symplate.html_filter
+    render = _renderer.render
+    _output = []
+    _writes = _output.extend
+
+    _writes((  # line: 2
+        u'<p>',  # line: 2
+        filt(x),  # line: 2
+        u'</p>\n',  # line: 2
+    ))
+    def f():  # line: 3
+        y = 1 + \
+        2  # line: 5
+        _writes((  # line: 6
+            u'<b>',  # line: 6
+            filt(y),  # line: 6
+            u'</b>\n',  # line: 6
+        ))
+    f()  # line: 8
+
+    return symplate.Markup(u''.join(_output))  # line: 9
+
+_line_map = {6: ('/root/package/tests/symplates/TestProfiler/test_line_markers_2.symp', 1), 7: ('/root/package/tests/symplates/TestProfiler/test_line_markers_2.symp', 1), 8: ('/root/package/tests/symplates/TestProfiler/test_line_markers_2.symp', 1), 9: ('/root/package/tests/symplates/TestProfiler/test_line_markers_2.symp', 1), 10: ('/root/package/tests/symplates/TestProfiler/test_line_markers_2.symp', 1), 11: ('/root/package/tests/symplates/TestProfiler/test_line_markers_2.symp', 1), 12: ('/root/package/tests/symplates/TestProfiler/test_line_markers_2.symp', 2), 13: ('/root/package/tests/symplates/TestProfiler/test_line_markers_2.symp', 2), 14: ('/root/package/tests/symplates/TestProfiler/test_line_markers_2.symp', 2), 15: ('/root/package/tests/symplates/TestProfiler/test_line_markers_2.symp', 2), 16: ('/root/package/tests/symplates/TestProfiler/test_line_markers_2.symp', 2), 17: ('/root/package/tests/symplates/TestProfiler/test_line_markers_2.symp', 3), 18: ('/root/package/tests/symplates/TestProfiler/test_line_markers_2.symp', 3), 19: ('/root/package/tests/symplates/TestProfiler/test_line_markers_2.symp', 5), 20: ('/root/package/tests/symplates/TestProfiler/test_line_markers_2.symp', 6), 21: ('/root/package/tests/symplates/TestProfiler/test_line_markers_2.symp', 6), 22: ('/root/package/tests/symplates/TestProfiler/test_line_markers_2.symp', 6), 23: ('/root/package/tests/symplates/TestProfiler/test_line_markers_2.symp', 6), 24: ('/root/package/tests/symplates/TestProfiler/test_line_markers_2.symp', 6), 25: ('/root/package/tests/symplates/TestProfiler/test_line_markers_2.symp', 8), 26: ('/root/package/tests/symplates/TestProfiler/test_line_markers_2.symp', 8), 27: ('/root/package/tests/symplates/TestProfiler/test_line_markers_2.symp', 9)}
@@ -0,0 +1,27 @@
+# Compiled by Symplate from: /root/package/tests/symplates/TestProfiler/test_multiline_string_3.symp
+# coding: utf-8
+
+import symplate
+
+def _render(_renderer, ):  # line: 1
+    filt = symplate.html_filter
+    render = _renderer.render
+    _output = []
+    _writes = _output.extend
+
+    y = """one
+    two"""  # line: 3
+    _writes((  # line: 3
+        filt(y),  # line: 3
+        u'\n',  # line: 3
+    ))
+    z = '''a
+    b''' + """
+    """  # line: 6
+    _writes((  # line: 6
+        filt(z),  # line: 6
+    ))
+
+    return symplate.Markup(u''.join(_output))  # line: 6
+
+_line_map = {6: ('/root/package/tests/symplates/TestProfiler/test_multiline_string_3.symp', 1), 7: ('/root/package/tests/symplates/TestProfiler/test_multiline_string_3.symp', 1), 8: ('/root/package/tests/symplates/TestProfiler/test_multiline_string_3.symp', 1), 9: ('/root/package/tests/symplates/TestProfiler/test_multiline_string_3.symp', 1), 10: ('/root/package/tests/symplates/TestProfiler/test_multiline_string_3.symp', 1), 11: ('/root/package/tests/symplates/TestProfiler/test_multiline_string_3.symp', 1), 12: ('/root/package/tests/symplates/TestProfiler/test_multiline_string_3.symp', 1), 13: ('/root/package/tests/symplates/TestProfiler/test_multiline_string_3.symp', 3), 14: ('/root/package/tests/symplates/TestProfiler/test_multiline_string_3.symp', 3), 15: ('/root/package/tests/symplates/TestProfiler/test_multiline_string_3.symp', 3), 16: ('/root/package/tests/symplates/TestProfiler/test_multiline_string_3.symp', 3), 17: ('/root/package/tests/symplates/TestProfiler/test_multiline_string_3.symp', 3), 18: ('/root/package/tests/symplates/TestProfiler/test_multiline_string_3.symp', 3), 19: ('/root/package/tests/symplates/TestProfiler/test_multiline_string_3.symp', 3), 20: ('/root/package/tests/symplates/TestProfiler/test_multiline_string_3.symp', 6), 21: ('/root/package/tests/symplates/TestProfiler/test_multiline_string_3.symp', 6), 22: ('/root/package/tests/symplates/TestProfiler/test_multiline_string_3.symp', 6), 23: ('/root/package/tests/symplates/TestProfiler/test_multiline_string_3.symp', 6), 24: ('/root/package/tests/symplates/TestProfiler/test_multiline_string_3.symp', 6), 25: ('/root/package/tests/symplates/TestProfiler/test_multiline_string_3.symp', 6)}
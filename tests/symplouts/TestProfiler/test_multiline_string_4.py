@@ -0,0 +1,25 @@
+# Compiled by Symplate from: /root/package/tests/symplates/TestProfiler/test_multiline_string_4.symp
+# coding: utf-8
+
+import symplate
+
+def _render(_renderer, ):
+    filt = symplate.html_filter
+    render = _renderer.render
+    _output = []
+    _writes = _output.extend
+
+    y = """one
+    two"""
+    _writes((
+        filt(y),
+        u'\n',
+    ))
+    z = '''a
+    b''' + """
+    """
+    _writes((
+        filt(z),
+    ))
+
+    return symplate.Markup(u''.join(_output))
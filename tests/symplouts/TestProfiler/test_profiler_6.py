@@ -0,0 +1,23 @@
+# Compiled by Symplate from: /root/package/tests/symplates/TestProfiler/test_profiler_6.symp
+# coding: utf-8
+
+import symplate
+
+def _render(_renderer, items):  # line: 1
+    filt = symplate.html_filter
+    render = _renderer.render
+    _output = []
+    _writes = _output.extend
+
+    def item(x):  # line: 2
+        _writes((  # line: 3
+            u'<li>',  # line: 3
+            filt(x),  # line: 3
+            u'</li>\n',  # line: 3
+        ))
+    for x in items:  # line: 5
+        item(x)  # line: 6
+
+    return symplate.Markup(u''.join(_output))  # line: 8
+
+_line_map = {6: ('/root/package/tests/symplates/TestProfiler/test_profiler_6.symp', 1), 7: ('/root/package/tests/symplates/TestProfiler/test_profiler_6.symp', 1), 8: ('/root/package/tests/symplates/TestProfiler/test_profiler_6.symp', 1), 9: ('/root/package/tests/symplates/TestProfiler/test_profiler_6.symp', 1), 10: ('/root/package/tests/symplates/TestProfiler/test_profiler_6.symp', 1), 11: ('/root/package/tests/symplates/TestProfiler/test_profiler_6.symp', 1), 12: ('/root/package/tests/symplates/TestProfiler/test_profiler_6.symp', 2), 13: ('/root/package/tests/symplates/TestProfiler/test_profiler_6.symp', 3), 14: ('/root/package/tests/symplates/TestProfiler/test_profiler_6.symp', 3), 15: ('/root/package/tests/symplates/TestProfiler/test_profiler_6.symp', 3), 16: ('/root/package/tests/symplates/TestProfiler/test_profiler_6.symp', 3), 17: ('/root/package/tests/symplates/TestProfiler/test_profiler_6.symp', 3), 18: ('/root/package/tests/symplates/TestProfiler/test_profiler_6.symp', 5), 19: ('/root/package/tests/symplates/TestProfiler/test_profiler_6.symp', 6), 20: ('/root/package/tests/symplates/TestProfiler/test_profiler_6.symp', 6), 21: ('/root/package/tests/symplates/TestProfiler/test_profiler_6.symp', 8)}
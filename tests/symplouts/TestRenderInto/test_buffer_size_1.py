@@ -0,0 +1,36 @@
+# Compiled by Symplate from: /root/package/tests/symplates/TestRenderInto/test_buffer_size_1.symp
+# coding: utf-8
+
+import symplate
+
+def _render(_renderer, ):
+    filt = symplate.html_filter
+    render = _renderer.render
+    _output = []
+    _writes = _output.extend
+
+    for i in range(10000):
+        _writes((
+            filt(i % 10),
+        ))
+
+    return symplate.Markup(u''.join(_output))
+
+def _render_iter(_renderer, ):
+    filt = symplate.html_filter
+    render = _renderer.render
+    _stream = _renderer.render_iter
+    _output = []
+    _writes = _output.extend
+    _flush_items = _renderer.stream_chunk_items
+
+    for i in range(10000):
+        _writes((
+            filt(i % 10),
+        ))
+        if len(_output) >= _flush_items:
+            yield u''.join(_output)
+            del _output[:]
+
+    if _output:
+        yield u''.join(_output)
@@ -0,0 +1,34 @@
+# Compiled by Symplate from: /root/package/tests/symplates/TestRenderInto/test_encoding_2.symp
+# coding: utf-8
+
+import symplate
+
+def _render(_renderer, ):
+    filt = symplate.html_filter
+    render = _renderer.render
+    _output = []
+    _writes = _output.extend
+
+    _writes((
+        u'\u2019',
+    ))
+
+    return symplate.Markup(u''.join(_output))
+
+def _render_iter(_renderer, ):
+    filt = symplate.html_filter
+    render = _renderer.render
+    _stream = _renderer.render_iter
+    _output = []
+    _writes = _output.extend
+    _flush_items = _renderer.stream_chunk_items
+
+    _writes((
+        u'\u2019',
+    ))
+    if len(_output) >= _flush_items:
+        yield u''.join(_output)
+        del _output[:]
+
+    if _output:
+        yield u''.join(_output)
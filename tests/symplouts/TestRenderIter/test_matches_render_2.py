@@ -0,0 +1,76 @@
+# Compiled by Symplate from: /root/package/tests/symplates/TestRenderIter/test_matches_render_2.symp
+# coding: utf-8
+
+import symplate
+
+def _render(_renderer, items):
+    filt = symplate.html_filter
+    render = _renderer.render
+    _output = []
+    _writes = _output.extend
+
+    def item(i):
+        _writes((
+            u'<li>',
+            filt(i),
+            u'</li>\n',
+        ))
+    _writes((
+        u'<ul>\n',
+    ))
+    for i in items:
+        if i % 2:
+            item(i)
+        else:
+            _writes((
+                u'<li>',
+                'even',
+                u'</li>\n',
+            ))
+    _writes((
+        u'</ul>\n',
+    ))
+
+    return symplate.Markup(u''.join(_output))
+
+def _render_iter(_renderer, items):
+    filt = symplate.html_filter
+    render = _renderer.render
+    _stream = _renderer.render_iter
+    _output = []
+    _writes = _output.extend
+    _flush_items = _renderer.stream_chunk_items
+
+    def item(i):
+        _writes((
+            u'<li>',
+            filt(i),
+            u'</li>\n',
+        ))
+    _writes((
+        u'<ul>\n',
+    ))
+    if len(_output) >= _flush_items:
+        yield u''.join(_output)
+        del _output[:]
+    for i in items:
+        if i % 2:
+            item(i)
+        else:
+            _writes((
+                u'<li>',
+                'even',
+                u'</li>\n',
+            ))
+            if len(_output) >= _flush_items:
+                yield u''.join(_output)
+                del _output[:]
+    _writes((
+        u'</ul>\n',
+    ))
+    if len(_output) >= _flush_items:
+        yield u''.join(_output)
+        del _output[:]
+
+    if _output:
+        yield u''.join(_output)
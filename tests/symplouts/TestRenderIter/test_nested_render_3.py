@@ -0,0 +1,44 @@
+# Compiled by Symplate from: /root/package/tests/symplates/TestRenderIter/test_nested_render_3.symp
+# coding: utf-8
+
+import symplate
+
+def _render(_renderer, ):
+    filt = symplate.html_filter
+    render = _renderer.render
+    _output = []
+    _writes = _output.extend
+
+    _writes((
+        u'a',
+        render('TestRenderIter/sub', 'b'),
+        u'c',
+    ))
+
+    return symplate.Markup(u''.join(_output))
+
+def _render_iter(_renderer, ):
+    filt = symplate.html_filter
+    render = _renderer.render
+    _stream = _renderer.render_iter
+    _output = []
+    _writes = _output.extend
+    _flush_items = _renderer.stream_chunk_items
+
+    _writes((
+        u'a',
+    ))
+    if _output:
+        yield u''.join(_output)
+        del _output[:]
+    for _chunk in _stream('TestRenderIter/sub', 'b'):
+        yield _chunk
+    _writes((
+        u'c',
+    ))
+    if len(_output) >= _flush_items:
+        yield u''.join(_output)
+        del _output[:]
+
+    if _output:
+        yield u''.join(_output)
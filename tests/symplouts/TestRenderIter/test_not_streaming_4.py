@@ -0,0 +1,17 @@
+# Compiled by Symplate from: /root/package/tests/symplates/TestRenderIter/test_not_streaming_4.symp
+# coding: utf-8
+
+import symplate
+
+def _render(_renderer, ):
+    filt = symplate.html_filter
+    render = _renderer.render
+    _output = []
+    _writes = _output.extend
+
+    for i in range(1000):
+        _writes((
+            u'.',
+        ))
+
+    return symplate.Markup(u''.join(_output))
@@ -0,0 +1,38 @@
+# Compiled by Symplate from: /root/package/tests/symplates/TestRenderIter/test_simple_5.symp
+# coding: utf-8
+
+import symplate
+
+def _render(_renderer, x):
+    filt = symplate.html_filter
+    render = _renderer.render
+    _output = []
+    _writes = _output.extend
+
+    _writes((
+        u'a',
+        filt(x),
+        u'b',
+    ))
+
+    return symplate.Markup(u''.join(_output))
+
+def _render_iter(_renderer, x):
+    filt = symplate.html_filter
+    render = _renderer.render
+    _stream = _renderer.render_iter
+    _output = []
+    _writes = _output.extend
+    _flush_items = _renderer.stream_chunk_items
+
+    _writes((
+        u'a',
+        filt(x),
+        u'b',
+    ))
+    if len(_output) >= _flush_items:
+        yield u''.join(_output)
+        del _output[:]
+
+    if _output:
+        yield u''.join(_output)
@@ -0,0 +1,17 @@
+# Compiled by Symplate from: /root/package/tests/symplates/TestRenderer/test_preamble_12.symp
+# coding: utf-8
+
+import symplate
+def preamble_func(): return '42'
+
+def _render(_renderer, ):
+    filt = symplate.html_filter
+    render = _renderer.render
+    _output = []
+    _writes = _output.extend
+
+    _writes((
+        filt(preamble_func()),
+    ))
+
+    return symplate.Markup(u''.join(_output))
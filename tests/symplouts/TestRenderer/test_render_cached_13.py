@@ -0,0 +1,18 @@
+# Compiled by Symplate from: /root/package/tests/symplates/TestRenderer/test_render_cached_13.symp
+# coding: utf-8
+
+import symplate
+
+def _render(_renderer, calls, x, y=0):
+    filt = symplate.html_filter
+    render = _renderer.render
+    _output = []
+    _writes = _output.extend
+
+    calls.append(x)
+    _writes((
+        filt(x),
+        filt(y),
+    ))
+
+    return symplate.Markup(u''.join(_output))
@@ -0,0 +1,17 @@
+# Compiled by Symplate from: /root/package/tests/symplates/TestRenderer/test_single_flight.symp
+# coding: utf-8
+
+import symplate
+
+def _render(_renderer, x):
+    filt = symplate.html_filter
+    render = _renderer.render
+    _output = []
+    _writes = _output.extend
+
+    _writes((
+        u'sf',
+        filt(x),
+    ))
+
+    return symplate.Markup(u''.join(_output))
@@ -0,0 +1,29 @@
+# Compiled by Symplate from: /root/package/tests/symplates/TestStats/bytes_sub.symp
+# coding: utf-8
+
+import symplate
+
+def _render(_renderer, ):
+    filt = symplate.html_filter
+    render = _renderer.render
+    _output = []
+    _writes = _output.extend
+
+    _writes((
+        u'sub',
+    ))
+
+    return symplate.Markup(u''.join(_output))
+
+def _render_bytes(_renderer, ):
+    filt = symplate.html_bytes_filter
+    render = _renderer.render
+    _render_sub = _renderer.render_bytes
+    _output = []
+    _writes = _output.extend
+
+    _writes((
+        'sub',
+    ))
+
+    return ''.join(_output)
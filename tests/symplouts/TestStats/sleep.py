@@ -0,0 +1,18 @@
+# Compiled by Symplate from: /root/package/tests/symplates/TestStats/sleep.symp
+# coding: utf-8
+
+import symplate
+import time
+
+def _render(_renderer, ):
+    filt = symplate.html_filter
+    render = _renderer.render
+    _output = []
+    _writes = _output.extend
+
+    time.sleep(0.02)
+    _writes((
+        u'z',
+    ))
+
+    return symplate.Markup(u''.join(_output))
@@ -0,0 +1,33 @@
+# Compiled by Symplate from: /root/package/tests/symplates/TestStats/test_bytes_nested_1.symp
+# coding: utf-8
+
+import symplate
+
+def _render(_renderer, ):
+    filt = symplate.html_filter
+    render = _renderer.render
+    _output = []
+    _writes = _output.extend
+
+    _writes((
+        u'<',
+        render('TestStats/bytes_sub'),
+        u'>',
+    ))
+
+    return symplate.Markup(u''.join(_output))
+
+def _render_bytes(_renderer, ):
+    filt = symplate.html_bytes_filter
+    render = _renderer.render
+    _render_sub = _renderer.render_bytes
+    _output = []
+    _writes = _output.extend
+
+    _writes((
+        '<',
+        _render_sub('TestStats/bytes_sub'),
+        '>',
+    ))
+
+    return ''.join(_output)
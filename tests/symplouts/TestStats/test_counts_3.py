@@ -0,0 +1,17 @@
+# Compiled by Symplate from: /root/package/tests/symplates/TestStats/test_counts_3.symp
+# coding: utf-8
+
+import symplate
+
+def _render(_renderer, x):
+    filt = symplate.html_filter
+    render = _renderer.render
+    _output = []
+    _writes = _output.extend
+
+    _writes((
+        u'c',
+        filt(x),
+    ))
+
+    return symplate.Markup(u''.join(_output))
@@ -0,0 +1,20 @@
+# Compiled by Symplate from: /root/package/tests/symplates/TestStats/test_nested_4.symp
+# coding: utf-8
+
+import symplate
+import time
+
+def _render(_renderer, ):
+    filt = symplate.html_filter
+    render = _renderer.render
+    _output = []
+    _writes = _output.extend
+
+    time.sleep(0.01)
+    _writes((
+        u'<',
+        render('TestStats/sleep'),
+        u'>',
+    ))
+
+    return symplate.Markup(u''.join(_output))
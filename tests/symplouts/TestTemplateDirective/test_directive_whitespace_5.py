@@ -0,0 +1,16 @@
+# Compiled by Symplate from: /root/package/tests/symplates/TestTemplateDirective/test_directive_whitespace_5.symp
+# coding: utf-8
+
+import symplate
+
+def _render(_renderer, v):
+    filt = symplate.html_filter
+    render = _renderer.render
+    _output = []
+    _writes = _output.extend
+
+    _writes((
+        filt(v),
+    ))
+
+    return symplate.Markup(u''.join(_output))
@@ -0,0 +1,13 @@
+# Compiled by Symplate from: /root/package/tests/symplates/TestTemplateDirective/test_empty_7.symp
+# coding: utf-8
+
+import symplate
+
+def _render(_renderer, ):
+    filt = symplate.html_filter
+    render = _renderer.render
+    _output = []
+    _writes = _output.extend
+
+
+    return symplate.Markup(u''.join(_output))
@@ -0,0 +1,18 @@
+# Compiled by Symplate from: /root/package/tests/symplates/TestTemplateDirective/test_keyword_args_12.symp
+# coding: utf-8
+
+import symplate
+
+def _render(_renderer, one='a', two='b'):
+    filt = symplate.html_filter
+    render = _renderer.render
+    _output = []
+    _writes = _output.extend
+
+    _writes((
+        filt(one),
+        u'.',
+        filt(two),
+    ))
+
+    return symplate.Markup(u''.join(_output))
@@ -0,0 +1,17 @@
+# Compiled by Symplate from: /root/package/tests/symplates/TestTemplateDirective/test_strip_whitespace_on_line_before_33.symp
+# coding: utf-8
+
+import symplate
+
+def _render(_renderer, ):
+    filt = symplate.html_filter
+    render = _renderer.render
+    _output = []
+    _writes = _output.extend
+
+    _writes((
+        u'  \n\n',
+    ))
+    x = 42
+
+    return symplate.Markup(u''.join(_output))
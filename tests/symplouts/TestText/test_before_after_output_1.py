@@ -0,0 +1,18 @@
+# Compiled by Symplate from: /root/package/tests/symplates/TestText/test_before_after_output_1.symp
+# coding: utf-8
+
+import symplate
+
+def _render(_renderer, ):
+    filt = symplate.html_filter
+    render = _renderer.render
+    _output = []
+    _writes = _output.extend
+
+    _writes((
+        u'a',
+        filt("b"),
+        u'c',
+    ))
+
+    return symplate.Markup(u''.join(_output))
@@ -0,0 +1,19 @@
+# Compiled by Symplate from: /root/package/tests/symplates/TestText/test_long_string_4.symp
+# coding: utf-8
+
+import symplate
+
+def _render(_renderer, ):
+    filt = symplate.html_filter
+    render = _renderer.render
+    _output = []
+    _writes = _output.extend
+
+    _writes((
+        u'"""' ur"""This is a longer string
+which definitely should
+be broken, and """ u'"""' ur""" should
+should work fine, as should\nescapes.""" u'"""' ,
+    ))
+
+    return symplate.Markup(u''.join(_output))
@@ -0,0 +1,19 @@
+# Compiled by Symplate from: /root/package/tests/symplates/TestText/test_quotes_6.symp
+# coding: utf-8
+
+import symplate
+
+def _render(_renderer, ):
+    filt = symplate.html_filter
+    render = _renderer.render
+    _output = []
+    _writes = _output.extend
+
+    _writes((
+        ur"""""This is a longer string
+which definitely should
+be broken, and it should
+should work fine, as should\nescapes.""" '""' ,
+    ))
+
+    return symplate.Markup(u''.join(_output))
@@ -0,0 +1,16 @@
+# Compiled by Symplate from: /root/package/tests/symplates/TestText/test_short_string_9.symp
+# coding: utf-8
+
+import symplate
+
+def _render(_renderer, ):
+    filt = symplate.html_filter
+    render = _renderer.render
+    _output = []
+    _writes = _output.extend
+
+    _writes((
+        u'longer but not multiline and quick brown foxes jump over lazy dogs',
+    ))
+
+    return symplate.Markup(u''.join(_output))
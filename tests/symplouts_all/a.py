@@ -0,0 +1,16 @@
+# Compiled by Symplate from: /root/package/tests/symplates_all/a.symp
+# coding: utf-8
+
+import symplate
+
+def _render(_renderer, ):
+    filt = symplate.html_filter
+    render = _renderer.render
+    _output = []
+    _writes = _output.extend
+
+    _writes((
+        u'a',
+    ))
+
+    return symplate.Markup(u''.join(_output))
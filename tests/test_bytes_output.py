@@ -0,0 +1,92 @@
+"""Unit tests for bytes_output and render_bytes()."""
+
+import unittest
+
+import symplate
+import utils
+
+renderer = utils.Renderer(bytes_output=True)
+
+class Html(object):
+    def __html__(self):
+        return u'<b>\u2019</b>'
+
+class TestBytesOutput(utils.TestCase):
+    def render_bytes(self, template, *args, **kwargs):
+        kwargs.setdefault('_renderer', renderer)
+        output = self.render(template, *args, _method='render_bytes', **kwargs)
+        self.assertEqual(type(output), str)
+        return output
+
+    def test_text(self):
+        long_text = u'line one "\u201cquoted\u201d"\nline two """ \\u0041 and more text here\n'
+        self.assertEqual(self.render_bytes(u'{% template %}' + long_text), long_text.encode('utf-8'))
+        self.assertEqual(self.render_bytes(u'{% template %}caf\xe9 {{ 1 }}'), 'caf\xc3\xa9 1')
+
+    def test_filters(self):
+        template = u'{% template a, b, c, d, e %}{{ a }}|{{ b }}|{{ c }}|{{ d }}|{{ e }}'
+        self.assertEqual(self.render_bytes(template, u'<\u2019>', '<\xe2\x80\x99>', 1.5, None, Html()),
+                         '&lt;\xe2\x80\x99&gt;|&lt;\xe2\x80\x99&gt;|1.5||<b>\xe2\x80\x99</b>')
+        self.assertEqual(self.render_bytes(template, u'<\u2019>', '<\xe2\x80\x99>', 1.5, None, Html(), _increment=0),
+                         self.render(template, u'<\u2019>', '<\xe2\x80\x99>', 1.5, None, Html(), _renderer=renderer, _increment=0).encode('utf-8'))
+
+    def test_set_filter(self):
+        template = u"""{% template x %}
+{% filt = symplate.text_filter %}
+{{ x }}
+{% filt = lambda s: s.upper()  # comment %}
+{{ x }}
+{% filt = symplate.html_filter %}
+{{ x }}
+"""
+        self.assertEqual(self.render_bytes(template, u'<\xe9>'), '<\xc3\xa9>\n<\xc3\x89>\n&lt;\xc3\xa9&gt;\n')
+
+    def test_default_filter(self):
+        text_renderer = utils.Renderer(bytes_output=True, default_filter='symplate.text_filter')
+        self.assertEqual(self.render_bytes(u'{% template x %}{{ x }}', u'<\xe9>', _renderer=text_renderer), '<\xc3\xa9>')
+        upper_renderer = utils.Renderer(bytes_output=True, default_filter='lambda s: s.upper()')
+        self.assertEqual(self.render_bytes(u'{% template x %}{{ x }}', u'<\xe9>', _renderer=upper_renderer), '<\xc3\x89>')
+
+    def test_raw(self):
+        self.assertEqual(self.render_bytes(u'{% template x, y %}{{ !x }}{{ !y }}', u'<\xe9>', '<\xc3\xa9>'), '<\xc3\xa9><\xc3\xa9>')
+
+    def test_sub_template(self):
+        self._write_template(renderer, 'TestBytesOutput/sub', u'{% template x %}<\xe9{{ x }}>', 0)
+        template = u"{% template %}{{ !render('TestBytesOutput/sub', '&') }}{{ render('TestBytesOutput/sub', 1) }}"
+        self.assertEqual(self.render_bytes(template), '<\xc3\xa9&amp;><\xc3\xa91>')
+        inline_renderer = utils.Renderer(bytes_output=True, inline=True)
+        self._write_template(inline_renderer, 'TestBytesOutput/sub', u'{% template x %}<\xe9{{ x }}>', 0)
+        self.assertEqual(self.render_bytes(template, _renderer=inline_renderer, _increment=0), '<\xc3\xa9&amp;><\xc3\xa91>')
+        self.assertEqual(self.render(template, _renderer=inline_renderer, _increment=0), u'<\xe9&amp;><\xe91>')
+
+    def test_cache(self):
+        template = u'{% template x %}{% cache 1 %}\xe9{{ x }}{% end %}'
+        self.assertEqual(self.render_bytes(template, 1), '\xc3\xa91')
+        self.assertEqual(self.render_bytes(template, 2, _increment=0), '\xc3\xa91')
+        # unicode and bytes output are cached under separate keys
+        self.assertEqual(self.render(template, 3, _renderer=renderer, _increment=0), u'\xe93')
+        self.assertEqual(self.render(template, 4, _renderer=renderer, _increment=0), u'\xe93')
+
+    def test_not_compiled_with_bytes(self):
+        self.assertEqual(self.render_bytes(u'{% template x %}\xe9{{ x }}', u'<', _renderer=utils.renderer), '\xc3\xa9&lt;')
+
+class TestBytesFilters(unittest.TestCase):
+    def test_html_bytes_filter(self):
+        f = symplate.html_bytes_filter
+        self.assertEqual(f(u'<&>\'"\u2019'), '&lt;&amp;&gt;&#39;&#34;\xe2\x80\x99')
+        self.assertEqual(f('<&>\'"\xe2\x80\x99'), '&lt;&amp;&gt;&#39;&#34;\xe2\x80\x99')
+        self.assertEqual(f(None), '')
+        self.assertEqual(f(42), '42')
+        self.assertEqual(f(symplate.Markup(u'<\u2019>')), '<\xe2\x80\x99>')
+        self.assertEqual(f([1]), '[1]')
+
+    def test_text_bytes_filter(self):
+        f = symplate.text_bytes_filter
+        self.assertEqual(f(u'<\u2019>'), '<\xe2\x80\x99>')
+        self.assertEqual(f('<\xe2\x80\x99>'), '<\xe2\x80\x99>')
+        self.assertEqual(f(None), '')
+        self.assertEqual(f(Html()), '<b>\xe2\x80\x99</b>')
+        self.assertEqual(f(1.5), '1.5')
+
+if __name__ == '__main__':
+    unittest.main()
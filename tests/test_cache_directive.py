@@ -0,0 +1,132 @@
+"""Unit tests for the {% cache ... %} directive and LRUCache."""
+
+import unittest
+
+import symplate
+import utils
+
+class TestCacheDirective(utils.TestCase):
+    def test_cached(self):
+        renderer = utils.Renderer()
+        template = r"""
+{% template calls, key %}
+a
+{% cache key %}
+{% calls.append(key) %}
+{{ key }}
+{% end cache %}
+b
+"""
+        calls = []
+        self.assertEqual(self.render(template, calls, 'x', _renderer=renderer), 'a\nx\nb\n')
+        self.assertEqual(self.render(template, calls, 'x', _renderer=renderer, _increment=0), 'a\nx\nb\n')
+        self.assertEqual(self.render(template, calls, 'y', _renderer=renderer, _increment=0), 'a\ny\nb\n')
+        self.assertEqual(calls, ['x', 'y'])
+        self.assertEqual(renderer.fragment_cache.hits, 1)
+        self.assertEqual(renderer.fragment_cache.misses, 2)
+
+    def test_ttl(self):
+        renderer = utils.Renderer()
+        template = '{% template calls, ttl %}{% cache 0, ttl %}{% calls.append(1) %}{{ len(calls) }}{% end %}'
+        calls = []
+        self.assertEqual(self.render(template, calls, -1, _renderer=renderer), '1')
+        self.assertEqual(self.render(template, calls, -1, _renderer=renderer, _increment=0), '2')
+        self.assertEqual(self.render(template, calls, 60, _renderer=renderer, _increment=0), '3')
+        self.assertEqual(self.render(template, calls, 60, _renderer=renderer, _increment=0), '3')
+        self.assertEqual(self.render(template, [], ttl=60, _renderer=renderer, _increment=0), '3')
+
+    def test_separate_blocks(self):
+        renderer = utils.Renderer()
+        template = "{% template x %}{% cache 'k' %}{{ x }}{% end %}-{% cache 'k' %}{{ x * 2 }}{% end %}"
+        self.assertEqual(self.render(template, 'a', _renderer=renderer), 'a-aa')
+        self.assertEqual(self.render(template, 'b', _renderer=renderer, _increment=0), 'a-aa')
+
+    def test_nested(self):
+        renderer = utils.Renderer()
+        template = r"""
+{% template x, y %}
+{% def inner(): %}
+{% cache 'inner', ttl=60 %}[{{ y }}]{% end %}
+{% end def %}
+{% cache 'outer' %}{% for c in x: %}{{ c }}{% inner() %}{% end for %}{% end cache %}
+"""
+        self.assertEqual(self.render(template, 'ab', 1, _renderer=renderer), 'a[1]\nb[1]\n\n')
+        self.assertEqual(self.render(template, 'cd', 2, _renderer=renderer, _increment=0), 'a[1]\nb[1]\n\n')
+
+    def test_streaming(self):
+        renderer = utils.Renderer(streaming=True)
+        template = "{% template n %}{% cache 'k' %}{% for i in range(n): %}.{% end %}{% end %}!"
+        chunks = list(self.render(template, 1000, _renderer=renderer, _method='render_iter'))
+        self.assertEqual(''.join(chunks), '.' * 1000 + '!')
+        self.assertEqual(self.render(template, 1, _renderer=renderer, _increment=0), '.' * 1000 + '!')
+
+    def test_custom_backend(self):
+        class DictCache(object):
+            def __init__(self):
+                self.values = {}
+            def get(self, key):
+                return self.values.get(key)
+            def set(self, key, value, ttl):
+                self.values[key] = value
+        cache = DictCache()
+        renderer = utils.Renderer(fragment_cache=cache)
+        self.assertEqual(self.render("{% template %}{% cache 'k' %}v{% end %}", _renderer=renderer), 'v')
+        self.assertEqual(cache.values.values(), [u'v'])
+
+    def test_template_changed(self):
+        renderer = utils.Renderer()
+        self.assertEqual(self.render("{% template %}{% cache 'k' %}old{% end %}", _renderer=renderer), 'old')
+        self.assertEqual(self.render("{% template %}{% cache 'k' %}new{% end %}", _renderer=renderer,
+                                     _increment=0, _adjust_mtime=5), 'new')
+
+    def test_not_directive(self):
+        self.assertEqual(self.render('{% template %}{% cache = {} %}{% cache[1] = 2 %}{% cache = cache[1] %}{% cache += 1 %}{{ cache }}'), '3')
+
+    def test_outside_template(self):
+        self.assertTemplateError(1, 'cache', self.render, "{% cache 'k' %}{% template %}")
+
+class TestLRUCache(unittest.TestCase):
+    def test_get_set(self):
+        cache = symplate.LRUCache()
+        self.assertEqual(cache.get('a'), None)
+        cache.set('a', u'A')
+        self.assertEqual(cache.get('a'), u'A')
+        cache.set('a', u'AA')
+        self.assertEqual(cache.get('a'), u'AA')
+        self.assertEqual((cache.hits, cache.misses), (2, 1))
+        cache.clear()
+        self.assertEqual(cache.get('a'), None)
+        self.assertEqual((cache.hits, cache.misses), (0, 1))
+
+    def test_max_entries(self):
+        cache = symplate.LRUCache(max_entries=2)
+        cache.set('a', u'A')
+        cache.set('b', u'B')
+        cache.get('a')
+        cache.set('c', u'C')
+        self.assertEqual(len(cache), 2)
+        self.assertEqual(cache.get('b'), None)
+        self.assertEqual(cache.get('a'), u'A')
+        self.assertEqual(cache.get('c'), u'C')
+
+    def test_max_size(self):
+        cache = symplate.LRUCache(max_size=10)
+        cache.set('a', u'x' * 4)
+        cache.set('b', u'x' * 4)
+        cache.set('c', u'x' * 4)
+        self.assertEqual(cache.get('a'), None)
+        self.assertEqual(len(cache), 2)
+        cache.set('d', u'x' * 11)
+        self.assertEqual(cache.get('d'), None)
+        self.assertEqual(len(cache), 2)
+
+    def test_expiry(self):
+        cache = symplate.LRUCache()
+        cache.set('a', u'A', ttl=-1)
+        cache.set('b', u'B', ttl=60)
+        self.assertEqual(cache.get('a'), None)
+        self.assertEqual(len(cache), 1)
+        self.assertEqual(cache.get('b'), u'B')
+
+if __name__ == '__main__':
+    unittest.main()
@@ -0,0 +1,145 @@
+"""Unit tests for Renderer.compile_all()."""
+
+import imp
+import json
+import marshal
+import os
+import shutil
+import unittest
+
+import symplate
+import utils
+
+TEMPLATE_DIR = os.path.join(os.path.dirname(__file__), 'symplates_all')
+OUTPUT_DIR = os.path.join(os.path.dirname(__file__), 'symplouts_all')
+
+class TestCompileAll(utils.TestCase):
+    def setUp(self):
+        super(TestCompileAll, self).setUp()
+        for dirname in (TEMPLATE_DIR, OUTPUT_DIR):
+            if os.path.exists(dirname):
+                shutil.rmtree(dirname)
+        self.renderer = utils.Renderer(template_dir=TEMPLATE_DIR, output_dir=OUTPUT_DIR)
+        for name in ['a', 'b', 'sub/c', 'sub/sub/d']:
+            self._write_template(self.renderer, name, '{% template %}' + name, 0)
+
+    def assertCompiled(self, names):
+        for name in names:
+            self.assertTrue(os.path.exists(os.path.join(OUTPUT_DIR, name + '.py')), name)
+        for dirname in ['', 'sub', 'sub/sub']:
+            self.assertTrue(os.path.exists(os.path.join(OUTPUT_DIR, dirname, '__init__.py')))
+
+    def test_serial(self):
+        self.assertEqual(self.renderer.compile_all(), ['a', 'b', 'sub/c', 'sub/sub/d'])
+        self.assertCompiled(['a', 'b', 'sub/c', 'sub/sub/d'])
+        self.assertEqual(self.renderer.render('sub/c'), 'sub/c')
+
+    def test_non_recursive(self):
+        self.assertEqual(self.renderer.compile_all(recursive=False), ['a', 'b'])
+
+    def test_jobs(self):
+        self.assertEqual(self.renderer.compile_all(jobs=3), ['a', 'b', 'sub/c', 'sub/sub/d'])
+        self.assertCompiled(['a', 'b', 'sub/c', 'sub/sub/d'])
+        self.assertEqual(self.renderer.render('sub/sub/d'), 'sub/sub/d')
+
+    def test_errors(self):
+        self._write_template(self.renderer, 'bad1', '{% template %}{% end %}{% end %}', 0)
+        self._write_template(self.renderer, 'sub/bad2', 'no template', 0)
+        for jobs in (1, 2):
+            try:
+                self.renderer.compile_all(jobs=jobs)
+            except symplate.CompileError, error:
+                self.assertEqual([name for name, e in error.errors], ['bad1', 'sub/bad2'])
+                self.assertTrue(all(isinstance(e, symplate.Error) for name, e in error.errors))
+                self.assertTrue('sub/bad2: ' in str(error))
+            else:
+                self.fail('CompileError not raised')
+            self.assertCompiled(['a', 'b', 'sub/c', 'sub/sub/d'])
+
+    def test_manifest(self):
+        self._write_template(self.renderer, 'page', "{% template %}{{ render('sub/c') }}{{ !render(\"a\") }}", 0)
+        self.renderer.compile_all()
+        with open(os.path.join(OUTPUT_DIR, symplate.MANIFEST_NAME)) as f:
+            manifest = json.load(f)
+        self.assertEqual(sorted(manifest['templates']), ['a', 'b', 'page', 'sub/c', 'sub/sub/d'])
+        self.assertEqual(manifest['templates']['page']['depends'], ['a', 'sub/c'])
+        self.assertEqual(manifest['templates']['a']['depends'], [])
+
+        self._write_template(self.renderer, 'top', "{% template %}{{ render('page') }}", 0)
+        self.renderer.compile_all()
+        self.assertEqual(self.renderer.get_dependents('a'), ['page', 'top'])
+        self.assertEqual(self.renderer.get_dependents('page'), ['top'])
+        self.assertEqual(self.renderer.get_dependents('top'), [])
+
+    def test_incremental(self):
+        self.assertEqual(self.renderer.compile_all(incremental=True), ['a', 'b', 'sub/c', 'sub/sub/d'])
+        self.assertEqual(self.renderer.compile_all(incremental=True), [])
+        self._write_template(self.renderer, 'b', '{% template %}B', 0)
+        self.assertEqual(self.renderer.compile_all(incremental=True), ['b'])
+        os.remove(os.path.join(OUTPUT_DIR, 'sub', 'c.py'))
+        self.assertEqual(self.renderer.compile_all(incremental=True), ['sub/c'])
+        self.assertEqual(self.renderer.compile_all(), ['a', 'b', 'sub/c', 'sub/sub/d'])
+
+        renderer = utils.Renderer(template_dir=TEMPLATE_DIR, output_dir=OUTPUT_DIR, preamble='#\n')
+        self.assertEqual(renderer.compile_all(incremental=True), ['a', 'b', 'sub/c', 'sub/sub/d'])
+
+    def test_incremental_inline(self):
+        renderer = utils.Renderer(template_dir=TEMPLATE_DIR, output_dir=OUTPUT_DIR, inline=True)
+        self._write_template(renderer, 'page', "{% template %}{{ !render('sub/c') }}", 0)
+        renderer.compile_all(incremental=True)
+        self._write_template(renderer, 'sub/c', '{% template %}C', 0)
+        self.assertEqual(renderer.compile_all(incremental=True), ['page', 'sub/c'])
+
+    def test_orphans(self):
+        self.renderer.compile_all()
+        os.remove(os.path.join(TEMPLATE_DIR, 'sub', 'c.symp'))
+        os.remove(os.path.join(TEMPLATE_DIR, 'a.symp'))
+        self.assertEqual(self.renderer.compile_all(recursive=False, incremental=True), [])
+        self.assertFalse(os.path.exists(os.path.join(OUTPUT_DIR, 'a.py')))
+        self.assertTrue(os.path.exists(os.path.join(OUTPUT_DIR, 'sub', 'c.py')))
+        self.assertEqual(self.renderer.compile_all(incremental=True), [])
+        self.assertFalse(os.path.exists(os.path.join(OUTPUT_DIR, 'sub', 'c.py')))
+        self.assertTrue(os.path.exists(os.path.join(OUTPUT_DIR, 'sub', 'sub', 'd.py')))
+
+    def test_preload(self):
+        renderer = utils.Renderer(template_dir=TEMPLATE_DIR, output_dir=OUTPUT_DIR, check_mtimes=False)
+        self.assertEqual(renderer.preload(), ['a', 'b', 'sub/c', 'sub/sub/d'])
+        self.assertEqual(sorted(renderer._module_cache), ['a', 'b', 'sub/c', 'sub/sub/d'])
+        self.assertCompiled(['a', 'b', 'sub/c', 'sub/sub/d'])
+
+        renderer = utils.Renderer(template_dir=TEMPLATE_DIR, output_dir=OUTPUT_DIR, check_mtimes=False)
+        self.assertEqual(renderer.preload(['b'], freeze=True), ['b'])
+        self.assertEqual(renderer._module_cache.keys(), ['b'])
+
+    def test_bundle(self):
+        bundle = os.path.join(OUTPUT_DIR, 'templates.symb')
+        self._write_template(self.renderer, 'page', "{% template %}<{{ !render('sub/c') }}>", 0)
+        self.renderer.compile_all(bundle=bundle)
+        shutil.rmtree(TEMPLATE_DIR)
+        shutil.rmtree(OUTPUT_DIR + '/sub')
+
+        renderer = utils.Renderer(template_dir=TEMPLATE_DIR, output_dir=OUTPUT_DIR, bundle=bundle)
+        self.assertEqual(renderer.render('page'), '<sub/c>')
+        self.assertEqual(renderer.render('sub/sub/d'), 'sub/sub/d')
+        self.assertEqual(renderer.preload(), ['a', 'b', 'page', 'sub/c', 'sub/sub/d'])
+        self.assertFalse(os.path.exists(OUTPUT_DIR + '/sub'))
+
+        # a bundle from a different version of Python is ignored
+        with open(bundle, 'wb') as f:
+            f.write('\x00\x00\r\n' + marshal.dumps({}))
+        renderer = utils.Renderer(template_dir=TEMPLATE_DIR, output_dir=OUTPUT_DIR, bundle=bundle)
+        self.assertRaises(OSError, renderer.render, 'page')
+
+        # but a bad or missing bundle is an error
+        with open(bundle, 'wb') as f:
+            f.write('not a bundle')
+        self.assertRaises(ValueError, utils.Renderer, template_dir=TEMPLATE_DIR, output_dir=OUTPUT_DIR, bundle=bundle)
+        with open(bundle, 'wb') as f:
+            f.write(imp.get_magic() + marshal.dumps({'page': None})[:-1])
+        self.assertRaises((EOFError, ValueError), utils.Renderer, template_dir=TEMPLATE_DIR, output_dir=OUTPUT_DIR,
+                          bundle=bundle)
+        self.assertRaises(IOError, utils.Renderer, template_dir=TEMPLATE_DIR, output_dir=OUTPUT_DIR,
+                          bundle=bundle + '.missing')
+
+if __name__ == '__main__':
+    unittest.main()
@@ -0,0 +1,176 @@
+"""Unit tests for template inheritance with {% extends %} and {% block %}."""
+
+import os
+import unittest
+
+import symplate
+import utils
+
+renderer = utils.Renderer()
+
+BASE = """{% template title='Untitled', items=() %}
+<title>{% block title %}{{ title }}{% end block %}</title>
+{% block body %}
+<ul>
+{% for item in items: %}
+<li>{% block item %}{{ item }}{% end block %}</li>
+{% end for %}
+</ul>
+{% end block %}
+<p>{% block footer %}footer{% end block footer %}</p>
+"""
+
+class TestExtends(utils.TestCase):
+    def write_base(self, name='base', template=BASE, _renderer=renderer, adjust_mtime=0):
+        name = 'TestExtends/' + name
+        self._write_template(_renderer, name, template, adjust_mtime)
+        return name
+
+    def compiled_source(self, _renderer=renderer):
+        name = 'TestExtends/test_%s_%d' % (self._testMethodName[5:], utils.TestCase._template_num)
+        with open(os.path.join(_renderer.output_dir, name + '.py')) as f:
+            return f.read()
+
+    def compiled_depends(self, _renderer=renderer):
+        name = 'TestExtends/test_%s_%d' % (self._testMethodName[5:], utils.TestCase._template_num)
+        return _renderer._get_module(name)._depends
+
+    def test_base(self):
+        self.render(BASE)
+        self.assertEqual(self.render(BASE, 'Base', [1, '&']),
+                         '<title>Base</title>\n<ul>\n<li>1</li>\n<li>&amp;</li>\n</ul>\n<p>footer</p>\n')
+
+    def test_extends(self):
+        self.write_base()
+        template = """{% extends 'TestExtends/base' %}
+{% block item %}[{{ item * 2 }}]{% end block %}
+
+{% block footer %}
+new footer
+{% end block %}
+"""
+        self.assertEqual(self.render(template, 'Child', [1, 2]),
+                         '<title>Child</title>\n<ul>\n<li>[2]</li>\n<li>[4]</li>\n</ul>\n<p>\nnew footer\n</p>\n')
+        source = self.compiled_source()
+        self.assertTrue("render('" not in source)
+        self.assertEqual(source.count('def _render('), 1)
+        self.assertEqual(self.compiled_depends(), ('TestExtends/base',))
+
+    def test_template_args(self):
+        self.write_base()
+        template = """{% import os %}
+{% template name %}
+{% extends "TestExtends/base" %}
+{% block title %}{{ name }}{% end block %}
+{% block body %}{{ os.path.basename(name) }}{% end block %}
+"""
+        self.assertEqual(self.render(template, 'a/b&'), '<title>a/b&amp;</title>\nb&amp;\n<p>footer</p>\n')
+
+    def test_multi_level(self):
+        self.write_base()
+        self.write_base('middle', """{% extends 'TestExtends/base' %}
+{% block body %}<div>{% block content %}middle{% end block %}</div>
+{% end block %}{% block footer %}middle footer{% end block %}""")
+        template = """{% extends 'TestExtends/middle' %}{% block content %}child{% end block %}"""
+        self.assertEqual(self.render(template), '<title>Untitled</title>\n<div>child</div>\n<p>middle footer</p>\n')
+        self.assertEqual(self.compiled_depends(), ('TestExtends/base', 'TestExtends/middle'))
+
+    def test_parent_changed(self):
+        for _renderer in [renderer, utils.Renderer(in_memory=True)]:
+            self.write_base('changed', '{% template %}<{% block x %}{% end block %}>', _renderer=_renderer)
+            template = "{% extends 'TestExtends/changed' %}{% block x %}x{% end block %}"
+            self.assertEqual(self.render(template, _renderer=_renderer), '<x>')
+            self.write_base('changed', '{% template %}[{% block x %}{% end block %}]', _renderer=_renderer, adjust_mtime=5)
+            self.assertEqual(self.render(template, _renderer=_renderer, _increment=0), '[x]')
+
+    def test_cache_key(self):
+        self.write_base('key', '{% template %}{% block x %}{% end block %}')
+        template = "{% extends 'TestExtends/key' %}"
+        key = renderer._get_cache_key(template, None)
+        self.write_base('key', '{% template %}!{% block x %}{% end block %}')
+        self.assertNotEqual(renderer._get_cache_key(template, None), key)
+
+    def test_inline(self):
+        inline_renderer = utils.Renderer(inline=True)
+        self.write_base(_renderer=inline_renderer)
+        self.write_base('sub', "{% extends 'TestExtends/base' %}{% block body %}sub{% end block %}",
+                        _renderer=inline_renderer)
+        template = "{% template %}({{ !render('TestExtends/sub', 'Sub') }})"
+        self.assertEqual(self.render(template, _renderer=inline_renderer),
+                         '(<title>Sub</title>\nsub\n<p>footer</p>\n)')
+        self.assertEqual(self.compiled_depends(inline_renderer), ('TestExtends/base', 'TestExtends/sub'))
+
+    def test_not_directive(self):
+        self.assertEqual(self.render("{% template %}{% extends = ['a'] %}{% extends += ['b'] %}{{ extends[0] + extends[1] }}"),
+                         'ab')
+
+    def test_errors(self):
+        self.write_base()
+        self.assertTemplateError(2, 'oops', self.render,
+                                 "{% extends 'TestExtends/base' %}\noops\n{% block title %}{% end block %}")
+        self.assertTemplateError(2, 'block nope', self.render,
+                                 "{% extends 'TestExtends/base' %}\n{% block nope %}{% end block %}")
+        self.assertTemplateError(1, 'missing', self.render, "{% extends 'TestExtends/missing' %}")
+        self.assertTemplateError(1, 'extends', self.render, "{% extends name %}")
+        self.assertTemplateError(2, None, self.render,
+                                 "{% extends 'TestExtends/base' %}\n{% extends 'TestExtends/base' %}")
+        self.assertTemplateError(3, 'block title', self.render,
+                                 "{% extends 'TestExtends/base' %}\n{% block title %}{% end block %}\n"
+                                 "{% block title %}{% end block %}")
+        try:
+            self.render("{% extends 'TestExtends/base' %}\n{% block body %}{% end block %}\n"
+                        "{% block item %}{% end block %}")
+        except symplate.Error, error:
+            self.assertEqual(error.line_num, 3)
+            self.assertTrue("'item' is inside overridden block u'body'" in error.msg, error.msg)
+        else:
+            self.assertTrue(False, 'symplate.Error not raised')
+        self.assertTemplateError(2, 'end block', self.render, "{% template %}\n{% end block %}")
+        self.assertTemplateError(2, 'block x', self.render, "{% template %}\n{% block x %}")
+        self.assertTemplateError(1, 'block x', self.render, "{% block x %}{% end block %}{% template %}")
+
+        name = 'TestExtends/test_errors_%d' % (utils.TestCase._template_num + 1)
+        self.assertTemplateError(1, None, self.render, "{% extends '" + name + "' %}")
+
+        # line numbers are for the template file the error is in
+        self.assertTemplateError(3, '{{ item', self.render,
+                                 "{% extends 'TestExtends/base' %}\n{% block item %}\n{{ item\n{% end block %}")
+        bad_filename = os.path.abspath(renderer._get_filenames(self.write_base('bad', """{% template %}
+<{% block x %}{% end block %}>
+{{ oops
+"""))['symplate'])
+        try:
+            self.render("{% extends 'TestExtends/bad' %}{% block x %}x{% end block %}")
+        except symplate.Error, error:
+            self.assertEqual((error.filename, error.line_num, error.line), (bad_filename, 3, '{{ oops'))
+            self.assertTrue(bad_filename + ' line 3' in str(error))
+        else:
+            self.assertTrue(False, 'symplate.Error not raised')
+
+    def test_line_numbers(self):
+        marker_renderer = utils.Renderer(line_markers=True)
+        base_name = self.write_base(_renderer=marker_renderer)
+        base_filename = os.path.abspath(marker_renderer._get_filenames(base_name)['symplate'])
+        template = """{% extends 'TestExtends/base' %}
+
+{% block item %}
+[{{ item * 2 }}]
+{% end block %}
+"""
+        self.assertEqual(self.render(template, 'Child', [1], _renderer=marker_renderer),
+                         '<title>Child</title>\n<ul>\n<li>\n[2]\n</li>\n</ul>\n<p>footer</p>\n')
+        source = self.compiled_source(marker_renderer)
+        self.assertTrue('  # line: %s:1\n' % base_filename in source)
+        self.assertTrue('filt(title),  # line: %s:2\n' % base_filename in source)
+        self.assertTrue('for item in items:  # line: %s:5\n' % base_filename in source)
+        self.assertTrue('filt(item * 2),  # line: 4\n' in source)
+
+        name = 'TestExtends/test_line_numbers_%d' % utils.TestCase._template_num
+        filename = os.path.abspath(marker_renderer._get_filenames(name)['symplate'])
+        line_map = marker_renderer._get_module(name)._line_map
+        self.assertTrue((base_filename, 5) in line_map.values())
+        self.assertTrue((filename, 4) in line_map.values())
+        self.assertFalse((filename, 5) in line_map.values())
+
+if __name__ == '__main__':
+    unittest.main()
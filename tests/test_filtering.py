@@ -2,6 +2,7 @@
 
 import unittest
 
+import symplate
 import utils
 
 class TestFiltering(utils.TestCase):
@@ -20,6 +21,25 @@ class TestFiltering(utils.TestCase):
     def test_raw(self):
         self.assertEqual(self.render("{% template %}{{ !'<b>' }}"), '<b>')
 
+    def test_render_returns_markup(self):
+        output = self.render("{% template %}<b>{{ '&' }}</b>")
+        self.assertEqual(output, '<b>&amp;</b>')
+        self.assertTrue(isinstance(output, symplate.Markup))
+
+    def test_render_not_escaped_twice(self):
+        self._write_template(utils.renderer, 'TestFiltering/sub', "{% template x %}<b>{{ x }}</b>", 0)
+        self.assertEqual(self.render("{% template %}{{ render('TestFiltering/sub', '&') }}"), '<b>&amp;</b>')
+
+    def test_render_other_filter_not_markup(self):
+        renderer = utils.Renderer(default_filter=lambda filename: 'symplate.text_filter' if 'sub' in filename
+                                                                  else 'symplate.html_filter')
+        self._write_template(renderer, 'TestFiltering/text_sub', "{% template x %}<i>{{ x }}</i>", 0)
+        output = renderer.render('TestFiltering/text_sub', '&')
+        self.assertEqual(output, '<i>&</i>')
+        self.assertFalse(isinstance(output, symplate.Markup))
+        self.assertEqual(self.render("{% template %}{{ render('TestFiltering/text_sub', '&') }}", _renderer=renderer),
+                         '&lt;i&gt;&amp;&lt;/i&gt;')
+
     def test_override_default_filter_string(self):
         renderer = utils.Renderer(default_filter='lambda s: s.upper()')
         self.assertEqual(self.render("{% template %}{{ 'a&z' }}", _renderer=renderer), 'A&Z')
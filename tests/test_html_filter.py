@@ -2,7 +2,8 @@
 
 import unittest
 
-from symplate import html_filter
+import symplate
+from symplate import html_filter, Markup
 
 class TestHtmlFilter(unittest.TestCase):
     def test_str(self):
@@ -18,8 +19,45 @@ class TestHtmlFilter(unittest.TestCase):
 
     def test_non_string(self):
         self.assertEqual(html_filter(1234), u'1234')
+        self.assertEqual(html_filter(12345678901234567890), u'12345678901234567890')
+        self.assertEqual(html_filter(1.5), u'1.5')
+        self.assertEqual(html_filter(True), u'True')
         self.assertEqual(html_filter(['<']), u'[&#39;&lt;&#39;]')
 
+    def test_number_subclass(self):
+        class Tag(int):
+            def __unicode__(self):
+                return u'<%d>' % self
+        self.assertEqual(html_filter(Tag(1)), u'&lt;1&gt;')
+
+    def test_unchanged(self):
+        s = u'nothing to escape'
+        self.assertTrue(html_filter(s) is s)
+        self.assertEqual(html_filter(u'&&'), u'&amp;&amp;')
+        self.assertEqual(html_filter(u'""<'), u'&#34;&#34;&lt;')
+
+    def test_wrap_escape(self):
+        # like markupsafe.Markup, whose methods escape their arguments
+        class EscapingMarkup(unicode):
+            def replace(self, old, new, count=-1):
+                return EscapingMarkup(unicode.replace(self, old, symplate._escape_html(new), count))
+        escape = symplate._wrap_escape(lambda s: EscapingMarkup(symplate._escape_html(s)))
+        s = u'nothing to escape'
+        self.assertTrue(escape(s) is s)
+        escaped = escape(u'<a>\n')
+        self.assertEqual(type(escaped), unicode)
+        self.assertEqual(escaped.replace(u'\n', u'<br>'), u'&lt;a&gt;<br>')
+
+    def test_markup(self):
+        markup = Markup(u'<b>&amp;</b>')
+        self.assertTrue(html_filter(markup) is markup)
+
+    def test_html_method(self):
+        class Safe(object):
+            def __html__(self):
+                return u'<i>safe</i>'
+        self.assertEqual(html_filter(Safe()), u'<i>safe</i>')
+
     def test_none(self):
         self.assertEqual(html_filter(None), u'')
 
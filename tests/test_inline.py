@@ -0,0 +1,81 @@
+"""Unit tests for inlining sub-templates at compile time."""
+
+import os
+import unittest
+
+import utils
+
+renderer = utils.Renderer(inline=True)
+
+class TestInline(utils.TestCase):
+    def write_sub(self, name, template, _renderer=renderer, adjust_mtime=0):
+        name = 'TestInline/' + name
+        self._write_template(_renderer, name, template, adjust_mtime)
+        return name
+
+    def compiled_source(self, _renderer=renderer):
+        name = 'TestInline/test_%s_%d' % (self._testMethodName[5:], utils.TestCase._template_num)
+        with open(os.path.join(_renderer.output_dir, name + '.py')) as f:
+            return f.read()
+
+    def test_args(self):
+        self.write_sub('args', '{% template a, b=2, c=3 %}{{ a }}{{ b }}{{ c }}')
+        template = r"""{% template x %}
+<{{ !render('TestInline/args', x) }}>
+<{{ !render('TestInline/args', x, 5) }}>
+<{{ !render('TestInline/args', c=x, b=4, a=6) }}>
+"""
+        self.assertEqual(self.render(template, '&', _renderer=renderer), '<&amp;23>\n<&amp;53>\n<64&amp;>\n')
+        self.assertTrue("render('" not in self.compiled_source())
+        self.assertEqual(self.render(template, '&', _increment=0), '<&amp;23>\n<&amp;53>\n<64&amp;>\n')
+
+    def test_space_before_paren(self):
+        self.write_sub('space', '{% template a %}<{{ a }}>')
+        template = "{% template %}{{ !render ('TestInline/space', 1) }}{{ !render\t('TestInline/space', 2) }}"
+        self.assertEqual(self.render(template, _renderer=renderer), '<1><2>')
+        self.assertTrue("render ('" not in self.compiled_source())
+
+    def test_nested(self):
+        self.write_sub('inner', "{% template %}{% x = 'inner' %}{{ x }}")
+        self.write_sub('outer', "{% template x %}{{ x }}[{{ !render('TestInline/inner') }}]{{ x }}")
+        output = self.render("{% template %}{% x = 'top' %}{{ !render('TestInline/outer', 'outer') }}{{ x }}",
+                             _renderer=renderer)
+        self.assertEqual(output, 'outer[inner]outertop')
+        source = self.compiled_source()
+        self.assertTrue('_inline_1' in source)
+        self.assertTrue("_depends = ('TestInline/inner', 'TestInline/outer')" in source)
+
+    def test_module_level_code(self):
+        self.write_sub('helper', "{% def helper(): return 'sub' %}{% template %}{{ helper() }}")
+        output = self.render("{% def helper(): return 'top' %}{% template %}{{ !render('TestInline/helper') }}{{ helper() }}",
+                             _renderer=renderer)
+        self.assertEqual(output, 'subtop')
+
+    def test_recursive(self):
+        name = 'TestInline/test_recursive_%d' % (utils.TestCase._template_num + 1)
+        template = "{% template n %}{{ n }}{% if n: %}{{ !render('" + name + "', n - 1) }}{% end %}"
+        self.assertEqual(self.render(template, 3, _renderer=renderer), '3210')
+
+    def test_not_literal(self):
+        name = self.write_sub('notlit', '{% template %}notlit')
+        self.assertEqual(self.render("{% template name %}{{ !render(name) }}", name, _renderer=renderer), 'notlit')
+        self.assertTrue('render(name)' in self.compiled_source())
+
+    def test_sub_template_changed(self):
+        for _renderer in [renderer, utils.Renderer(inline=True, in_memory=True)]:
+            self.write_sub('changed', '{% template %}one', _renderer=_renderer)
+            template = "{% template %}{{ !render('TestInline/changed') }}"
+            self.assertEqual(self.render(template, _renderer=_renderer), 'one')
+            self.write_sub('changed', '{% template %}two', _renderer=_renderer, adjust_mtime=5)
+            self.assertEqual(self.render(template, _renderer=_renderer, _increment=0), 'two')
+
+    def test_streaming(self):
+        _renderer = utils.Renderer(inline=True, streaming=True)
+        self.write_sub('streaming', '{% template %}{% for i in range(1000): %}.{% end %}', _renderer=_renderer)
+        chunks = list(self.render("{% template %}a{{ !render('TestInline/streaming') }}b",
+                                  _renderer=_renderer, _method='render_iter'))
+        self.assertTrue(len(chunks) > 1)
+        self.assertEqual(''.join(chunks), 'a' + '.' * 1000 + 'b')
+
+if __name__ == '__main__':
+    unittest.main()
@@ -0,0 +1,78 @@
+"""Unit tests for the minify option."""
+
+import unittest
+
+import symplate
+import utils
+
+renderer = utils.Renderer(minify=True)
+
+class TestMinify(utils.TestCase):
+    def test_whitespace(self):
+        template = """{% template items %}
+<ul>
+    {% for item in items: %}
+    <li  class="x">  {{ item }}   </li>
+
+
+    {% end for %}
+</ul>
+"""
+        self.assertEqual(self.render(template, ['a  b', 'c'], _renderer=renderer),
+                         '<ul>\n <li  class="x"> a  b </li>\n <li  class="x"> c </li>\n</ul>\n')
+
+    def test_attributes(self):
+        template = """{% template x %}
+<div title="a    b"  data-x='{{ x }}   >  y'>  1  <  2  </div>
+  <input value="{% if x: %}  c  {% end if %}"  >  <!--  z  -->   ."""
+        self.assertEqual(self.render(template, 'q', _renderer=renderer),
+                         '<div title="a    b"  data-x=\'q   >  y\'> 1 < 2 </div>\n'
+                         '<input value="  c  "  > <!--  z  --> .')
+
+    def test_raw_elements(self):
+        template = """{% template x %}
+<div>
+    <PRE class="code">
+  {{ x }}
+    one</pre  >
+    <textarea>  {% if x: %}  a  {% end if %}  </textarea>
+  <script>
+    var  a = 1;
+  </SCRIPT>
+    <p>  end  </p>
+</div>
+"""
+        self.assertEqual(self.render(template, 1, _renderer=renderer),
+                         '<div>\n<PRE class="code">\n  1\n    one</pre  >\n'
+                         '<textarea>    a    </textarea>\n'
+                         '<script>\n    var  a = 1;\n  </SCRIPT>\n<p> end </p>\n</div>\n')
+
+    def test_variants(self):
+        variant_renderer = utils.Renderer(minify=True, streaming=True, bytes_output=True)
+        template = u"{% template %}<pre> \xe9  </pre>  <b>  \xe9  </b>"
+        self.assertEqual(self.render(template, _renderer=variant_renderer), u'<pre> \xe9  </pre> <b> \xe9 </b>')
+        self.assertEqual(''.join(self.render(template, _renderer=variant_renderer, _increment=0, _method='render_iter')),
+                         u'<pre> \xe9  </pre> <b> \xe9 </b>')
+        self.assertEqual(self.render(template, _renderer=variant_renderer, _increment=0, _method='render_bytes'),
+                         '<pre> \xc3\xa9  </pre> <b> \xc3\xa9 </b>')
+
+    def test_line_numbers(self):
+        line_renderer = utils.Renderer(minify=True, line_markers=True)
+        self.render('{% template %}\n\n\n   <p>{{ 1 }}</p>\n', _renderer=line_renderer)
+        name = 'TestMinify/test_line_numbers_%d' % utils.TestCase._template_num
+        with open(line_renderer._get_module(name).__file__.replace('.pyc', '.py')) as f:
+            self.assertTrue('filt(1),  # line: 4\n' in f.read())
+
+    def test_compile_options(self):
+        self.assertNotEqual(renderer._get_compile_options(), utils.renderer._get_compile_options())
+
+    def test_minify_html(self):
+        self.assertEqual(symplate._minify_html(u' a \t\n b ', None), (u' a\nb ', None))
+        self.assertEqual(symplate._minify_html(u'x  <script src=y>  ', None), (u'x <script src=y>  ', 'script'))
+        self.assertEqual(symplate._minify_html(u'  </script>  <b>', 'script'), (u'  </script> <b>', None))
+        self.assertEqual(symplate._minify_html(u'\xa0 \xa0', None), (u'\xa0 \xa0', None))
+        self.assertEqual(symplate._minify_html(u' <a  href="x  ', None), (u' <a  href="x  ', '<"'))
+        self.assertEqual(symplate._minify_html(u'  y"  >  b', '<"'), (u'  y"  > b', None))
+
+if __name__ == '__main__':
+    unittest.main()
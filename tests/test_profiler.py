@@ -0,0 +1,103 @@
+"""Unit tests for line_markers and the template Profiler."""
+
+import os
+import unittest
+
+import symplate
+import utils
+
+renderer = utils.Renderer(line_markers=True)
+
+class TestProfiler(utils.TestCase):
+    def compiled_module(self):
+        name = 'TestProfiler/test_%s_%d' % (self._testMethodName[5:], utils.TestCase._template_num)
+        return name, renderer._get_module(name)
+
+    def test_line_markers(self):
+        template = """{% template x %}
+<p>{{ x }}</p>
+{% def f(): %}
+{% y = 1 + \\
+       2 %}
+<b>{{ y }}</b>
+{% end def %}
+{% f() %}
+"""
+        self.assertEqual(self.render(template, 'a', _renderer=renderer), '<p>a</p>\n<b>3</b>\n')
+        name, module = self.compiled_module()
+        with open(module.__file__.replace('.pyc', '.py')) as f:
+            source = f.read()
+        self.assertTrue('def _render(_renderer, x):  # line: 1\n' in source)
+        self.assertTrue('    def f():  # line: 3\n' in source)
+        self.assertTrue('filt(x),  # line: 2\n' in source)
+        self.assertTrue('y = 1 + \\\n' in source)
+        self.assertTrue('2  # line: 5\n' in source)
+        self.assertTrue('filt(y),  # line: 6\n' in source)
+        self.assertTrue('    f()  # line: 8\n' in source)
+        self.assertTrue("    return symplate.Markup(u''.join(_output))  # line: 9\n" in source)
+
+        lines = source.splitlines()
+        filename = os.path.abspath(renderer._get_filenames(name)['symplate'])
+        for py_line, (symp_filename, line_num) in module._line_map.items():
+            self.assertEqual(symp_filename, filename)
+            if '# line: ' in lines[py_line - 1]:
+                self.assertTrue(lines[py_line - 1].endswith('# line: %d' % line_num))
+
+    def test_multiline_string(self):
+        template = '{% template %}\n{% y = """one\ntwo""" %}{{ y }}\n{% z = \'\'\'a\nb\'\'\' + """\n""" %}{{ z }}'
+        self.assertEqual(self.render(template, _renderer=renderer), 'one\n    two\na\n    b\n    ')
+        self.assertEqual(self.render(template, _renderer=utils.renderer), 'one\n    two\na\n    b\n    ')
+        self.assertEqual(symplate._lines_in_string('x = 1\ny = """a\nb\n"""\nz = 2'), set([1, 2]))
+        self.assertEqual(symplate._lines_in_string('y = """a'), set())
+
+    def test_no_line_markers(self):
+        self.render('{% template %}x', _renderer=utils.renderer)
+        self.assertFalse(hasattr(utils.renderer._get_module('TestProfiler/test_no_line_markers_%d' % utils.TestCase._template_num), '_line_map'))
+        self.assertNotEqual(utils.renderer._get_compile_options(), renderer._get_compile_options())
+
+    def test_inline(self):
+        inline_renderer = utils.Renderer(line_markers=True, inline=True)
+        self._write_template(inline_renderer, 'TestProfiler/sub', '{% template %}\n\n<{{ 1 }}>', 0)
+        self.assertEqual(self.render("{% template %}{{ !render('TestProfiler/sub') }}", _renderer=inline_renderer), '\n<1>')
+        module = inline_renderer._get_module('TestProfiler/test_inline_%d' % utils.TestCase._template_num)
+        sub_filename = os.path.abspath(inline_renderer._get_filenames('TestProfiler/sub')['symplate'])
+        self.assertTrue((sub_filename, 3) in module._line_map.values())
+
+    def test_profiler(self):
+        template = """{% template items %}
+{% def item(x): %}
+<li>{{ x }}</li>
+{% end def %}
+{% for x in items: %}
+{% item(x) %}
+{% end for %}
+"""
+        self.render(template, [], _renderer=renderer)
+        name = 'TestProfiler/test_profiler_%d' % utils.TestCase._template_num
+        filename = os.path.abspath(renderer._get_filenames(name)['symplate'])
+        with symplate.Profiler() as profiler:
+            for i in range(3):
+                self.assertEqual(renderer.render(name, [1, 2]), '<li>1</li>\n<li>2</li>\n')
+        self.assertEqual(profiler.functions[(filename, 1, 'template')][0], 3)
+        self.assertEqual(profiler.functions[(filename, 2, 'def item')][0], 6)
+        self.assertEqual(profiler.lines[(filename, 3)][0], 6)
+        self.assertEqual(profiler.lines[(filename, 6)][0], 6)
+        self.assertTrue(profiler.lines[(filename, 5)][1] > 0)
+
+        report = profiler.report()
+        self.assertTrue('Template functions by time:' in report)
+        self.assertTrue('%s:2 def item' % filename in report)
+        self.assertTrue('%s:3  <li>{{ x }}</li>' % filename in report)
+
+        bytes_renderer = utils.Renderer(line_markers=True, bytes_output=True, in_memory=True)
+        bytes_renderer.render_bytes(name, [1])
+        with symplate.Profiler() as profiler:
+            bytes_renderer.render_bytes(name, [1])
+        self.assertEqual(profiler.functions[(filename, 1, 'template (render_bytes)')][0], 1)
+
+        profiler.reset()
+        self.assertEqual(profiler.lines, {})
+        self.assertEqual(profiler.functions, {})
+
+if __name__ == '__main__':
+    unittest.main()
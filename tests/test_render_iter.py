@@ -0,0 +1,93 @@
+"""Unit tests for streaming output with render_iter() and render_into()."""
+
+import StringIO
+import unittest
+
+import utils
+
+renderer = utils.Renderer(streaming=True)
+
+class TestRenderIter(utils.TestCase):
+    def render_chunks(self, template, *args, **kwargs):
+        kwargs.setdefault('_renderer', renderer)
+        return list(self.render(template, _method='render_iter', *args, **kwargs))
+
+    def test_simple(self):
+        self.assertEqual(self.render_chunks('{% template x %}a{{ x }}b', 'X'), ['aXb'])
+        self.assertEqual(self.render_chunks('{% template %}'), [])
+
+    def test_matches_render(self):
+        template = r"""
+{% template items %}
+{% def item(i): %}
+<li>{{ i }}</li>
+{% end def %}
+<ul>
+{% for i in items: %}
+    {% if i % 2: %}
+    {% item(i) %}
+    {% else: %}
+<li>{{ !'even' }}</li>
+    {% end if %}
+{% end for %}
+</ul>
+"""
+        chunks = self.render_chunks(template, range(1000))
+        self.assertTrue(len(chunks) > 1)
+        self.assertEqual(u''.join(chunks), self.render(template, range(1000), _renderer=renderer, _increment=0))
+
+    def test_lazy(self):
+        chunks = self.render(r"""
+{% template %}
+{% for i in range(1000): %}
+{{ i }}
+{% end for %}
+{{ 1 / 0 }}
+""", _renderer=renderer, _method='render_iter')
+        self.assertTrue(chunks.next().startswith('0\n1\n'))
+        self.assertRaises(ZeroDivisionError, list, chunks)
+
+    def test_nested_render(self):
+        self._write_template(renderer, 'TestRenderIter/sub', '{% template x %}<{{ x }}>', 0)
+        chunks = self.render_chunks("{% template %}a{{ !render('TestRenderIter/sub', 'b') }}c")
+        self.assertEqual(chunks, ['a', '<b>', 'c'])
+
+    def test_not_streaming(self):
+        chunks = self.render_chunks('{% template %}{% for i in range(1000): %}.{% end %}', _renderer=utils.renderer)
+        self.assertEqual(chunks, ['.' * 1000])
+
+class WriteRecorder(object):
+    def __init__(self):
+        self.writes = []
+
+    def write(self, data):
+        self.writes.append(data)
+
+class TestRenderInto(utils.TestCase):
+    def test_simple(self):
+        f = StringIO.StringIO()
+        num_bytes = self.render(u'{% template x %}\u2019{{ x }}', _method='render_into', _renderer=renderer, *(f, u'<\u2019>'))
+        self.assertEqual(f.getvalue(), '\xe2\x80\x99&lt;\xe2\x80\x99&gt;')
+        self.assertEqual(num_bytes, 14)
+
+    def test_encoding(self):
+        f = StringIO.StringIO()
+        self.render(u'{% template %}\u2019', f, _method='render_into', _renderer=renderer, _encoding='utf-16-le')
+        self.assertEqual(f.getvalue(), '\x19\x20')
+
+    def test_buffer_size(self):
+        template = '{% template %}{% for i in range(10000): %}{{ i % 10 }}{% end %}'
+        f = WriteRecorder()
+        self.assertEqual(self.render(template, f, _method='render_into', _renderer=renderer, _buffer_size=1000), 10000)
+        self.assertTrue(len(f.writes) > 5)
+        self.assertTrue(all(len(w) >= 1000 for w in f.writes[:-1]))
+        self.assertEqual(''.join(f.writes), '0123456789' * 1000)
+
+    def test_requires_streaming(self):
+        f = StringIO.StringIO()
+        self.assertRaises(ValueError, self.render, '{% template %}x', f, _method='render_into',
+                          _renderer=utils.renderer)
+        self.assertEqual(f.getvalue(), '')
+
+if __name__ == '__main__':
+    unittest.main()
@@ -1,11 +1,29 @@
 """Unit tests for Renderer class and its keyword arg options."""
 
 import os
+import pickle
+import shutil
 import sys
+import threading
+import time
 import unittest
 
+import symplate
 import utils
 
+class CountingRenderer(utils.Renderer):
+    """Renderer that records the names of the templates it compiles."""
+    compile_delay = 0
+
+    def __init__(self, **kwargs):
+        utils.Renderer.__init__(self, **kwargs)
+        self.compiles = []
+
+    def compile(self, name, verbose=False):
+        self.compiles.append(name)
+        time.sleep(self.compile_delay)
+        utils.Renderer.compile(self, name, verbose=verbose)
+
 class TestRenderer(utils.TestCase):
     def test_template_dir(self):
         template_dir = os.path.join(os.path.dirname(__file__), 'symplates2')
@@ -36,6 +54,67 @@ class TestRenderer(utils.TestCase):
         self.assertEquals(self.render('{% template %}cmf2', _renderer=renderer, _increment=0, _adjust_mtime=5), 'cmf2')
         self.assertEquals(self.render('{% template %}cmf3', _renderer=renderer, _increment=0, _adjust_mtime=5), 'cmf2')
 
+    def test_check_interval(self):
+        renderer = utils.Renderer(check_mtimes=True, check_interval=60)
+        self.assertEquals(self.render('{% template %}ci1', _renderer=renderer), 'ci1')
+        self.assertEquals(self.render('{% template %}ci2', _renderer=renderer, _increment=0, _adjust_mtime=5), 'ci1')
+        # renders within the interval don't take any locks
+        load_locks_lock = renderer._load_locks_lock
+        renderer._load_locks_lock = None
+        name = 'TestRenderer/test_check_interval_%d' % utils.TestCase._template_num
+        self.assertEquals(renderer.render(name), 'ci1')
+        renderer._load_locks_lock = load_locks_lock
+        renderer.check_interval = 0.01
+        time.sleep(0.02)
+        self.assertEquals(self.render('{% template %}ci2', _renderer=renderer, _increment=0, _adjust_mtime=5), 'ci2')
+
+    def test_watcher(self):
+        renderer = utils.Renderer(check_mtimes=True)
+        renderer.start_watcher(interval=0.01, use_inotify=False)
+        try:
+            self.assertEquals(self.render('{% template %}w1', _renderer=renderer), 'w1')
+            self.assertEquals(len(renderer._module_cache), 1)
+            self.render('{% template %}w2', _renderer=renderer, _increment=0, _adjust_mtime=5)
+            for i in range(100):
+                if not renderer._module_cache:
+                    break
+                time.sleep(0.01)
+            self.assertEquals(self.render('{% template %}w3', _renderer=renderer, _increment=0, _adjust_mtime=10), 'w3')
+        finally:
+            renderer.stop_watcher()
+        self.assertEquals(renderer._module_cache, {})
+
+    def test_single_flight(self):
+        renderer = CountingRenderer(check_mtimes=False)
+        renderer.compile_delay = 0.05
+        filename = self._write_template(renderer, 'TestRenderer/test_single_flight',
+                                        '{% template x %}sf{{ x }}', 0)
+        outputs = []
+        threads = [threading.Thread(target=lambda i=i: outputs.append(
+                       renderer.render('TestRenderer/test_single_flight', i)))
+                   for i in range(8)]
+        for thread in threads:
+            thread.start()
+        for thread in threads:
+            thread.join()
+        self.assertEqual(sorted(outputs), ['sf%d' % i for i in range(8)])
+        self.assertEqual(renderer.compiles, ['TestRenderer/test_single_flight'])
+
+    def test_compile_if_stale(self):
+        renderer = CountingRenderer()
+        name = 'TestRenderer/test_compile_if_stale'
+        self._write_template(renderer, name, '{% template %}cis', 0)
+        renderer._compile_if_stale(name, lambda: False)
+        self.assertEqual(renderer.compiles, [])
+        renderer._compile_if_stale(name, lambda: True)
+        self.assertEqual(renderer.compiles, [name])
+        py_name = renderer._get_filenames(name)['py']
+        self.assertTrue(os.path.exists(os.path.splitext(py_name)[0] + '.lock'))
+        temp_names = [n for n in os.listdir(os.path.dirname(py_name)) if n.endswith('.tmp')]
+        self.assertEqual(temp_names, [])
+        self.assertEqual(renderer.render(name), 'cis')
+        self.assertEqual(renderer.compiles, [name])
+
     def test_auto_compile_false(self):
         renderer = utils.Renderer(auto_compile=False)
         self.assertRaises(ImportError, self.render, '{% template %}foo', _renderer=renderer)
@@ -56,6 +135,101 @@ class TestRenderer(utils.TestCase):
         finally:
             sys.path = saved_path
 
+    def test_in_memory(self):
+        output_dir = os.path.join(os.path.dirname(__file__), 'symplouts_mem')
+        renderer = utils.Renderer(output_dir=output_dir, in_memory=True)
+        self.assertEqual(self.render('{% template x %}im{{ x }}', 1, _renderer=renderer), 'im1')
+        self.assertEqual(self.render('{% template x %}mi{{ x }}', 2, _renderer=renderer, _increment=0, _adjust_mtime=5), 'mi2')
+        self.assertFalse(os.path.exists(output_dir))
+        self.assertFalse([name for name in sys.modules if 'symplouts_mem' in name])
+
+    def test_cache_dir(self):
+        cache_dir = os.path.join(os.path.dirname(__file__), 'symplouts_cache')
+        if os.path.exists(cache_dir):
+            shutil.rmtree(cache_dir)
+        renderer = utils.Renderer(cache_dir=cache_dir)
+        self.assertEqual(self.render('{% template %}cd', _renderer=renderer), 'cd')
+        cache_files = os.listdir(cache_dir)
+        self.assertEqual(len(cache_files), 1)
+        self.assertTrue(cache_files[0].endswith('.symc'))
+
+        class NoCompileRenderer(utils.Renderer):
+            def _compile_string(self, template, filename=None):
+                raise AssertionError('template compiled, not loaded from cache')
+        renderer = NoCompileRenderer(cache_dir=cache_dir)
+        self.assertEqual(self.render('{% template %}cd', _renderer=renderer, _increment=0), 'cd')
+
+        renderer = utils.Renderer(cache_dir=cache_dir, preamble='#\n')
+        self.assertEqual(self.render('{% template %}cd', _renderer=renderer, _increment=0), 'cd')
+        self.assertEqual(len(os.listdir(cache_dir)), 2)
+
+    def test_render_cached(self):
+        renderer = utils.Renderer(check_mtimes=False)
+        template = '{% template calls, x, y=0 %}{% calls.append(x) %}{{ x }}{{ y }}'
+        class Calls(object):
+            def __init__(self):
+                self.calls = []
+            def append(self, x):
+                self.calls.append(x)
+        calls = Calls()
+        self.assertEqual(self.render(template, calls, 1, y=2, _renderer=renderer, _method='render_cached'), '12')
+        self.assertEqual(self.render(template, calls, 1, y=2, _renderer=renderer, _method='render_cached', _increment=0), '12')
+        self.assertEqual(self.render(template, calls, 2, _renderer=renderer, _method='render_cached', _increment=0), '20')
+        self.assertEqual((renderer.result_cache.hits, renderer.result_cache.misses), (1, 2))
+        self.assertEqual(calls.calls, [1, 2])
+
+        calls = []
+        self.assertEqual(self.render(template, calls, 3, _renderer=renderer, _method='render_cached', _increment=0), '30')
+        self.assertEqual(self.render(template, calls, 3, _renderer=renderer, _method='render_cached', _increment=0), '30')
+        self.assertEqual(calls, [3, 3])
+
+        calls = Calls()
+        self.assertEqual(self.render(template, calls, 1, y=1, _renderer=renderer, _method='render_cached', _increment=0), '11')
+        self.assertEqual(self.render(template, calls, True, y=1, _renderer=renderer, _method='render_cached', _increment=0), 'True1')
+        self.assertEqual(self.render(template, calls, 1.0, y=1.0, _renderer=renderer, _method='render_cached', _increment=0), '1.01.0')
+        self.assertEqual(self.render(template, calls, 1, y=True, _renderer=renderer, _method='render_cached', _increment=0), '1True')
+        self.assertEqual(calls.calls, [1, True, 1.0, 1])
+
+        renderer = utils.Renderer(check_mtimes=False, result_cache=symplate.LRUCache(max_entries=1))
+        calls = Calls()
+        self.assertEqual(self.render(template, calls, 4, _renderer=renderer, _method='render_cached', _increment=0), '40')
+        self.assertEqual(self.render(template, calls, 5, _renderer=renderer, _method='render_cached', _increment=0), '50')
+        self.assertEqual(len(renderer.result_cache), 1)
+
+    def test_render_many(self):
+        renderer = CountingRenderer(check_mtimes=False)
+        self.render('{% template x, y=0 %}{{ x }}{{ y }};', 1, _renderer=renderer)
+        name = 'TestRenderer/test_render_many_%d' % utils.TestCase._template_num
+        arg_list = [(1,), (2, 3), {'x': 4, 'y': 5}, '<']
+        expected = ['10;', '23;', '45;', '&lt;0;']
+        self.assertEqual(renderer.render_many(name, arg_list), expected)
+        self.assertEqual(renderer.render_many(name, iter(arg_list)), expected)
+        self.assertEqual(renderer.render_many(name, []), [])
+        for workers in (2, 3, 0):
+            self.assertEqual(renderer.render_many(name, arg_list * 10, workers=workers), expected * 10)
+        # workers=None renders in this process, however many CPUs there are
+        cpu_count, pool = symplate.multiprocessing.cpu_count, symplate.multiprocessing.Pool
+        symplate.multiprocessing.cpu_count = lambda: 4
+        symplate.multiprocessing.Pool = None
+        try:
+            self.assertEqual(renderer.render_many(name, arg_list, workers=None), expected)
+        finally:
+            symplate.multiprocessing.cpu_count, symplate.multiprocessing.Pool = cpu_count, pool
+        self.assertEqual(renderer.compiles, [name])
+
+    def test_pickle(self):
+        # worker processes get a pickled Renderer where they aren't forked
+        renderer = utils.Renderer(instrument=True, fragment_cache=symplate.LRUCache(max_entries=5))
+        self.render('{% template x %}{{ x }}', '<', _renderer=renderer)
+        name = 'TestRenderer/test_pickle_%d' % utils.TestCase._template_num
+        unpickled = pickle.loads(pickle.dumps(renderer, pickle.HIGHEST_PROTOCOL))
+        self.assertEqual(unpickled.output_dir, renderer.output_dir)
+        self.assertEqual(unpickled.fragment_cache.max_entries, 5)
+        self.assertEqual(unpickled.stats(), {})
+        self.assertEqual(unpickled.render(name, '&'), '&amp;')
+        self.assertEqual(unpickled.stats()[name]['renders'], 1)
+        self.assertEqual(renderer.stats()[name]['renders'], 1)
+
     def test_preamble(self):
         renderer = utils.Renderer(preamble="def preamble_func(): return '42'\n")
         self.assertEquals(self.render('{% template %}{{ preamble_func() }}', _renderer=renderer), '42')
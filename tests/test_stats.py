@@ -0,0 +1,90 @@
+"""Unit tests for Renderer instrumentation (instrument=True and stats())."""
+
+import os
+import unittest
+
+import utils
+
+class TestStats(utils.TestCase):
+    def test_off(self):
+        renderer = utils.Renderer()
+        self.assertEqual(self.render('{% template %}off', _renderer=renderer), 'off')
+        self.assertEqual(renderer.stats(), {})
+
+    def test_counts(self):
+        renderer = utils.Renderer(check_mtimes=False, instrument=True)
+        self.assertEqual(self.render('{% template x %}c{{ x }}', 1, _renderer=renderer), 'c1')
+        name = 'TestStats/test_counts_%d' % utils.TestCase._template_num
+        self.assertEqual(renderer.render(name, 22), 'c22')
+        stats = renderer.stats()[name]
+        self.assertEqual(stats['renders'], 2)
+        self.assertEqual(stats['output_size'], 5)
+        self.assertEqual(stats['cache_hits'], 1)
+        self.assertEqual(stats['cache_misses'], 1)
+        self.assertEqual(stats['compiles'], 1)
+        self.assertTrue(stats['compile_time'] > 0)
+        self.assertEqual(sum(stats['buckets']), 2)
+
+        renderer.reset_stats()
+        self.assertEqual(renderer.stats(), {})
+
+    def test_nested(self):
+        renderer = utils.Renderer(check_mtimes=False, instrument=True)
+        self._write_template(renderer, 'TestStats/sleep', '{% template %}{% time.sleep(0.02) %}z', 0)
+        template = "{% template %}{% time.sleep(0.01) %}<{{ !render('TestStats/sleep') }}>"
+        renderer.preamble = 'import time\n'
+        self.assertEqual(self.render(template, _renderer=renderer), '<z>')
+        name = 'TestStats/test_nested_%d' % utils.TestCase._template_num
+        stats = renderer.stats()
+        outer = stats[name]
+        inner = stats['TestStats/sleep']
+        self.assertTrue(outer['total_time'] >= 0.03)
+        # self time excludes the nested render; compare the totals rather
+        # than the sleep times, which can be much longer on a loaded machine
+        self.assertTrue(outer['self_time'] >= 0.01)
+        self.assertTrue(abs(outer['self_time'] - (outer['total_time'] - inner['total_time'])) < 0.005)
+        self.assertTrue(inner['total_time'] >= 0.02)
+        self.assertEqual(inner['total_time'], inner['self_time'])
+
+    def test_bytes_nested(self):
+        renderer = utils.Renderer(check_mtimes=False, instrument=True, bytes_output=True)
+        self._write_template(renderer, 'TestStats/bytes_sub', '{% template %}sub', 0)
+        self.assertEqual(self.render("{% template %}<{{ !render('TestStats/bytes_sub') }}>", _renderer=renderer,
+                                     _method='render_bytes'), '<sub>')
+        name = 'TestStats/test_bytes_nested_%d' % utils.TestCase._template_num
+        stats = renderer.stats()
+        self.assertEqual(stats[name]['renders'], 1)
+        self.assertEqual(stats[name]['output_size'], 5)
+        self.assertEqual(stats['TestStats/bytes_sub']['renders'], 1)
+        self.assertTrue(stats[name]['self_time'] <= stats[name]['total_time'] - stats['TestStats/bytes_sub']['total_time'] + 0.001)
+
+    def test_cache_dir_not_compile(self):
+        cache_dir = os.path.join(os.path.dirname(__file__), 'symplouts_cache')
+        renderer = utils.Renderer(cache_dir=cache_dir, instrument=True)
+        self.render('{% template %}cached', _renderer=renderer)
+        name = 'TestStats/test_cache_dir_not_compile_%d' % utils.TestCase._template_num
+        self.assertEqual(renderer.stats()[name]['compiles'], 1)
+        renderer = utils.Renderer(cache_dir=cache_dir, instrument=True)
+        self.assertEqual(renderer.render(name), 'cached')
+        self.assertEqual(renderer.stats()[name]['compiles'], 0)
+        self.assertEqual(renderer.stats()[name]['compile_time'], 0)
+
+    def test_prometheus(self):
+        renderer = utils.Renderer(check_mtimes=False, instrument=True)
+        self.render('{% template %}prom', _renderer=renderer)
+        name = 'TestStats/test_prometheus_%d' % utils.TestCase._template_num
+        text = renderer.prometheus_stats()
+        self.assertTrue('# TYPE symplate_renders_total counter\n' in text)
+        self.assertTrue('symplate_renders_total{template="%s"} 1\n' % name in text)
+        self.assertTrue('symplate_output_size_total{template="%s"} 4\n' % name in text)
+        self.assertTrue('# TYPE symplate_render_seconds histogram\n' in text)
+        self.assertTrue('symplate_render_seconds_bucket{template="%s",le="+Inf"} 1\n' % name in text)
+        self.assertTrue('symplate_render_seconds_count{template="%s"} 1\n' % name in text)
+        self.assertTrue(text.endswith('\n'))
+
+        renderer.reset_stats()
+        renderer._record_render('a"b\\c', 0.001, 0.001, 1, True)
+        self.assertTrue('{template="a\\"b\\\\c"} 1\n' in renderer.prometheus_stats('x'))
+
+if __name__ == '__main__':
+    unittest.main()
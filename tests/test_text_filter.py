@@ -2,7 +2,7 @@
 
 import unittest
 
-from symplate import text_filter
+from symplate import text_filter, Markup
 
 class TestTextFilter(unittest.TestCase):
     def test_str(self):
@@ -20,6 +20,18 @@ class TestTextFilter(unittest.TestCase):
         self.assertEqual(text_filter(1234), u'1234')
         self.assertEqual(text_filter(['<']), u"['<']")
 
+    def test_markup(self):
+        markup = Markup(u'<b>&amp;</b>')
+        self.assertTrue(text_filter(markup) is markup)
+
+    def test_html_method(self):
+        class Safe(object):
+            def __html__(self):
+                return u'<i>safe</i>'
+            def __unicode__(self):
+                return u'unsafe'
+        self.assertEqual(text_filter(Safe()), u'<i>safe</i>')
+
     def test_none(self):
         self.assertEqual(text_filter(None), u'')
 
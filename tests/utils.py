@@ -49,6 +49,7 @@ class TestCase(unittest.TestCase):
         _renderer = kwargs.pop('_renderer', renderer)
         _increment = kwargs.pop('_increment', 1)
         _adjust_mtime = kwargs.pop('_adjust_mtime', 0)
+        _method = kwargs.pop('_method', 'render')
 
         TestCase._template_num += _increment
         try:
@@ -64,7 +65,7 @@ class TestCase(unittest.TestCase):
                                 name, TestCase._template_num)
         self._write_template(_renderer, name, template, _adjust_mtime)
 
-        return _renderer.render(name, *args, **kwargs)
+        return getattr(_renderer, _method)(name, *args, **kwargs)
 
     def assertTemplateError(self, line_num, line_contains, func, *args, **kwargs):
         """Ensure func(*args, **kwargs) raises symplate.Error, with given 